@@ -0,0 +1,280 @@
+"""
+Operation counters shared by the linked_lists and dijkstra packages.
+
+instrument() switches an instance to a subclass, built once per class,
+whose counted methods record their calls, the nodes or edges they visit
+and their wall time into a Metrics. What a class counts is described by
+a Profile, each package keeps the profiles of its own classes. Like the
+fast mode variants of modes, the subclass remembers the class it wraps
+as _plain_class, and modes.set_checked rebuilds it on top of the other
+mode. Instances that are not instrumented run the plain methods and pay
+nothing. Instrumented instances pickle as plain ones, without their
+counters. Not thread safe: updates of a shared Metrics from several
+threads may be lost.
+"""
+from typing import Any, Callable, Dict, Optional, Tuple
+from functools import wraps
+from time import perf_counter
+
+import modes
+
+# attributes instrument() gives an instance, left out when it is pickled
+_COUNTER_STATE = ('_metrics', '_metrics_name', '_visited')
+
+
+class OperationStats(object):
+    __slots__ = ('calls', 'visited', 'seconds')
+
+    def __init__(self):
+        self.calls = 0
+        self.visited = 0
+        self.seconds = 0.0
+
+
+class Metrics(object):
+    """
+    Counters of instrumented instances. Subclasses name their export
+    through prefix and visited_series.
+
+    Attributes:
+        operations (Dict[Tuple[str, str], OperationStats]): Counters per
+            (structure, operation).
+    """
+
+    # default prefix of the Prometheus metric names
+    prefix = 'counters'
+    # (metric name, help text) of the visited series
+    visited_series = ('visited_total', 'Nodes or edges visited per structure and operation.')
+
+    def __init__(self):
+        self.operations: Dict[Tuple[str, str], OperationStats] = {}
+
+    def record(self, structure: str, operation: str, visited: int, seconds: float):
+        """
+        Adds one call to the counters of an operation.
+
+        :param structure: Name the instance was instrumented under.
+        :type structure: str
+        :param operation: Method name.
+        :type operation: str
+        :param visited: Nodes or edges the call visited.
+        :type visited: int
+        :param seconds: Wall time of the call.
+        :type seconds: float
+        """
+
+        stats = self.operations.get((structure, operation))
+        if stats is None:
+            stats = self.operations[(structure, operation)] = OperationStats()
+        stats.calls += 1
+        stats.visited += visited
+        stats.seconds += seconds
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Returns a copy of the counters as
+        {structure: {operation: {'calls': ..., 'visited': ..., 'seconds': ...}}}.
+
+        :rtype: Dict[str, Dict[str, Dict[str, float]]]
+        """
+
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (structure, operation), stats in sorted(self.operations.items()):
+            result.setdefault(structure, {})[operation] = {
+                'calls': stats.calls, 'visited': stats.visited, 'seconds': stats.seconds
+            }
+        return result
+
+    def prometheus(self, prefix: Optional[str] = None) -> str:
+        """
+        Returns the counters in the Prometheus text exposition format.
+
+        :param prefix: Prefix of the metric names, the class prefix when None.
+        :type prefix: Optional[str]
+        :rtype: str
+        """
+
+        if prefix is None:
+            prefix = self.prefix
+
+        series = (
+            ('calls_total', 'calls', 'Calls per structure and operation.'),
+            (self.visited_series[0], 'visited', self.visited_series[1]),
+            ('seconds_total', 'seconds', 'Wall time spent per structure and operation.'),
+        )
+        lines = []
+        for metric, field, description in series:
+            name = f'{prefix}_{metric}'
+            lines.append(f'# HELP {name} {description}')
+            lines.append(f'# TYPE {name} counter')
+            for (structure, operation), stats in sorted(self.operations.items()):
+                labels = f'structure="{_escape(structure)}",operation="{_escape(operation)}"'
+                lines.append(f'{name}{{{labels}}} {getattr(stats, field)}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        self.operations.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Profile(object):
+    """
+    What to count on one class: the instrumented methods, the cost of the
+    ones that walk the whole structure, computed up front from their
+    arguments, the replacements of the inner helpers that walk, and a hook
+    called with every variant built from the profile.
+    """
+
+    __slots__ = ('operations', 'costs', 'walks', 'created')
+
+    def __init__(self, operations: Tuple[str, ...], costs: Dict[str, Callable[..., int]],
+                 walks: Optional[Callable[[type], Dict[str, Callable[..., Any]]]] = None,
+                 created: Optional[Callable[[type], None]] = None):
+        self.operations = operations
+        self.costs = costs
+        self.walks = walks
+        self.created = created
+
+
+def _counted(operation: str, method: Callable[..., Any], cost: Optional[Callable[..., int]]) -> Callable[..., Any]:
+    # updated=() keeps the __validator__ mark of the wrapped method off the counter
+    @wraps(method, updated=())
+    def counted(self, *args, **kwargs) -> Any:
+        visited = self._visited
+        if cost is not None:
+            self._visited += cost(self, *args)
+        start = perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            self._metrics.record(self._metrics_name, operation, self._visited - visited, elapsed)
+    return counted
+
+
+def instrumented(cls: type, profile: Profile) -> type:
+    """
+    Returns a subclass of cls counting the operations of profile, created
+    once per class. Works for the checked and the unchecked variant of a
+    class alike.
+
+    :param cls: Class to instrument, not instrumented itself.
+    :type cls: type
+    :param profile: What to count on cls.
+    :type profile: Profile
+    :rtype: type
+    """
+
+    variant = cls.__dict__.get('_instrumented_class')
+    if variant is not None:
+        return variant
+
+    namespace: Dict[str, Any] = {
+        '_plain_class': cls, '__module__': cls.__module__,
+        # lets modes.set_checked instrument the class of the other mode
+        '_wrap_class': staticmethod(lambda plain: instrumented(plain, profile)),
+        '__reduce_ex__': _reduce_instrumented,
+    }
+    if '_checked_class' in cls.__dict__:
+        # keeps modes.is_checked answering for the unchecked variant
+        namespace['_checked_class'] = cls.__dict__['_checked_class']
+    if profile.walks is not None:
+        namespace.update(profile.walks(cls))
+    for operation in profile.operations:
+        method = namespace.get(operation) or getattr(cls, operation)
+        namespace[operation] = _counted(operation, method, profile.costs.get(operation))
+
+    variant = type(cls.__name__, (cls,), namespace)
+    variant.__qualname__ = f'{cls.__qualname__}[instrumented]'
+    variant._instrumented_class = variant
+    cls._instrumented_class = variant
+    if profile.created is not None:
+        profile.created(variant)
+    return variant
+
+
+def _reduce_instrumented(instance: Any, protocol: int) -> tuple:
+    # pickled through the class it wraps, in the same mode, without the counters
+    state = {name: value for name, value in vars(instance).items() if name not in _COUNTER_STATE}
+    plain = type(instance)._plain_class
+    if not modes.is_checked(instance):
+        return modes.load_unchecked, (plain._checked_class,), state
+    return _load_plain, (plain,), state
+
+
+def _load_plain(cls: type) -> Any:
+    # empty checked instance for pickle to fill in
+    return cls.__new__(cls)
+
+
+def instrument(instance: Any, profile: Profile, metrics: Optional[Metrics] = None,
+               name: Optional[str] = None, metrics_class: type = Metrics) -> Metrics:
+    """
+    Starts counting the operations of an instance.
+
+    :param instance: Instance to observe.
+    :type instance: Any
+    :param profile: What to count on its class.
+    :type profile: Profile
+    :param metrics: Counters to add to, a new metrics_class when None and
+        the instance is not instrumented yet.
+    :type metrics: Optional[Metrics]
+    :param name: Structure name in the counters, the class name when None.
+    :type name: Optional[str]
+    :param metrics_class: Metrics subclass created when metrics is None.
+    :type metrics_class: type
+    :return: The counters of the instance.
+    :rtype: Metrics
+    """
+
+    plain = type(instance).__dict__.get('_plain_class', type(instance))
+    variant = instrumented(plain, profile)
+
+    if metrics is None:
+        metrics = getattr(instance, '_metrics', None) or metrics_class()
+    if name is None:
+        name = modes.base_class(instance).__name__
+
+    instance._metrics = metrics
+    instance._metrics_name = name
+    instance._visited = 0
+    instance.__class__ = variant
+    return metrics
+
+
+def uninstrument(instance: Any):
+    """
+    Switches an instance back to the plain methods. Its counters stay in
+    the Metrics it recorded to.
+
+    :param instance: Instrumented instance.
+    :type instance: Any
+    """
+
+    plain = type(instance).__dict__.get('_plain_class')
+    if plain is None:
+        return
+
+    instance.__class__ = plain
+    del instance._metrics, instance._metrics_name, instance._visited
+
+
+def is_instrumented(instance: Any) -> bool:
+    """
+    Checks if an instance counts its operations.
+
+    :rtype: bool
+    """
+    return '_plain_class' in type(instance).__dict__
+
+
+def metrics_of(instance: Any) -> Optional[Metrics]:
+    """
+    Returns the counters of an instrumented instance, None otherwise.
+
+    :rtype: Optional[Metrics]
+    """
+    return instance._metrics if is_instrumented(instance) else None
@@ -1,26 +1,80 @@
-from typing import TypeVar, Optional, Dict, Generic, List, Tuple
+from typing import TypeVar, Optional, Dict, Generic, List, Tuple, Iterable, Iterator, Callable
 import utils
+from csr import CompressedGraph
+import binary_format
 
 T = TypeVar('T')
 
+# what add_edge does with an edge whose source and destination already have one
+KEEP = 'keep'          # store a parallel edge
+MIN = 'min'            # keep the smaller weight
+REPLACE = 'replace'    # overwrite the weight
+DUPLICATE_POLICIES = (KEEP, MIN, REPLACE)
+
+# edge events passed to listeners as listener(event, source, destination, weight)
+ADDED = 'added'            # new edge, parallel ones included
+DECREASED = 'decreased'    # weight lowered or set to the same value
+INCREASED = 'increased'    # weight raised
+REMOVED = 'removed'        # edge removed, weight is the removed one
+
+Listener = Callable[[str, T, T, int], None]
+
 class AdjacencyList(Generic[T]):
     """
      Class represents an AdjacencyList
     :param Generic[T]:
     """
 
-    def __init__(self, nodes: Optional[List[T]] = None):
+    def __init__(self, nodes: Optional[List[T]] = None, checked: Optional[bool] = None,
+                 duplicates: str = KEEP, edge_index: bool = False, reverse_index: bool = False):
         """
          initializes AdjacencyList
         :param node:
         :type Optional[T]:
+        :param checked: validate arguments (checked mode) or bind the
+            undecorated methods (fast mode), modes.checked_mode when None.
+        :type checked: Optional[bool]
+        :param duplicates: KEEP, MIN or REPLACE, see DUPLICATE_POLICIES.
+        :type duplicates: str
+        :param edge_index: keep a source -> destination -> position index
+            for O(1) has_edge/update_weight/remove_edge. Needs MIN or REPLACE
+            so that every destination has at most one edge per source.
+        :type edge_index: bool
+        :param reverse_index: keep destination -> source edge counts for
+            O(1) in_degree and a live predecessors view, see
+            enable_reverse_index.
+        :type reverse_index: bool
         """
-        self.list_nodes: List[T] = list(nodes) if nodes else []
+        utils.set_checked(self, checked)
+
+        if duplicates not in DUPLICATE_POLICIES:
+            raise utils.AdjacencyError(f'Unknown duplicate policy {duplicates}.')
+        if edge_index and duplicates == KEEP:
+            raise utils.AdjacencyError('Edge index requires the min or replace duplicate policy.')
+
+        self.duplicates: str = duplicates
+
+        # dict.fromkeys drops repeated nodes while keeping their order
+        self.list_nodes: List[T] = list(dict.fromkeys(nodes)) if nodes else []
 
         self.adjacency_dict: Dict[T, List[Tuple[T, int]]] = {
             node: [] for node in self.list_nodes
         }
 
+        self._edge_index: Optional[Dict[T, Dict[T, int]]] = {
+            node: {} for node in self.list_nodes
+        } if edge_index else None
+
+        # bumped by every change, lets caches detect a stale graph
+        self.version: int = 0
+
+        self._listeners: List[Listener] = []
+
+        self._predecessors: Optional[Dict[T, Dict[T, int]]] = None
+        self._in_degree: Optional[Dict[T, int]] = None
+        if reverse_index:
+            self.enable_reverse_index()
+
     @utils.require_non_null
     def append_node(self, node: Optional[T]):
         """
@@ -29,9 +83,30 @@ class AdjacencyList(Generic[T]):
         :param node: new node object
         :type node: Optional[T]
         """
-        if node not in self.list_nodes:
+        if node not in self.adjacency_dict:
             self.list_nodes.append(node)
             self.adjacency_dict[node] = []
+            self.version += 1
+
+            if self._edge_index is not None:
+                self._edge_index[node] = {}
+
+    def __contains__(self, node: T) -> bool:
+        return node in self.adjacency_dict
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.adjacency_dict)
+
+    def __len__(self) -> int:
+        return len(self.adjacency_dict)
+
+    def edge_count(self) -> int:
+        """
+         Returns the number of stored edges, parallel edges included. O(V).
+
+        :rtype: int
+        """
+        return sum(len(neighbors) for neighbors in self.adjacency_dict.values())
 
     def __repr__(self):
         return str(self.adjacency_dict)
@@ -52,7 +127,126 @@ class AdjacencyList(Generic[T]):
         """
         self.append_node(source)
         self.append_node(destination)
-        self.adjacency_dict[source].append((destination, weight))
+
+        if self.duplicates == KEEP:
+            self.adjacency_dict[source].append((destination, weight))
+            event = ADDED
+        else:
+            event = self._insert_unique(source, destination, weight)
+        self.version += 1
+
+        if event is not None and self._listeners:
+            self._notify(event, source, destination, weight)
+
+    def add_edges(self, edges: Iterable[Tuple[T, T, int]]) -> int:
+        """
+         Adds many edges at once. Nodes are only passed through append_node
+         when they are new, known ones skip the per-call validation.
+
+        :param edges: (source, destination, weight) triples.
+        :type edges: Iterable[Tuple[T, T, int]]
+        :returns: number of edges processed.
+        :rtype: int
+        """
+        adjacency = self.adjacency_dict
+        append_node = self.append_node
+        keep = self.duplicates == KEEP
+        listeners = self._listeners
+        count = 0
+        event: Optional[str] = ADDED
+
+        try:
+            for source, destination, weight in edges:
+                if source not in adjacency:
+                    append_node(source)
+                if destination not in adjacency:
+                    append_node(destination)
+
+                if keep:
+                    adjacency[source].append((destination, weight))
+                else:
+                    event = self._insert_unique(source, destination, weight)
+                count += 1
+
+                if listeners and event is not None:
+                    self._notify(event, source, destination, weight)
+        finally:
+            # one bump per batch, also when it stops partway with edges stored
+            if count:
+                self.version += 1
+        return count
+
+    def has_edge(self, source: T, destination: T) -> bool:
+        """
+         Checks if an edge from source to destination exists.
+
+        :param source: starting point A
+        :type source: T
+        :param destination: destination point B
+        :type destination: T
+        :rtype: bool
+        """
+        return self._find_edge(source, destination) is not None
+
+    def update_weight(self, source: T, destination: T, weight: int):
+        """
+         Sets the weight of an existing edge, the first one of parallel edges.
+
+        :param source: starting point A
+        :type source: T
+        :param destination: destination point B
+        :type destination: T
+        :param weight: new weight.
+        :type weight: int
+        :raises AdjacencyError: if the edge does not exist.
+        """
+        position = self._find_edge(source, destination)
+        if position is None:
+            raise utils.AdjacencyError(f'Edge {source} -> {destination} does not exist.')
+
+        neighbors = self.adjacency_dict[source]
+        previous = neighbors[position][1]
+        neighbors[position] = (destination, weight)
+        self.version += 1
+
+        if self._listeners:
+            self._notify(DECREASED if weight <= previous else INCREASED, source, destination, weight)
+
+    def remove_edge(self, source: T, destination: T) -> int:
+        """
+         Removes an edge, the first one of parallel edges. The last edge of
+         source takes its slot, so the neighbor order is not preserved.
+
+        :param source: starting point A
+        :type source: T
+        :param destination: destination point B
+        :type destination: T
+        :returns: weight of the removed edge.
+        :rtype: int
+        :raises AdjacencyError: if the edge does not exist.
+        """
+        position = self._find_edge(source, destination)
+        if position is None:
+            raise utils.AdjacencyError(f'Edge {source} -> {destination} does not exist.')
+
+        neighbors = self.adjacency_dict[source]
+        removed = neighbors[position]
+        self.version += 1
+        last = neighbors.pop()
+
+        if position < len(neighbors):
+            neighbors[position] = last
+
+        if self._edge_index is not None:
+            index = self._edge_index[source]
+            del index[destination]
+            if position < len(neighbors):
+                index[last[0]] = position
+
+        if self._listeners:
+            self._notify(REMOVED, source, destination, removed[1])
+
+        return removed[1]
 
     def get_edge(self, node: T) -> List[Tuple[T, int]]:
         """
@@ -64,6 +258,207 @@ class AdjacencyList(Generic[T]):
         """
         return self.adjacency_dict.get(node, [])
 
+    def enable_reverse_index(self):
+        """
+         Builds the reverse index from the current edges and keeps it up to
+         date from then on through a listener.
+        """
+        if self._predecessors is not None:
+            return
+
+        self._predecessors, self._in_degree = {}, {}
+        for source, neighbors in self.adjacency_dict.items():
+            for destination, _ in neighbors:
+                self._track_reverse(ADDED, source, destination, 0)
+        self.add_listener(self._track_reverse)
+
+    def predecessors(self, node: T) -> Iterable[T]:
+        """
+         Gets the distinct sources of the edges into node, a live keys view
+         with the reverse index, otherwise a list built by scanning every edge.
+         The view of a node added later does not follow it, ask again.
+
+        :param node:
+        :type node: T
+        :rtype: Iterable[T]
+        """
+        if self._predecessors is not None:
+            if node not in self.adjacency_dict:
+                return {}.keys()
+            # an entry of its own, so the view sees the node's first in-edge
+            return self._predecessors.setdefault(node, {}).keys()
+
+        return [
+            source for source, neighbors in self.adjacency_dict.items()
+            if any(destination == node for destination, _ in neighbors)
+        ]
+
+    def in_degree(self, node: T) -> int:
+        """
+         Counts the edges into node, parallel edges included. O(1) with the
+         reverse index, O(V + E) without.
+
+        :rtype: int
+        """
+        if self._in_degree is not None:
+            return self._in_degree.get(node, 0)
+
+        return sum(
+            1 for neighbors in self.adjacency_dict.values()
+            for destination, _ in neighbors if destination == node
+        )
+
+    def out_degree(self, node: T) -> int:
+        """
+         Counts the edges out of node, parallel edges included.
+
+        :rtype: int
+        """
+        return len(self.adjacency_dict.get(node, ()))
+
+    def _track_reverse(self, event: str, source: T, destination: T, weight: int):
+        """
+         Listener maintaining the reverse index, weight changes leave it as is.
+        """
+        if event == ADDED:
+            sources = self._predecessors.setdefault(destination, {})
+            sources[source] = sources.get(source, 0) + 1
+            self._in_degree[destination] = self._in_degree.get(destination, 0) + 1
+        elif event == REMOVED:
+            sources = self._predecessors[destination]
+            if sources[source] == 1:
+                del sources[source]
+            else:
+                sources[source] -= 1
+            self._in_degree[destination] -= 1
+
+    def add_listener(self, listener: Listener):
+        """
+         Registers a callback called as listener(event, source, destination,
+         weight) after every edge change, event being ADDED, DECREASED,
+         INCREASED or REMOVED. add_edge calls that leave the graph as it was
+         (a heavier duplicate under MIN) are not reported.
+
+        :param listener: callback to register.
+        :type listener: Callable[[str, T, T, int], None]
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener):
+        """
+         Unregisters a callback added with add_listener.
+
+        :param listener: registered callback.
+        :type listener: Callable[[str, T, T, int], None]
+        :raises AdjacencyError: if the callback is not registered.
+        """
+        if listener not in self._listeners:
+            raise utils.AdjacencyError('Listener is not registered.')
+        self._listeners.remove(listener)
+
+    def _notify(self, event: str, source: T, destination: T, weight: int):
+        for listener in list(self._listeners):
+            listener(event, source, destination, weight)
+
+    def _insert_unique(self, source: T, destination: T, weight: int) -> Optional[str]:
+        """
+         Adds an edge between existing nodes under the MIN or REPLACE policy.
+
+        :returns: the event to report, None if nothing changed.
+        :rtype: Optional[str]
+        """
+        neighbors = self.adjacency_dict[source]
+        position = self._find_edge(source, destination)
+
+        if position is None:
+            if self._edge_index is not None:
+                self._edge_index[source][destination] = len(neighbors)
+            neighbors.append((destination, weight))
+            return ADDED
+
+        previous = neighbors[position][1]
+        if weight < previous or (self.duplicates == REPLACE and weight == previous):
+            neighbors[position] = (destination, weight)
+            return DECREASED
+        if self.duplicates == REPLACE:
+            neighbors[position] = (destination, weight)
+            return INCREASED
+        return None
+
+    def _find_edge(self, source: T, destination: T) -> Optional[int]:
+        """
+         Returns the position of the first source -> destination edge in the
+         neighbor list of source, through the edge index when there is one.
+
+        :rtype: Optional[int]
+        """
+        if self._edge_index is not None:
+            index = self._edge_index.get(source)
+            return index.get(destination) if index is not None else None
+
+        for position, (neighbor, _) in enumerate(self.adjacency_dict.get(source, ())):
+            if neighbor == destination:
+                return position
+        return None
+
+    def reverse(self) -> 'AdjacencyList[T]':
+        """
+         Builds a new graph with the same nodes, mode, duplicate policy and
+         edge index setting, and every edge flipped.
+
+        :rtype: AdjacencyList[T]
+        """
+        reversed_graph = AdjacencyList(self.list_nodes, checked=utils.is_checked(self),
+                                       duplicates=self.duplicates,
+                                       edge_index=self._edge_index is not None)
+        reversed_graph.add_edges(
+            (destination, source, weight)
+            for source, neighbors in self.adjacency_dict.items()
+            for destination, weight in neighbors
+        )
+        return reversed_graph
+
+    def freeze(self) -> CompressedGraph[T]:
+        """
+         Compiles the graph into an immutable CSR snapshot.
+
+         Later changes to this list are not reflected in the snapshot.
+
+        :rtype: CompressedGraph[T]
+        """
+        return CompressedGraph.from_adjacency(self.adjacency_dict)
+
+    def to_csr(self) -> CompressedGraph[T]:
+        """
+         Alias of freeze().
+
+        :rtype: CompressedGraph[T]
+        """
+        return self.freeze()
+
+    def save(self, path: str):
+        """
+         Writes a frozen snapshot of the graph in the binary graph format.
+
+        :param path: destination file.
+        :type path: str
+        :raises AdjacencyError: if labels are neither all ints nor all strings.
+        """
+        binary_format.save(self.freeze(), path)
+
+    @staticmethod
+    def open(path: str) -> CompressedGraph:
+        """
+         Maps a file written by save() as a read-only snapshot whose neighbor
+         buffers are read straight from the mapped pages. close() it or use
+         it in a with block to unmap the file.
+
+        :param path: file written by save().
+        :type path: str
+        :rtype: CompressedGraph
+        """
+        return binary_format.open_graph(path)
+
     def draw_adjacency_list(self):
         """
          Draws an adjacency list.
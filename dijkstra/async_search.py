@@ -0,0 +1,197 @@
+"""
+ Cooperative versions of dijkstra() and shortest_path() for asyncio code.
+
+ The search gives the event loop a turn every yield_every settled nodes.
+ A timeout ends it early with the settled part of the result marked
+ incomplete, cancelling the awaiting task stops it. Graphs with at least
+ offload_above edges are searched in an executor thread instead, which
+ keeps the loop free entirely and honours the same timeout and
+ cancellation.
+"""
+from typing import TypeVar, Optional, Dict, List, NamedTuple, Iterator, Any
+from concurrent.futures import Executor
+from itertools import count
+import asyncio
+import heapq
+import threading
+
+from dijkstra import Graph, INFINITY, neighbors_of, reconstruct_path
+import utils
+
+T = TypeVar('T')
+
+# settled nodes between two turns of the event loop
+YIELD_EVERY = 1024
+
+
+class SearchResult(NamedTuple):
+    """
+     Distances and predecessors of the settled nodes. complete is False
+     when the timeout ended the search first.
+    """
+    distances: Dict[Any, int]
+    predecessors: Dict[Any, Optional[Any]]
+    complete: bool
+
+
+class PartialPath(NamedTuple):
+    """
+     Answer of shortest_path_async. An incomplete answer carries the best
+     path found so far, an upper bound, or (inf, []) if target was not
+     reached yet.
+    """
+    distance: float
+    path: List[Any]
+    complete: bool
+
+
+class _SearchState(object):
+    __slots__ = ('best', 'parents', 'distances', 'predecessors')
+
+    def __init__(self, source: Any):
+        # tentative values of every reached node, final ones of settled nodes
+        self.best: Dict[Any, int] = {source: 0}
+        self.parents: Dict[Any, Optional[Any]] = {source: None}
+        self.distances: Dict[Any, int] = {}
+        self.predecessors: Dict[Any, Optional[Any]] = {}
+
+
+def _settle(graph: Graph, state: _SearchState, source: T, target: Optional[T],
+            yield_every: int) -> Iterator[None]:
+    """
+     The loop of dijkstra() as a generator that fills state and pauses
+     every yield_every settled nodes.
+    """
+    neighbors = neighbors_of(graph)
+    best, parents = state.best, state.parents
+    distances, predecessors = state.distances, state.predecessors
+
+    tie = count()
+    heap = [(0, next(tie), source)]
+    budget = yield_every
+
+    while heap:
+        distance, _, node = heapq.heappop(heap)
+
+        if node in distances:
+            continue
+
+        distances[node] = distance
+        predecessors[node] = parents[node]
+
+        if node == target:
+            return
+
+        for neighbor, weight in neighbors(node):
+            if weight < 0:
+                raise utils.AdjacencyError(f'Negative weight {weight} on edge {node} -> {neighbor}.')
+
+            candidate = distance + weight
+            if candidate < best.get(neighbor, INFINITY):
+                best[neighbor] = candidate
+                parents[neighbor] = node
+                heapq.heappush(heap, (candidate, next(tie), neighbor))
+
+        budget -= 1
+        if not budget:
+            budget = yield_every
+            yield
+
+
+async def _drive(steps: Iterator[None], timeout: Optional[float], offload: bool,
+                 executor: Optional[Executor]) -> bool:
+    """
+     Runs steps until exhausted or past the timeout, on the loop or in
+     executor. Returns whether it finished.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+
+    if not offload:
+        for _ in steps:
+            if deadline is not None and loop.time() >= deadline:
+                return False
+            await asyncio.sleep(0)
+        return True
+
+    stop = threading.Event()
+
+    def run() -> bool:
+        for _ in steps:
+            if stop.is_set() or (deadline is not None and loop.time() >= deadline):
+                return False
+        return True
+
+    try:
+        return await loop.run_in_executor(executor, run)
+    except asyncio.CancelledError:
+        # the thread cannot be interrupted, it stops at its next pause
+        stop.set()
+        raise
+
+
+async def dijkstra_async(graph: Graph, source: T, target: Optional[T] = None,
+                         yield_every: int = YIELD_EVERY, timeout: Optional[float] = None,
+                         offload_above: Optional[int] = None,
+                         executor: Optional[Executor] = None) -> SearchResult:
+    """
+     dijkstra() that cooperates with the event loop.
+
+    :param graph: weighted graph or its frozen snapshot, must not change
+        while the search runs.
+    :type graph: Union[AdjacencyList[T], CompressedGraph[T]]
+    :param source: starting point of the search.
+    :type source: T
+    :param target: optional node to stop at once its distance is final.
+    :type target: Optional[T]
+    :param yield_every: settled nodes between two turns of the loop.
+    :type yield_every: int
+    :param timeout: seconds after which the settled part is returned.
+    :type timeout: Optional[float]
+    :param offload_above: edge count from which the search runs in
+        executor, None to always run on the loop. Edges, as in the
+        linked_lists AsyncTraversal functions, since they measure the work.
+    :type offload_above: Optional[int]
+    :param executor: executor for offloaded searches, the loop default when None.
+    :type executor: Optional[Executor]
+    :rtype: SearchResult
+    :raises AdjacencyError: if source is unknown or a negative weight is met.
+    """
+    if source not in graph:
+        raise utils.AdjacencyError(f'Source node {source} does not exist.')
+    if yield_every <= 0:
+        raise utils.AdjacencyError(f'yield_every must be positive, got {yield_every}.')
+
+    state = _SearchState(source)
+    offload = offload_above is not None and graph.edge_count() >= offload_above
+    complete = await _drive(_settle(graph, state, source, target, yield_every), timeout, offload, executor)
+
+    return SearchResult(state.distances, state.predecessors, complete)
+
+
+async def shortest_path_async(graph: Graph, source: T, target: T,
+                              yield_every: int = YIELD_EVERY, timeout: Optional[float] = None,
+                              offload_above: Optional[int] = None,
+                              executor: Optional[Executor] = None) -> PartialPath:
+    """
+     shortest_path() that cooperates with the event loop, see dijkstra_async
+     for the parameters. Past the timeout the best path found so far is
+     returned, every relaxation starts from a settled node so its
+     predecessor chain is always valid.
+
+    :rtype: PartialPath
+    """
+    if source not in graph:
+        raise utils.AdjacencyError(f'Source node {source} does not exist.')
+    if yield_every <= 0:
+        raise utils.AdjacencyError(f'yield_every must be positive, got {yield_every}.')
+
+    state = _SearchState(source)
+    offload = offload_above is not None and graph.edge_count() >= offload_above
+    complete = await _drive(_settle(graph, state, source, target, yield_every), timeout, offload, executor)
+
+    if target in state.distances:
+        return PartialPath(state.distances[target], reconstruct_path(state.predecessors, target), True)
+    if not complete and target in state.best:
+        return PartialPath(state.best[target], reconstruct_path(state.parents, target), False)
+    return PartialPath(INFINITY, [], complete)
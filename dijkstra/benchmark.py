@@ -0,0 +1,148 @@
+"""
+ Benchmarks for the dijkstra package.
+
+ Usage: python benchmark.py [vertices:edges ...]
+        python benchmark.py validation
+        python benchmark.py snapshot
+"""
+from typing import Callable, List, Tuple
+import math
+import random
+import sys
+import threading
+import time
+
+from adjacency_list import AdjacencyList
+from snapshot import SnapshotGraph
+from dijkstra import dijkstra, shortest_path
+
+DEFAULT_SIZES: List[Tuple[int, int]] = [
+    (12_500, 50_000),
+    (50_000, 200_000),
+    (200_000, 800_000),
+    (500_000, 2_000_000),
+]
+
+
+def random_graph(vertices: int, edges: int, seed: int = 0) -> AdjacencyList[int]:
+    """
+     Builds a random weighted graph with a spanning path so that every
+     vertex is reachable from 0.
+    """
+    rng = random.Random(seed)
+    graph = AdjacencyList(range(vertices))
+    adjacency = graph.adjacency_dict
+
+    # filled directly, graph construction is not what is being measured
+    for node in range(vertices - 1):
+        adjacency[node].append((node + 1, rng.randint(1, 100)))
+
+    for _ in range(edges - (vertices - 1)):
+        adjacency[rng.randrange(vertices)].append((rng.randrange(vertices), rng.randint(1, 100)))
+
+    return graph
+
+
+def bench_scaling(sizes: List[Tuple[int, int]]):
+    """
+     Times a full single source search per size. The ns column divides the
+     run time by (V + E) log2 V and should stay roughly flat as sizes grow.
+     The csr column times the same search on the frozen snapshot.
+    """
+    print(f'{"vertices":>10} {"edges":>10} {"seconds":>9} {"ns/((V+E)logV)":>15} {"csr":>9}')
+
+    for vertices, edges in sizes:
+        graph = random_graph(vertices, edges)
+
+        start = time.perf_counter()
+        dijkstra(graph, 0)
+        elapsed = time.perf_counter() - start
+
+        frozen = graph.freeze()
+        start = time.perf_counter()
+        dijkstra(frozen, 0)
+        frozen_elapsed = time.perf_counter() - start
+
+        normalized = elapsed / ((vertices + edges) * math.log2(vertices)) * 1e9
+        print(f'{vertices:>10} {edges:>10} {elapsed:>9.3f} {normalized:>15.2f} {frozen_elapsed:>9.3f}')
+
+
+def bench_validation(calls: int = 200_000):
+    """
+     Measures the per-call cost of utils.require_non_null on add_edge, which
+     validates through two append_node calls, in checked and in fast mode.
+    """
+    print(f'{"operation":<10} {"checked ns":>11} {"fast ns":>9} {"saved":>7}')
+
+    timings = []
+    for checked in (True, False):
+        # few vertices, so the node list scan does not hide the wrapper cost
+        graph = AdjacencyList(range(4), checked=checked)
+        add_edge = graph.add_edge
+
+        start = time.perf_counter()
+        for i in range(calls):
+            add_edge(i & 3, 0, i)
+        timings.append((time.perf_counter() - start) / calls * 1e9)
+
+    checked_ns, fast_ns = timings
+    print(f'{"add_edge":<10} {checked_ns:>11.1f} {fast_ns:>9.1f} {1 - fast_ns / checked_ns:>7.0%}')
+
+
+def bench_snapshot(vertices: int = 2_000, edges: int = 8_000, threads: int = 4,
+                   operations: int = 100, batch: int = 50):
+    """
+     Stress test of concurrent shortest path queries and edge batches. Each
+     thread runs operations steps, a step being a batch of edges with the
+     given probability and a query otherwise. SnapshotGraph readers never
+     wait for writers, the global lock baseline holds one lock per step.
+    """
+    def run(step: Callable[[random.Random, bool], None], write_ratio: float) -> float:
+        def worker(seed: int):
+            rng = random.Random(seed)
+            for _ in range(operations):
+                step(rng, rng.random() < write_ratio)
+
+        workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+        start = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        return threads * operations / (time.perf_counter() - start)
+
+    def new_edges(rng: random.Random) -> List[Tuple[int, int, int]]:
+        return [(rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 100)) for _ in range(batch)]
+
+    print(f'{threads} threads, {vertices} vertices, batches of {batch} edges')
+    print(f'{"write ratio":>11} {"locked ops/s":>13} {"snapshot ops/s":>15}')
+
+    for write_ratio in (0.0, 0.01, 0.1):
+        locked_graph, lock = random_graph(vertices, edges), threading.Lock()
+
+        def locked_step(rng: random.Random, write: bool):
+            with lock:
+                if write:
+                    locked_graph.add_edges(new_edges(rng))
+                else:
+                    shortest_path(locked_graph, rng.randrange(vertices), rng.randrange(vertices))
+
+        published = SnapshotGraph(random_graph(vertices, edges))
+
+        def snapshot_step(rng: random.Random, write: bool):
+            if write:
+                published.add_edges(new_edges(rng))
+            else:
+                published.shortest_path(rng.randrange(vertices), rng.randrange(vertices))
+
+        locked_ops, snapshot_ops = run(locked_step, write_ratio), run(snapshot_step, write_ratio)
+        print(f'{write_ratio:>11.2f} {locked_ops:>13.0f} {snapshot_ops:>15.0f}')
+
+
+if __name__ == '__main__' and sys.argv[1:] == ['validation']:
+    bench_validation()
+elif __name__ == '__main__' and sys.argv[1:] == ['snapshot']:
+    bench_snapshot()
+elif __name__ == '__main__':
+    sizes = [tuple(int(x) for x in arg.split(':')) for arg in sys.argv[1:]]
+    bench_scaling(sizes or DEFAULT_SIZES)
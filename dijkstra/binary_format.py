@@ -0,0 +1,161 @@
+"""
+ Binary on-disk format of a CompressedGraph, opened through mmap.
+
+ All sections are little endian and start on 8 byte boundaries:
+
+    header    magic, version, label kind, target/weight typecodes,
+              vertex count V, edge count E
+    labels    V int64 labels, or V + 1 int64 offsets into a UTF-8 blob
+    offsets   V + 1 int64
+    targets   E int32 or int64 vertex ids
+    weights   E int64 or float64
+"""
+from typing import Any, List, Sequence, Tuple
+from array import array
+import mmap
+import struct
+import sys
+
+from csr import CompressedGraph
+import utils
+
+MAGIC = b'ADJG'
+VERSION = 1
+
+LABEL_INT = 0
+LABEL_STR = 1
+
+HEADER = struct.Struct('<4sHBcc7xqq')
+
+
+def _padding(size: int) -> bytes:
+    return b'\0' * (-size % 8)
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _label_section(vertices: Sequence[Any]) -> Tuple[int, bytes]:
+    """
+     Encodes the vertex labels, which must be all ints or all strings.
+    """
+    if all(type(label) is int for label in vertices):
+        return LABEL_INT, _little_endian(array('q', vertices))
+
+    if all(type(label) is str for label in vertices):
+        encoded = [label.encode('utf-8') for label in vertices]
+        offsets = array('q', [0])
+        for label in encoded:
+            offsets.append(offsets[-1] + len(label))
+        return LABEL_STR, _little_endian(offsets) + b''.join(encoded)
+
+    raise utils.AdjacencyError('Only int or str vertex labels can be saved.')
+
+
+def save(graph: CompressedGraph, path: str):
+    """
+     Writes a snapshot to path.
+
+    :param graph: frozen graph to write.
+    :type graph: CompressedGraph
+    :param path: destination file.
+    :type path: str
+    :raises AdjacencyError: if labels are neither all ints nor all strings.
+    """
+    vertex_count, edge_count = len(graph.vertices), len(graph.targets)
+    label_kind, labels = _label_section(graph.vertices)
+
+    target_code = 'i' if vertex_count < 2 ** 31 else 'q'
+    weight_code = 'q' if all(type(weight) is int for weight in graph.weights) else 'd'
+
+    sections = [
+        labels,
+        _little_endian(array('q', graph.offsets)),
+        _little_endian(array(target_code, graph.targets)),
+        _little_endian(array(weight_code, graph.weights)),
+    ]
+
+    with open(path, 'wb') as target:
+        target.write(HEADER.pack(MAGIC, VERSION, label_kind, target_code.encode(),
+                                 weight_code.encode(), vertex_count, edge_count))
+        for section in sections:
+            target.write(section)
+            target.write(_padding(len(section)))
+
+
+def open_graph(path: str) -> CompressedGraph:
+    """
+     Maps a saved snapshot read-only. Offsets, targets, weights and int
+     labels are memoryviews straight onto the mapped pages, so nothing is
+     copied and processes opening the same file share its page cache. Only
+     the label -> id dict (and string labels) are built in process memory.
+     Close the graph, or use it as a context manager, to unmap the file.
+
+    :param path: file written by save().
+    :type path: str
+    :rtype: CompressedGraph
+    :raises AdjacencyError: if the file is not a graph of this version or
+        is truncated.
+    """
+    with open(path, 'rb') as source:
+        header = source.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise utils.AdjacencyError(f'{path} is not a binary graph file.')
+
+        magic, version, label_kind, target_code, weight_code, vertex_count, edge_count = \
+            HEADER.unpack(header)
+
+        if magic != MAGIC or version != VERSION:
+            raise utils.AdjacencyError(f'{path} is not a version {VERSION} binary graph file.')
+        if label_kind not in (LABEL_INT, LABEL_STR) or target_code not in (b'i', b'q') \
+                or weight_code not in (b'q', b'd') or vertex_count < 0 or edge_count < 0:
+            raise utils.AdjacencyError(f'{path} has a corrupt header.')
+        if sys.byteorder == 'big':
+            raise utils.AdjacencyError('Mapping graph files needs a little endian machine.')
+
+        mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)
+    views = [view]
+    position = HEADER.size
+
+    def section(typecode: str, count: int) -> memoryview:
+        nonlocal position
+        size = struct.calcsize(typecode) * count
+        if position + size > len(view):
+            raise utils.AdjacencyError(f'{path} is truncated.')
+        values = view[position:position + size].cast(typecode)
+        views.append(values)
+        position += size + (-size % 8)
+        return values
+
+    try:
+        if label_kind == LABEL_INT:
+            vertices: Sequence[Any] = section('q', vertex_count)
+        else:
+            label_offsets = section('q', vertex_count + 1)
+            blob = section('B', label_offsets[-1])
+            vertices = [
+                str(blob[label_offsets[i]:label_offsets[i + 1]], 'utf-8')
+                for i in range(vertex_count)
+            ]
+            blob.release()
+            label_offsets.release()
+
+        offsets = section('q', vertex_count + 1)
+        targets = section(target_code.decode(), edge_count)
+        weights = section(weight_code.decode(), edge_count)
+
+        return CompressedGraph(vertices, offsets, targets, weights, mapping=mapped)
+    except BaseException:
+        # no view may outlive the mapping, close() refuses otherwise
+        for values in reversed(views):
+            values.release()
+        mapped.close()
+        raise
+    finally:
+        view.release()
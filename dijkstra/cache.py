@@ -0,0 +1,207 @@
+from typing import TypeVar, Generic, Optional, Dict, List, Tuple, Any, Hashable
+from collections import OrderedDict
+import sys
+
+from dijkstra import Graph, INFINITY, dijkstra, reconstruct_path
+import utils
+
+T = TypeVar('T')
+
+Tree = Tuple[Dict[T, int], Dict[T, Optional[T]]]
+
+# default memory budget of a cache
+MAX_BYTES = 64 << 20
+
+
+def _tree_size(tree: Tree) -> int:
+    """
+     Estimated size of a distance tree. The node labels are shared with the
+     graph and are not counted.
+    """
+    distances, predecessors = tree
+    return sys.getsizeof(distances) + sys.getsizeof(predecessors)
+
+
+def _path_size(answer: Tuple[float, List[T]]) -> int:
+    return sys.getsizeof(answer) + sys.getsizeof(answer[1])
+
+
+class ShortestPathCache(Generic[T]):
+    """
+     LRU cache in front of dijkstra() for repeated queries on one graph.
+
+     Holds full single-source trees and point-to-point answers in one
+     OrderedDict ordered by recency and bounded by an estimated memory
+     budget. A point-to-point query is also answered from a cached tree of
+     its source. The cache records the graph version it was filled at and
+     drops everything once AdjacencyList.version moves on, frozen
+     snapshots never change so their entries stay valid.
+
+     Returned trees and paths are shared with the cache and must not be
+     modified.
+    """
+
+    def __init__(self, graph: Graph, max_bytes: Optional[int] = MAX_BYTES,
+                 max_entries: Optional[int] = None):
+        """
+         initializes ShortestPathCache
+
+        :param graph: weighted graph or its frozen snapshot.
+        :type graph: Union[AdjacencyList[T], CompressedGraph[T]]
+        :param max_bytes: estimated memory budget, None for no limit.
+        :type max_bytes: Optional[int]
+        :param max_entries: maximum number of trees and answers, None for no limit.
+        :type max_entries: Optional[int]
+        """
+        if max_entries is not None and max_entries <= 0:
+            raise utils.AdjacencyError(f'Entry limit must be positive, got {max_entries}.')
+
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        # ('tree', source) or ('path', source, target) -> (value, size)
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
+        self._bytes = 0
+        self._version = getattr(graph, 'version', None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def tree(self, source: T) -> Tree:
+        """
+         Returns the distances and predecessors of every node reachable from
+         source, computing them on a miss.
+
+        :param source: starting point of the search.
+        :type source: T
+        :rtype: Tuple[Dict[T, int], Dict[T, Optional[T]]]
+        :raises AdjacencyError: if source is unknown.
+        """
+        self._validate()
+
+        key = ('tree', source)
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry
+
+        tree = dijkstra(self.graph, source)
+        self._store(key, tree, _tree_size(tree))
+        return tree
+
+    def shortest_path(self, source: T, target: T) -> Tuple[float, List[T]]:
+        """
+         Returns the distance and path from source to target, (inf, []) if
+         target cannot be reached.
+
+        :param source: starting point A
+        :type source: T
+        :param target: destination point B
+        :type target: T
+        :rtype: Tuple[float, List[T]]
+        :raises AdjacencyError: if source is unknown.
+        """
+        self._validate()
+
+        key = ('path', source, target)
+        tree_key = ('tree', source)
+
+        if key not in self._entries and tree_key in self._entries:
+            # answered from the tree, not stored a second time
+            distances, predecessors = self._lookup(tree_key)
+            if target not in distances:
+                return INFINITY, []
+            return distances[target], reconstruct_path(predecessors, target)
+
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry
+
+        distances, predecessors = dijkstra(self.graph, source, target)
+
+        if target in distances:
+            answer = (distances[target], reconstruct_path(predecessors, target))
+        else:
+            answer = (INFINITY, [])
+
+        self._store(key, answer, _path_size(answer))
+        return answer
+
+    def distance(self, source: T, target: T) -> float:
+        """
+         Returns the shortest distance from source to target, inf if target
+         cannot be reached.
+
+        :rtype: float
+        """
+        return self.shortest_path(source, target)[0]
+
+    def invalidate(self):
+        """
+         Drops every entry, the counters are kept.
+        """
+        self._entries.clear()
+        self._bytes = 0
+        self._version = getattr(self.graph, 'version', None)
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+         Returns the counters and current usage.
+
+        :rtype: Dict[str, Any]
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'entries': len(self._entries),
+            'trees': sum(1 for key in self._entries if key[0] == 'tree'),
+            'bytes': self._bytes,
+        }
+
+    def _validate(self):
+        """
+         Invalidates the cache if the graph changed since it was filled.
+        """
+        if getattr(self.graph, 'version', None) != self._version:
+            self.invalidate()
+
+    def _lookup(self, key: Hashable) -> Any:
+        """
+         Returns a cached value and marks it as most recently used, None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def _store(self, key: Hashable, value: Any, size: int):
+        """
+         Stores a value as most recently used and evicts the least recently
+         used entries until the limits hold again. A value that alone
+         exceeds max_bytes is not stored.
+        """
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        self._entries[key] = (value, size)
+        self._bytes += size
+
+        while (self.max_entries is not None and len(self._entries) > self.max_entries) or (
+                self.max_bytes is not None and self._bytes > self.max_bytes):
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
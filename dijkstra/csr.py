@@ -0,0 +1,188 @@
+from typing import TypeVar, Generic, Dict, List, Tuple, Sequence, Optional, Iterator
+from array import array
+import mmap
+import utils
+
+T = TypeVar('T')
+
+
+class CompressedGraph(Generic[T]):
+    """
+     Immutable compressed sparse row (CSR) snapshot of an AdjacencyList.
+
+     Vertices are interned to dense ids 0..V-1. The out-edges of vertex i
+     are targets[offsets[i]:offsets[i + 1]] with the matching weights, so
+     the whole graph lives in three flat buffers instead of one tuple per
+     edge.
+    """
+
+    __slots__ = ('vertices', 'index', 'offsets', 'targets', 'weights', '_mapping')
+
+    def __init__(self, vertices: Sequence[T], offsets: Sequence[int],
+                 targets: Sequence[int], weights: Sequence[int],
+                 index: Optional[Dict[T, int]] = None, mapping: Optional[mmap.mmap] = None):
+        """
+         initializes CompressedGraph over already built buffers
+
+        :param vertices: vertex labels, position is the vertex id.
+        :type vertices: Sequence[T]
+        :param offsets: V + 1 edge offsets.
+        :type offsets: Sequence[int]
+        :param targets: destination id of every edge.
+        :type targets: Sequence[int]
+        :param weights: weight of every edge.
+        :type weights: Sequence[int]
+        :param index: label to id map, derived from vertices when omitted.
+        :type index: Optional[Dict[T, int]]
+        :param mapping: file mapping the buffers are views of, unmapped by close().
+        :type mapping: Optional[mmap.mmap]
+        """
+        if len(offsets) != len(vertices) + 1 or len(targets) != len(weights):
+            raise utils.AdjacencyError('Inconsistent CSR buffer sizes.')
+
+        self.vertices = vertices
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._mapping = mapping
+        self.index: Dict[T, int] = index if index is not None else {
+            node: vertex_id for vertex_id, node in enumerate(vertices)
+        }
+
+    @classmethod
+    def from_adjacency(cls, adjacency_dict: Dict[T, List[Tuple[T, int]]]) -> 'CompressedGraph[T]':
+        """
+         Builds a snapshot from an adjacency dict, keeping its vertex order.
+
+        :param adjacency_dict: source -> [(destination, weight)] mapping.
+        :type adjacency_dict: Dict[T, List[Tuple[T, int]]]
+        :rtype: CompressedGraph[T]
+        """
+        vertices = list(adjacency_dict)
+        index = {node: vertex_id for vertex_id, node in enumerate(vertices)}
+
+        integral = all(
+            type(weight) is int
+            for neighbors in adjacency_dict.values()
+            for _, weight in neighbors
+        )
+
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('q' if integral else 'd')
+
+        for node in vertices:
+            neighbors = adjacency_dict[node]
+            targets.extend(index[destination] for destination, _ in neighbors)
+            weights.extend(weight for _, weight in neighbors)
+            offsets.append(len(targets))
+
+        return cls(vertices, offsets, targets, weights, index)
+
+    def __len__(self) -> int:
+        return len(self.vertices)
+
+    def __contains__(self, node: T) -> bool:
+        return node in self.index
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.vertices)
+
+    def __repr__(self):
+        return f'CompressedGraph(vertices={len(self.vertices)}, edges={len(self.targets)})'
+
+    def __str__(self):
+        return self.__repr__()
+
+    def close(self):
+        """
+         Unmaps the file of a graph from binary_format.open_graph, nothing
+         to do for graphs built in memory. The buffers cannot be read
+         afterwards.
+
+        :raises BufferError: if a view of the buffers is still held elsewhere.
+        """
+        if self._mapping is None:
+            return
+
+        for values in (self.vertices, self.offsets, self.targets, self.weights):
+            if isinstance(values, memoryview):
+                values.release()
+        self._mapping.close()
+        self._mapping = None
+
+    def __enter__(self) -> 'CompressedGraph[T]':
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self.close()
+        return False
+
+    def edge_count(self) -> int:
+        """
+         Returns the number of stored edges.
+
+        :rtype: int
+        """
+        return len(self.targets)
+
+    def vertex_id(self, node: T) -> int:
+        """
+         Returns the dense id of an existing node.
+
+        :param node: vertex label.
+        :type node: T
+        :rtype: int
+        :raises AdjacencyError: if the node does not exist.
+        """
+        vertex_id = self.index.get(node)
+        if vertex_id is None:
+            raise utils.AdjacencyError(f'Node {node} does not exist.')
+        return vertex_id
+
+    def get_edge(self, node: T) -> List[Tuple[T, int]]:
+        """
+         Gets the out-edges of a node, same shape as AdjacencyList.get_edge.
+
+        :param node:
+        :type node: Optional[T].
+        :rtype: List[Tuple[T, int]]
+        """
+        vertex_id = self.index.get(node)
+        if vertex_id is None:
+            return []
+
+        vertices, targets, weights = self.vertices, self.targets, self.weights
+        start, end = self.offsets[vertex_id], self.offsets[vertex_id + 1]
+        return [(vertices[targets[i]], weights[i]) for i in range(start, end)]
+
+    def reverse(self) -> 'CompressedGraph[T]':
+        """
+         Builds the transposed snapshot, every edge flipped, in O(V + E).
+
+        :rtype: CompressedGraph[T]
+        """
+        size = len(self.vertices)
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+
+        # count incoming edges, then place each edge at its slot
+        counts = [0] * (size + 1)
+        for target in targets:
+            counts[target + 1] += 1
+        for vertex_id in range(size):
+            counts[vertex_id + 1] += counts[vertex_id]
+
+        typecode = getattr(weights, 'typecode', None) or weights.format
+        reversed_offsets = array('q', counts)
+        reversed_targets = array('q', bytes(8 * len(targets)))
+        reversed_weights = array(typecode, bytes(8 * len(targets)))
+
+        slots = counts[:size]
+        for source in range(size):
+            for i in range(offsets[source], offsets[source + 1]):
+                slot = slots[targets[i]]
+                reversed_targets[slot] = source
+                reversed_weights[slot] = weights[i]
+                slots[targets[i]] = slot + 1
+
+        return CompressedGraph(self.vertices, reversed_offsets, reversed_targets, reversed_weights, self.index)
@@ -0,0 +1,216 @@
+from typing import TypeVar, Optional, Dict, List, Tuple, Union, Callable, Iterable
+from functools import singledispatch
+from itertools import count
+import heapq
+
+from adjacency_list import AdjacencyList
+from csr import CompressedGraph
+import utils
+
+T = TypeVar('T')
+
+Graph = Union[AdjacencyList[T], CompressedGraph[T]]
+
+INFINITY = float('inf')
+
+
+@singledispatch
+def dijkstra(graph: Graph, source: T,
+             target: Optional[T] = None) -> Tuple[Dict[T, int], Dict[T, Optional[T]]]:
+    """
+     Computes shortest path distances from source using a binary heap.
+
+     Stale heap entries are skipped on pop (lazy deletion) instead of being
+     decreased in place, so every edge pushes at most one entry and the run
+     is O((V + E) log V). When target is given the search stops as soon as
+     target is settled. The search is chosen by the class of graph, other
+     graph classes plug in through dijkstra.register.
+
+    :param graph: weighted graph, either an AdjacencyList read through its
+        adjacency_dict or a frozen CompressedGraph.
+    :type graph: Union[AdjacencyList[T], CompressedGraph[T]]
+    :param source: starting point of the search.
+    :type source: T
+    :param target: optional node to stop at once its distance is final.
+    :type target: Optional[T]
+    :returns: final distances and predecessors of every settled node.
+    :rtype: Tuple[Dict[T, int], Dict[T, Optional[T]]]
+    :raises AdjacencyError: if source is unknown or a negative weight is met.
+    """
+    return _dijkstra_adjacency(graph, source, target)
+
+
+def _dijkstra_adjacency(graph: AdjacencyList[T], source: T,
+                        target: Optional[T] = None) -> Tuple[Dict[T, int], Dict[T, Optional[T]]]:
+    """
+     dijkstra() over the adjacency_dict of an AdjacencyList.
+    """
+    adjacency = graph.adjacency_dict
+
+    if source not in adjacency:
+        raise utils.AdjacencyError(f'Source node {source} does not exist.')
+
+    best: Dict[T, int] = {source: 0}
+    parents: Dict[T, Optional[T]] = {source: None}
+
+    distances: Dict[T, int] = {}
+    predecessors: Dict[T, Optional[T]] = {}
+
+    # the counter breaks distance ties, so nodes never have to be comparable
+    tie = count()
+    heap = [(0, next(tie), source)]
+
+    while heap:
+        distance, _, node = heapq.heappop(heap)
+
+        if node in distances:
+            continue
+
+        distances[node] = distance
+        predecessors[node] = parents[node]
+
+        if node == target:
+            break
+
+        for neighbor, weight in adjacency.get(node, ()):
+            if weight < 0:
+                raise utils.AdjacencyError(f'Negative weight {weight} on edge {node} -> {neighbor}.')
+
+            candidate = distance + weight
+            if candidate < best.get(neighbor, INFINITY):
+                best[neighbor] = candidate
+                parents[neighbor] = node
+                heapq.heappush(heap, (candidate, next(tie), neighbor))
+
+    return distances, predecessors
+
+
+@dijkstra.register(CompressedGraph)
+def _dijkstra_compressed(graph: CompressedGraph[T], source: T,
+                         target: Optional[T] = None) -> Tuple[Dict[T, int], Dict[T, Optional[T]]]:
+    """
+     dijkstra() over the integer ids of a CSR snapshot. Tentative state is
+     kept in flat lists indexed by vertex id, labels are only looked up for
+     the settled nodes that are returned.
+    """
+    source_id = graph.vertex_id(source)
+    target_id = graph.index.get(target, -1) if target is not None else -1
+
+    best, parents, order = _search_ids(graph, source_id, target_id)
+
+    vertices = graph.vertices
+    distances = {vertices[node]: best[node] for node in order}
+    predecessors = {
+        vertices[node]: vertices[parents[node]] if parents[node] >= 0 else None
+        for node in order
+    }
+
+    return distances, predecessors
+
+
+def _search_ids(graph: CompressedGraph[T], source_id: int,
+                target_id: int = -1) -> Tuple[List[float], List[int], List[int]]:
+    """
+     The heap loop of _dijkstra_compressed. Returns the tentative distances
+     and parent ids of every vertex, INFINITY and -1 when unreached, and the
+     settled ids in settle order. Without a target every reached distance
+     is final.
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    size = len(graph)
+
+    best = [INFINITY] * size
+    parents = [-1] * size
+    settled = bytearray(size)
+    order: List[int] = []
+
+    best[source_id] = 0
+    heap = [(0, source_id)]
+
+    while heap:
+        distance, node = heapq.heappop(heap)
+
+        if settled[node]:
+            continue
+
+        settled[node] = 1
+        order.append(node)
+
+        if node == target_id:
+            break
+
+        for i in range(offsets[node], offsets[node + 1]):
+            weight = weights[i]
+            if weight < 0:
+                raise utils.AdjacencyError(f'Negative weight {weight} on edge from {graph.vertices[node]}.')
+
+            neighbor = targets[i]
+            candidate = distance + weight
+            if candidate < best[neighbor]:
+                best[neighbor] = candidate
+                parents[neighbor] = node
+                heapq.heappush(heap, (candidate, neighbor))
+
+    return best, parents, order
+
+
+def neighbors_of(graph: Graph) -> Callable[[T], Iterable[Tuple[T, int]]]:
+    """
+     Returns a node -> [(destination, weight)] lookup for either graph
+     type, empty for unknown nodes.
+
+    :param graph: weighted graph or its frozen snapshot.
+    :type graph: Union[AdjacencyList[T], CompressedGraph[T]]
+    :rtype: Callable[[T], Iterable[Tuple[T, int]]]
+    """
+    if isinstance(graph, CompressedGraph):
+        return graph.get_edge
+
+    adjacency = graph.adjacency_dict
+    return lambda node: adjacency.get(node, ())
+
+
+def reconstruct_path(predecessors: Dict[T, Optional[T]], target: T) -> List[T]:
+    """
+     Rebuilds the path leading to target from a predecessor map.
+
+    :param predecessors: predecessor map returned by dijkstra().
+    :type predecessors: Dict[T, Optional[T]]
+    :param target: last node of the path.
+    :type target: T
+    :rtype: List[T]
+    :raises AdjacencyError: if target was not reached.
+    """
+    if target not in predecessors:
+        raise utils.AdjacencyError(f'Node {target} was not reached.')
+
+    path = []
+    node: Optional[T] = target
+
+    while node is not None:
+        path.append(node)
+        node = predecessors[node]
+
+    path.reverse()
+    return path
+
+
+def shortest_path(graph: Graph, source: T, target: T) -> Tuple[float, List[T]]:
+    """
+     Finds the shortest path between two nodes, stopping early at target.
+
+    :param graph: weighted graph or its frozen snapshot.
+    :type graph: Union[AdjacencyList[T], CompressedGraph[T]]
+    :param source: starting point A
+    :type source: T
+    :param target: destination point B
+    :type target: T
+    :returns: total distance and the nodes on the path, (inf, []) if unreachable.
+    :rtype: Tuple[float, List[T]]
+    """
+    distances, predecessors = dijkstra(graph, source, target)
+
+    if target not in distances:
+        return INFINITY, []
+
+    return distances[target], reconstruct_path(predecessors, target)
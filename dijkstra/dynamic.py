@@ -0,0 +1,136 @@
+from typing import TypeVar, Generic, Optional, Dict, List
+from itertools import count
+import heapq
+
+from adjacency_list import AdjacencyList, ADDED, DECREASED
+from dijkstra import INFINITY, dijkstra, reconstruct_path
+
+T = TypeVar('T')
+
+
+class ShortestPathTree(Generic[T]):
+    """
+     Shortest path tree of one source kept up to date while its
+     AdjacencyList changes.
+
+     The tree listens to the graph. An added or cheaper edge u -> v can
+     only shorten paths through v, so when it improves v the search is
+     resumed from v alone and only the nodes whose distance drops are
+     touched. A removed or heavier edge that is not the tree edge of its
+     destination changes nothing; when it is, the tree is rebuilt.
+
+     The tree never raises from inside the graph's notification, which
+     would leave the graph changed and the later listeners uninformed. A
+     negative weight marks it stale instead, and the next distance() or
+     path() rebuilds it, raising AdjacencyError while a negative edge is
+     still reachable.
+    """
+
+    def __init__(self, graph: AdjacencyList[T], source: T):
+        """
+         initializes ShortestPathTree and subscribes it to graph
+
+        :param graph: graph to follow, call detach() when done with the tree.
+        :type graph: AdjacencyList[T]
+        :param source: root of the tree.
+        :type source: T
+        :raises AdjacencyError: if source is unknown.
+        """
+        self.graph = graph
+        self.source = source
+
+        self.distances: Dict[T, int] = {}
+        self.predecessors: Dict[T, Optional[T]] = {}
+
+        # number of full searches and of incremental repairs done
+        self.rebuilds = 0
+        self.repairs = 0
+        # set when a change could not be applied, distance() and path() rebuild first
+        self.stale = False
+
+        self.rebuild()
+        graph.add_listener(self._on_change)
+
+    def distance(self, node: T) -> float:
+        """
+         Returns the current distance from source, inf if node cannot be reached.
+
+        :rtype: float
+        :raises AdjacencyError: if a negative weight is reachable from source.
+        """
+        if self.stale:
+            self.rebuild()
+        return self.distances.get(node, INFINITY)
+
+    def path(self, node: T) -> List[T]:
+        """
+         Returns the current shortest path from source to node.
+
+        :rtype: List[T]
+        :raises AdjacencyError: if node cannot be reached or a negative
+            weight is reachable from source.
+        """
+        if self.stale:
+            self.rebuild()
+        return reconstruct_path(self.predecessors, node)
+
+    def rebuild(self):
+        """
+         Recomputes the whole tree with dijkstra().
+        """
+        self.distances, self.predecessors = dijkstra(self.graph, self.source)
+        self.rebuilds += 1
+        self.stale = False
+
+    def detach(self):
+        """
+         Stops following the graph, the tree keeps its last state.
+        """
+        self.graph.remove_listener(self._on_change)
+
+    def _on_change(self, event: str, source: T, destination: T, weight: int):
+        if self.stale:
+            return
+
+        if event == ADDED or event == DECREASED:
+            if weight < 0:
+                self.stale = True
+                return
+
+            origin = self.distances.get(source)
+            if origin is not None and origin + weight < self.distances.get(destination, INFINITY):
+                self.distances[destination] = origin + weight
+                self.predecessors[destination] = source
+                self._propagate(destination)
+        elif self.predecessors.get(destination) == source:
+            self.rebuild()
+
+    def _propagate(self, start: T):
+        """
+         Resumes Dijkstra from a node whose distance just dropped, relaxing
+         only the nodes that improve. Marks the tree stale when it meets a
+         negative weight.
+        """
+        distances, predecessors = self.distances, self.predecessors
+        adjacency = self.graph.adjacency_dict
+
+        tie = count()
+        heap = [(distances[start], next(tie), start)]
+
+        while heap:
+            distance, _, node = heapq.heappop(heap)
+            if distance > distances[node]:
+                continue
+
+            for neighbor, weight in adjacency.get(node, ()):
+                if weight < 0:
+                    self.stale = True
+                    return
+
+                candidate = distance + weight
+                if candidate < distances.get(neighbor, INFINITY):
+                    distances[neighbor] = candidate
+                    predecessors[neighbor] = node
+                    heapq.heappush(heap, (candidate, next(tie), neighbor))
+
+        self.repairs += 1
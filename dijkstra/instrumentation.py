@@ -0,0 +1,135 @@
+"""
+ Opt-in operation counters for AdjacencyList and the searches run on it.
+
+ instrument() switches a graph to a subclass whose public methods count
+ their calls, edges visited and wall time, the same way utils.set_checked
+ switches to the unchecked methods. The switching and the Metrics live in
+ the shared counters module, this module keeps the AdjacencyList profile.
+ Every instrumented class is registered with dijkstra(), so dijkstra()
+ and shortest_path() on an instrumented graph are recorded as the
+ 'dijkstra' operation with the edges the search relaxed, while graphs
+ that are not instrumented dispatch straight to the plain search.
+
+     metrics = instrumentation.instrument(graph)
+     ...
+     print(metrics.prometheus())
+
+ Searches of point_to_point, async_search and dynamic run their own loops
+ and are not counted. set_checked keeps a graph instrumented. Not thread
+ safe.
+"""
+from typing import Any, Callable, Dict, Optional, Tuple
+from time import perf_counter
+
+from adjacency_list import AdjacencyList
+from dijkstra import dijkstra, _dijkstra_adjacency
+import utils
+import counters
+from counters import OperationStats, uninstrument, is_instrumented, metrics_of
+
+# methods of AdjacencyList that are counted
+OPERATIONS = ('append_node', 'add_edge', 'add_edges', 'has_edge', 'update_weight', 'remove_edge',
+              'get_edge', 'predecessors', 'in_degree', 'out_degree', 'reverse', 'freeze')
+
+
+class Metrics(counters.Metrics):
+    """
+     counters.Metrics exported under the dijkstra prefix.
+    """
+    prefix = 'dijkstra'
+    visited_series = ('edges_visited_total', 'Edges scanned or relaxed per structure and operation.')
+
+
+def _edge_total(graph: AdjacencyList, *args) -> int:
+    return sum(len(neighbors) for neighbors in graph.adjacency_dict.values())
+
+
+def _edge_scan(graph: AdjacencyList, *args) -> int:
+    # without the reverse index predecessors and in_degree scan every edge
+    return _edge_total(graph) if graph._predecessors is None else 0
+
+
+def _walks(base: type) -> Dict[str, Callable[..., Any]]:
+    find_edge = base._find_edge
+
+    def counted_find_edge(self, source: Any, destination: Any) -> Optional[int]:
+        # the scan of the neighbor list, the edge index answers without one
+        position = find_edge(self, source, destination)
+        if self._edge_index is None:
+            self._visited += position + 1 if position is not None else len(self.adjacency_dict.get(source, ()))
+        return position
+
+    return {'_find_edge': counted_find_edge}
+
+
+def _recorded_dijkstra(graph: AdjacencyList, source: Any,
+                       target: Optional[Any] = None) -> Tuple[Dict, Dict]:
+    return record_search(graph, _dijkstra_adjacency, source, target)
+
+
+PROFILE = counters.Profile(
+    OPERATIONS,
+    # whole graph walks, computed up front from the arguments
+    {'predecessors': _edge_scan, 'in_degree': _edge_scan, 'reverse': _edge_total, 'freeze': _edge_total},
+    _walks,
+    # dijkstra() dispatches on the graph class, instrumented ones are recorded
+    lambda variant: dijkstra.register(variant, _recorded_dijkstra))
+
+
+def instrumented(cls: type) -> type:
+    """
+     Returns a subclass of an AdjacencyList class counting OPERATIONS,
+     created once per class, for the checked and unchecked variant alike.
+
+    :param cls: AdjacencyList or a subclass.
+    :type cls: type
+    :rtype: type
+    :raises AdjacencyError: if cls is not an AdjacencyList.
+    """
+    if not issubclass(cls, AdjacencyList):
+        raise utils.AdjacencyError(f'{cls.__name__} cannot be instrumented.')
+    return counters.instrumented(cls, PROFILE)
+
+
+def instrument(graph: AdjacencyList, metrics: Optional[Metrics] = None,
+               name: Optional[str] = None) -> Metrics:
+    """
+     Starts counting the operations of a graph.
+
+    :param graph: graph to observe.
+    :type graph: AdjacencyList
+    :param metrics: counters to add to, a new Metrics when None and the
+        graph is not instrumented yet.
+    :type metrics: Optional[Metrics]
+    :param name: structure name in the counters, the class name when None.
+    :type name: Optional[str]
+    :returns: the counters of the graph.
+    :rtype: Metrics
+    :raises AdjacencyError: if graph is not an AdjacencyList.
+    """
+    if not isinstance(graph, AdjacencyList):
+        raise utils.AdjacencyError(f'{type(graph).__name__} cannot be instrumented.')
+    return counters.instrument(graph, PROFILE, metrics, name, Metrics)
+
+
+def record_search(graph: AdjacencyList, search: Callable[..., Tuple[Dict, Dict]],
+                  source: Any, target: Optional[Any]) -> Tuple[Dict, Dict]:
+    """
+     Runs search(graph, source, target) and records it as 'dijkstra'.
+     Every settled node relaxed all of its edges, except a settled target
+     where the search stops, so the count is taken from the result instead
+     of inside the loop.
+
+    :rtype: Tuple[Dict[T, int], Dict[T, Optional[T]]]
+    """
+    start = perf_counter()
+    distances, predecessors = search(graph, source, target)
+    elapsed = perf_counter() - start
+
+    adjacency = graph.adjacency_dict
+    relaxed = sum(len(adjacency.get(node, ())) for node in distances)
+    if target is not None and target in distances:
+        relaxed -= len(adjacency.get(target, ()))
+
+    graph._metrics.record(graph._metrics_name, 'dijkstra', relaxed, elapsed)
+    return distances, predecessors
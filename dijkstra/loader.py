@@ -0,0 +1,182 @@
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Tuple
+import os
+import time
+
+from adjacency_list import AdjacencyList
+import utils
+
+Edge = Tuple[Any, Any, int]
+
+# bytes of lines read from disk per chunk
+CHUNK_BYTES = 1 << 20
+
+FORMATS = {'.csv': ',', '.tsv': '\t', '.txt': None, '.gr': 'dimacs'}
+
+
+class LoadReport(NamedTuple):
+    """
+     Progress of a load, passed to the progress callback after every chunk
+     and returned once the whole file was read.
+    """
+    edges: int
+    vertices: int
+    seconds: float
+
+    @property
+    def edges_per_second(self) -> float:
+        return self.edges / self.seconds if self.seconds else 0.0
+
+
+def read_chunks(path: str, chunk_bytes: int = CHUNK_BYTES) -> Iterator[List[str]]:
+    """
+     Yields the lines of a text file in chunks of roughly chunk_bytes.
+
+    :param path: file to read.
+    :type path: str
+    :param chunk_bytes: size hint of a chunk.
+    :type chunk_bytes: int
+    :rtype: Iterator[List[str]]
+    """
+    with open(path, 'r', encoding='utf-8') as source:
+        while True:
+            lines = source.readlines(chunk_bytes)
+            if not lines:
+                return
+            yield lines
+
+
+def parse_delimited(chunks: Iterator[List[str]], delimiter: Optional[str] = ',',
+                    node_type: Callable[[str], Any] = str,
+                    weight_type: Callable[[str], Any] = int) -> Iterator[List[Edge]]:
+    """
+     Turns chunks of "source<delimiter>destination[<delimiter>weight]" lines
+     into chunks of edges. Blank lines and lines starting with # are skipped,
+     a missing weight defaults to 0 like in add_edge.
+
+    :param chunks: chunks of lines.
+    :type chunks: Iterator[List[str]]
+    :param delimiter: field separator, None splits on any whitespace.
+    :type delimiter: Optional[str]
+    :param node_type: converts a node field, e.g. int.
+    :type node_type: Callable[[str], Any]
+    :param weight_type: converts a weight field.
+    :type weight_type: Callable[[str], Any]
+    :rtype: Iterator[List[Edge]]
+    """
+    for lines in chunks:
+        edges = []
+
+        for line in lines:
+            line = line.strip()
+            if not line or line[0] == '#':
+                continue
+
+            fields = line.split(delimiter)
+            if len(fields) < 2:
+                raise utils.AdjacencyError(f'Malformed edge line: {line}')
+
+            weight = weight_type(fields[2]) if len(fields) > 2 else 0
+            edges.append((node_type(fields[0].strip()), node_type(fields[1].strip()), weight))
+
+        yield edges
+
+
+def parse_dimacs(chunks: Iterator[List[str]]) -> Iterator[List[Edge]]:
+    """
+     Turns chunks of DIMACS shortest path lines ("a source destination
+     weight" arcs, "c" comments, "p sp vertices arcs" header) into chunks
+     of integer edges. Fields may be separated by any whitespace, blank
+     lines are skipped.
+
+    :param chunks: chunks of lines.
+    :type chunks: Iterator[List[str]]
+    :rtype: Iterator[List[Edge]]
+    :raises AdjacencyError: on an unknown line or a malformed arc.
+    """
+    for lines in chunks:
+        edges = []
+
+        for line in lines:
+            fields = line.split()
+            if not fields:
+                continue
+
+            if fields[0] != 'a':
+                if fields[0][0] not in ('c', 'p'):
+                    raise utils.AdjacencyError(f'Malformed DIMACS line: {line.strip()}')
+                continue
+
+            if len(fields) != 4:
+                raise utils.AdjacencyError(f'Malformed DIMACS arc: {line.strip()}')
+            try:
+                edges.append((int(fields[1]), int(fields[2]), int(fields[3])))
+            except ValueError:
+                raise utils.AdjacencyError(f'Malformed DIMACS arc: {line.strip()}') from None
+
+        yield edges
+
+
+def iter_edges(path: str, edge_format: Optional[str] = None, chunk_bytes: int = CHUNK_BYTES,
+               **options) -> Iterator[List[Edge]]:
+    """
+     Yields chunks of edges from a CSV, TSV, whitespace separated or DIMACS
+     .gr file. Only one chunk is held in memory at a time.
+
+    :param path: file to read.
+    :type path: str
+    :param edge_format: 'dimacs' or a delimiter, guessed from the extension when None.
+    :type edge_format: Optional[str]
+    :param chunk_bytes: size hint of a chunk.
+    :type chunk_bytes: int
+    :param options: node_type/weight_type passed to parse_delimited.
+    :rtype: Iterator[List[Edge]]
+    :raises AdjacencyError: if the format is unknown or options are given
+        for a DIMACS file, whose nodes and weights are always integers.
+    """
+    if edge_format is None:
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in FORMATS:
+            raise utils.AdjacencyError(f'Cannot guess the edge format of {path}.')
+        edge_format = FORMATS[extension]
+
+    if edge_format == 'dimacs':
+        if options:
+            raise utils.AdjacencyError(f'DIMACS files take no options, got {", ".join(options)}.')
+        return parse_dimacs(read_chunks(path, chunk_bytes))
+    return parse_delimited(read_chunks(path, chunk_bytes), edge_format, **options)
+
+
+def load_graph(path: str, graph: Optional[AdjacencyList] = None, edge_format: Optional[str] = None,
+               chunk_bytes: int = CHUNK_BYTES, progress: Optional[Callable[[LoadReport], None]] = None,
+               **options) -> Tuple[AdjacencyList, LoadReport]:
+    """
+     Streams an edge file into a graph through add_edges.
+
+    :param path: file to read.
+    :type path: str
+    :param graph: graph to extend, a new AdjacencyList when None.
+    :type graph: Optional[AdjacencyList]
+    :param edge_format: see iter_edges.
+    :type edge_format: Optional[str]
+    :param chunk_bytes: size hint of a chunk.
+    :type chunk_bytes: int
+    :param progress: called with the running LoadReport after every chunk.
+    :type progress: Optional[Callable[[LoadReport], None]]
+    :param options: node_type/weight_type passed to parse_delimited.
+    :returns: the graph and the final LoadReport with edges per second.
+    :rtype: Tuple[AdjacencyList, LoadReport]
+    """
+    if graph is None:
+        graph = AdjacencyList()
+
+    start = time.perf_counter()
+    report = LoadReport(0, len(graph.adjacency_dict), 0.0)
+
+    for edges in iter_edges(path, edge_format, chunk_bytes, **options):
+        loaded = report.edges + graph.add_edges(edges)
+        report = LoadReport(loaded, len(graph.adjacency_dict), time.perf_counter() - start)
+
+        if progress is not None:
+            progress(report)
+
+    return graph, report
@@ -0,0 +1,182 @@
+"""
+ Distance tables (many sources x many targets) computed in worker processes.
+
+ The graph is written once in the binary graph format and every worker
+ maps that file in its initializer, so the graph is never pickled per task
+ and all workers share one copy of its pages. Tasks only carry source ids
+ and return rows of float64 distances, inf for unreachable targets.
+"""
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import os
+import tempfile
+
+from adjacency_list import AdjacencyList
+from csr import CompressedGraph
+from dijkstra import _search_ids
+import binary_format
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# graph mapped by _init_worker in each worker process
+_worker_graph: Optional[CompressedGraph] = None
+
+
+def _init_worker(path: str):
+    global _worker_graph
+    _worker_graph = binary_format.open_graph(path)
+
+
+def _rows(graph: CompressedGraph, source_ids: Sequence[int],
+          target_ids: Optional[Sequence[int]]) -> List[bytes]:
+    """
+     Runs one search per source and returns the rows as float64 bytes.
+    """
+    rows = []
+    for source_id in source_ids:
+        best, _, _ = _search_ids(graph, source_id)
+        row = array('d', best) if target_ids is None else array('d', [best[i] for i in target_ids])
+        rows.append(row.tobytes())
+    return rows
+
+
+def _rows_task(source_ids: Sequence[int], target_ids: Optional[Sequence[int]]) -> List[bytes]:
+    return _rows(_worker_graph, source_ids, target_ids)
+
+
+def _vertex_ids(graph: CompressedGraph, nodes: Sequence[Any]) -> List[int]:
+    return [graph.vertex_id(node) for node in nodes]
+
+
+def _snapshot(graph: Union[AdjacencyList, CompressedGraph, str]) -> Tuple[CompressedGraph, Optional[str]]:
+    """
+     Returns the CSR snapshot of graph and the file it is mapped from, None
+     when it only lives in memory.
+    """
+    if isinstance(graph, str):
+        return binary_format.open_graph(graph), graph
+    if isinstance(graph, AdjacencyList):
+        return graph.freeze(), None
+    return graph, None
+
+
+def distance_rows(graph: Union[AdjacencyList, CompressedGraph, str], sources: Sequence[Any],
+                  targets: Optional[Sequence[Any]] = None, workers: Optional[int] = None,
+                  chunk_size: Optional[int] = None) -> Iterator[Tuple[Any, array]]:
+    """
+     Yields (source, row) in the order of sources, row[j] being the distance
+     to targets[j]. At most two chunks per worker are submitted ahead of
+     the row being yielded, so only their rows are held in memory and
+     tables bigger than memory can be streamed to disk.
+
+    :param graph: graph, frozen snapshot, or path of a file written by
+        AdjacencyList.save(). Graphs are written to a temporary file first,
+        passing a saved file skips that step.
+    :type graph: Union[AdjacencyList, CompressedGraph, str]
+    :param sources: nodes to search from.
+    :type sources: Sequence[Any]
+    :param targets: columns of the table, every vertex in graph order when None.
+    :type targets: Optional[Sequence[Any]]
+    :param workers: worker processes, os.cpu_count() when None. With 1 the
+        rows are computed in this process.
+    :type workers: Optional[int]
+    :param chunk_size: sources per task, about four tasks per worker when None.
+    :type chunk_size: Optional[int]
+    :rtype: Iterator[Tuple[Any, array]]
+    :raises AdjacencyError: if a source or target does not exist.
+    """
+    sources = list(sources)
+    snapshot, path = _snapshot(graph)
+    try:
+        yield from _distance_rows(snapshot, path, sources, targets, workers, chunk_size)
+    finally:
+        if isinstance(graph, str):
+            snapshot.close()
+
+
+def _distance_rows(snapshot: CompressedGraph, path: Optional[str], sources: List[Any],
+                   targets: Optional[Sequence[Any]], workers: Optional[int],
+                   chunk_size: Optional[int]) -> Iterator[Tuple[Any, array]]:
+    """
+     distance_rows on a snapshot already mapped from path, or living only in
+     memory when path is None.
+    """
+    workers = workers or os.cpu_count() or 1
+    temporary = path is None
+
+    source_ids = _vertex_ids(snapshot, sources)
+    target_ids = _vertex_ids(snapshot, targets) if targets is not None else None
+
+    if workers == 1:
+        for source, source_id in zip(sources, source_ids):
+            yield source, array('d', _rows(snapshot, [source_id], target_ids)[0])
+        return
+
+    if chunk_size is None:
+        chunk_size = max(1, len(source_ids) // (workers * 4))
+
+    if temporary:
+        handle, path = tempfile.mkstemp(suffix='.adjg')
+        os.close(handle)
+        binary_format.save(snapshot, path)
+
+    try:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(path,)) as executor:
+            # at most two chunks per worker are queued or done but not yielded yet
+            pending = deque()
+            try:
+                for start in range(0, len(source_ids), chunk_size):
+                    pending.append((start, executor.submit(_rows_task, source_ids[start:start + chunk_size],
+                                                           target_ids)))
+                    if len(pending) == 2 * workers:
+                        yield from _chunk_rows(sources, *pending.popleft())
+                while pending:
+                    yield from _chunk_rows(sources, *pending.popleft())
+            finally:
+                # a consumer that stops early does not wait for the queued chunks
+                for _, future in pending:
+                    future.cancel()
+    finally:
+        if temporary:
+            os.remove(path)
+
+
+def _chunk_rows(sources: List[Any], start: int, future: Future) -> Iterator[Tuple[Any, array]]:
+    # the rows of the chunk beginning at sources[start], once its task is done
+    for offset, row in enumerate(future.result()):
+        values = array('d')
+        values.frombytes(row)
+        yield sources[start + offset], values
+
+
+def distance_matrix(graph: Union[AdjacencyList, CompressedGraph, str], sources: Sequence[Any],
+                    targets: Optional[Sequence[Any]] = None, workers: Optional[int] = None,
+                    chunk_size: Optional[int] = None) -> Any:
+    """
+     Computes the whole sources x targets table, see distance_rows.
+
+    :returns: a float64 numpy array of shape (len(sources), len(targets))
+        when numpy is installed, otherwise a list of array('d') rows.
+    :rtype: Union[numpy.ndarray, List[array]]
+    """
+    sources = list(sources)
+    snapshot, path = _snapshot(graph)
+    try:
+        rows = _distance_rows(snapshot, path, sources, targets, workers, chunk_size)
+
+        if numpy is None:
+            return [row for _, row in rows]
+
+        width = len(targets) if targets is not None else len(snapshot)
+        matrix = numpy.empty((len(sources), width), dtype=numpy.float64)
+        for i, (_, row) in enumerate(rows):
+            matrix[i] = numpy.frombuffer(row, dtype=numpy.float64)
+        return matrix
+    finally:
+        if isinstance(graph, str):
+            snapshot.close()
@@ -0,0 +1,313 @@
+from typing import TypeVar, Optional, Dict, List, Tuple, Callable, NamedTuple, Any
+from itertools import count
+import heapq
+import random
+
+from dijkstra import Graph, INFINITY, dijkstra, neighbors_of, reconstruct_path
+import utils
+
+T = TypeVar('T')
+
+Heuristic = Callable[[Any], float]
+
+STRATEGIES = ('dijkstra', 'astar', 'bidirectional', 'alt')
+
+
+class PathResult(NamedTuple):
+    """
+     Answer of a point-to-point query. settled counts the nodes whose
+     distance became final, summed over both directions for bidirectional
+     search, so strategies can be compared by the work they did.
+    """
+    distance: float
+    path: List[Any]
+    settled: int
+
+
+def astar(graph: Graph, source: T, target: T, heuristic: Heuristic) -> PathResult:
+    """
+     A* search from source to target.
+
+     heuristic(node) must never overestimate the remaining distance to
+     target and must be consistent (h(u) <= w(u, v) + h(v)), which holds for
+     the ALT heuristic and for straight-line distances.
+
+    :param graph: weighted graph or its frozen snapshot.
+    :type graph: Union[AdjacencyList[T], CompressedGraph[T]]
+    :param source: starting point A
+    :type source: T
+    :param target: destination point B
+    :type target: T
+    :param heuristic: lower bound of the distance from a node to target.
+    :type heuristic: Callable[[T], float]
+    :rtype: PathResult
+    :raises AdjacencyError: if source is unknown or a negative weight is met.
+    """
+    neighbors = neighbors_of(graph)
+    if source not in graph:
+        raise utils.AdjacencyError(f'Source node {source} does not exist.')
+
+    best: Dict[T, float] = {source: 0}
+    parents: Dict[T, Optional[T]] = {source: None}
+    predecessors: Dict[T, Optional[T]] = {}
+
+    tie = count()
+    heap = [(heuristic(source), next(tie), 0, source)]
+
+    while heap:
+        _, _, distance, node = heapq.heappop(heap)
+
+        if node in predecessors:
+            continue
+        predecessors[node] = parents[node]
+
+        if node == target:
+            return PathResult(distance, reconstruct_path(predecessors, target), len(predecessors))
+
+        for neighbor, weight in neighbors(node):
+            if weight < 0:
+                raise utils.AdjacencyError(f'Negative weight {weight} on edge {node} -> {neighbor}.')
+
+            candidate = distance + weight
+            if candidate < best.get(neighbor, INFINITY):
+                best[neighbor] = candidate
+                parents[neighbor] = node
+                heapq.heappush(heap, (candidate + heuristic(neighbor), next(tie), candidate, neighbor))
+
+    return PathResult(INFINITY, [], len(predecessors))
+
+
+def bidirectional_dijkstra(graph: Graph, source: T, target: T,
+                           reverse: Optional[Graph] = None) -> PathResult:
+    """
+     Runs Dijkstra forward from source and backward from target, always
+     advancing the side with the smaller frontier key, and stops once the
+     two key minima together cannot beat the best meeting point found.
+
+    :param graph: weighted graph or its frozen snapshot.
+    :type graph: Union[AdjacencyList[T], CompressedGraph[T]]
+    :param source: starting point A
+    :type source: T
+    :param target: destination point B
+    :type target: T
+    :param reverse: graph.reverse(), built on the fly when None. Pass it in
+        (or use PathQuery) when running many queries.
+    :type reverse: Optional[Union[AdjacencyList[T], CompressedGraph[T]]]
+    :rtype: PathResult
+    :raises AdjacencyError: if source is unknown or a negative weight is met.
+    """
+    if source not in graph:
+        raise utils.AdjacencyError(f'Source node {source} does not exist.')
+
+    if reverse is None:
+        reverse = graph.reverse()
+
+    if source == target:
+        return PathResult(0, [source], 1)
+
+    sides = (neighbors_of(graph), neighbors_of(reverse))
+    best: Tuple[Dict[T, float], Dict[T, float]] = ({source: 0}, {target: 0})
+    parents: Tuple[Dict[T, Optional[T]], Dict[T, Optional[T]]] = ({source: None}, {target: None})
+    settled: Tuple[Dict[T, float], Dict[T, float]] = ({}, {})
+
+    tie = count()
+    heaps = ([(0, next(tie), source)], [(0, next(tie), target)])
+
+    shortest = INFINITY
+    meeting: Optional[T] = None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= shortest:
+            break
+
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        distance, _, node = heapq.heappop(heaps[side])
+
+        if node in settled[side]:
+            continue
+        settled[side][node] = distance
+
+        other_best = best[1 - side]
+        for neighbor, weight in sides[side](node):
+            if weight < 0:
+                edge = f'{node} -> {neighbor}' if side == 0 else f'{neighbor} -> {node}'
+                raise utils.AdjacencyError(f'Negative weight {weight} on edge {edge}.')
+
+            candidate = distance + weight
+            if candidate < best[side].get(neighbor, INFINITY):
+                best[side][neighbor] = candidate
+                parents[side][neighbor] = node
+                heapq.heappush(heaps[side], (candidate, next(tie), neighbor))
+
+            if neighbor in other_best and candidate + other_best[neighbor] < shortest:
+                shortest = candidate + other_best[neighbor]
+                meeting = neighbor
+
+    work = len(settled[0]) + len(settled[1])
+    if meeting is None:
+        return PathResult(INFINITY, [], work)
+
+    forward = reconstruct_path(parents[0], meeting)
+    node = parents[1][meeting]
+    while node is not None:
+        forward.append(node)
+        node = parents[1][node]
+
+    return PathResult(shortest, forward, work)
+
+
+class Landmarks(object):
+    """
+     ALT (A*, landmarks, triangle inequality) preprocessing. Distances from
+     and to a few landmarks are computed once, after which
+     heuristic(target) gives an admissible, consistent A* heuristic for any
+     target:
+
+        h(v) = max over landmarks L of d(L, t) - d(L, v) and d(v, L) - d(t, L)
+    """
+
+    def __init__(self, graph: Graph, landmark_count: int = 8,
+                 reverse: Optional[Graph] = None, seed: int = 0):
+        """
+         initializes Landmarks, picking landmarks by farthest-point selection
+
+        :param graph: weighted graph or its frozen snapshot.
+        :type graph: Union[AdjacencyList[T], CompressedGraph[T]]
+        :param landmark_count: number of landmarks, each costs two searches
+            and two distance tables.
+        :type landmark_count: int
+        :param reverse: graph.reverse(), built when None.
+        :type reverse: Optional[Union[AdjacencyList[T], CompressedGraph[T]]]
+        :param seed: seeds the choice of the first landmark.
+        :type seed: int
+        """
+        if reverse is None:
+            reverse = graph.reverse()
+
+        nodes = list(graph)
+        if not nodes:
+            raise utils.AdjacencyError('Cannot pick landmarks in an empty graph.')
+
+        self.landmarks: List[Any] = []
+        self.from_landmark: List[Dict[Any, float]] = []
+        self.to_landmark: List[Dict[Any, float]] = []
+
+        # min distance of every reached node to the landmarks chosen so far
+        closest: Dict[Any, float] = {}
+        landmark = random.Random(seed).choice(nodes)
+
+        while landmark is not None and len(self.landmarks) < landmark_count:
+            forward, _ = dijkstra(graph, landmark)
+            backward, _ = dijkstra(reverse, landmark)
+
+            self.landmarks.append(landmark)
+            self.from_landmark.append(forward)
+            self.to_landmark.append(backward)
+
+            for node, distance in forward.items():
+                if distance < closest.get(node, INFINITY):
+                    closest[node] = distance
+
+            candidates = [(distance, node) for node, distance in closest.items()
+                          if node not in self.landmarks]
+            landmark = max(candidates, key=lambda item: item[0])[1] if candidates else None
+
+    def heuristic(self, target: T) -> Heuristic:
+        """
+         Returns the lower bound function for one target.
+
+        :param target: destination the bounds are computed towards.
+        :type target: T
+        :rtype: Callable[[T], float]
+        """
+        tables = []
+        for forward, backward in zip(self.from_landmark, self.to_landmark):
+            tables.append((forward, forward.get(target), backward, backward.get(target)))
+
+        def bound(node: Any) -> float:
+            lower = 0
+            for forward, target_from, backward, target_to in tables:
+                # terms with an unreachable side carry no information
+                if target_from is not None:
+                    node_from = forward.get(node)
+                    if node_from is not None and target_from - node_from > lower:
+                        lower = target_from - node_from
+                if target_to is not None:
+                    node_to = backward.get(node)
+                    if node_to is not None and node_to - target_to > lower:
+                        lower = node_to - target_to
+            return lower
+
+        return bound
+
+
+class PathQuery(object):
+    """
+     Point-to-point query front end that keeps the reverse graph and the
+     landmark tables between queries.
+    """
+
+    def __init__(self, graph: Graph, landmark_count: int = 0):
+        """
+         initializes PathQuery
+
+        :param graph: weighted graph or its frozen snapshot, must not change
+            while the query object is in use.
+        :type graph: Union[AdjacencyList[T], CompressedGraph[T]]
+        :param landmark_count: landmarks to precompute for the 'alt' strategy,
+            0 to compute 8 on the first 'alt' query.
+        :type landmark_count: int
+        """
+        self.graph = graph
+        self._reverse: Optional[Graph] = None
+        self._landmarks: Optional[Landmarks] = None
+
+        if landmark_count:
+            self._landmarks = Landmarks(graph, landmark_count, self.reverse)
+
+    @property
+    def reverse(self) -> Graph:
+        if self._reverse is None:
+            self._reverse = self.graph.reverse()
+        return self._reverse
+
+    @property
+    def landmarks(self) -> Landmarks:
+        if self._landmarks is None:
+            self._landmarks = Landmarks(self.graph, reverse=self.reverse)
+        return self._landmarks
+
+    def query(self, source: T, target: T, strategy: str = 'bidirectional',
+              heuristic: Optional[Heuristic] = None) -> PathResult:
+        """
+         Answers a shortest path query with the chosen strategy.
+
+        :param source: starting point A
+        :type source: T
+        :param target: destination point B
+        :type target: T
+        :param strategy: one of STRATEGIES.
+        :type strategy: str
+        :param heuristic: lower bound to target, required for 'astar'.
+        :type heuristic: Optional[Callable[[T], float]]
+        :rtype: PathResult
+        :raises AdjacencyError: on an unknown strategy or a missing heuristic.
+        """
+        if strategy == 'dijkstra':
+            distances, predecessors = dijkstra(self.graph, source, target)
+            if target not in distances:
+                return PathResult(INFINITY, [], len(distances))
+            return PathResult(distances[target], reconstruct_path(predecessors, target), len(distances))
+
+        if strategy == 'bidirectional':
+            return bidirectional_dijkstra(self.graph, source, target, self.reverse)
+
+        if strategy == 'alt':
+            return astar(self.graph, source, target, self.landmarks.heuristic(target))
+
+        if strategy == 'astar':
+            if heuristic is None:
+                raise utils.AdjacencyError('The astar strategy needs a heuristic.')
+            return astar(self.graph, source, target, heuristic)
+
+        raise utils.AdjacencyError(f'Unknown strategy {strategy}, expected one of {STRATEGIES}.')
@@ -0,0 +1,82 @@
+from typing import TypeVar, Generic, Optional, List, Tuple, Iterable, Iterator
+from contextlib import contextmanager
+import threading
+
+from adjacency_list import AdjacencyList
+from csr import CompressedGraph
+from dijkstra import shortest_path
+
+T = TypeVar('T')
+
+
+class SnapshotGraph(Generic[T]):
+    """
+     Copy-on-write publishing of an AdjacencyList for concurrent readers.
+
+     Writers change a private AdjacencyList one batch at a time under a
+     lock and publish a frozen CompressedGraph when the batch ends.
+     Readers take the current snapshot with a plain attribute read, no
+     lock, and keep a consistent graph for as long as they hold it, no
+     matter what is written meanwhile. Publishing freezes the whole graph,
+     O(V + E), so writes should be grouped into batches.
+    """
+
+    def __init__(self, graph: Optional[AdjacencyList[T]] = None):
+        """
+         initializes SnapshotGraph and publishes the first snapshot
+
+        :param graph: graph to take over, must not be changed directly
+            afterwards. A new AdjacencyList when None.
+        :type graph: Optional[AdjacencyList[T]]
+        """
+        self._graph: AdjacencyList[T] = graph if graph is not None else AdjacencyList()
+        self._write_lock = threading.Lock()
+
+        self._snapshot: CompressedGraph[T] = self._graph.freeze()
+        # graph version the current snapshot was frozen at
+        self.version: int = self._graph.version
+
+    def snapshot(self) -> CompressedGraph[T]:
+        """
+         Returns the latest published snapshot, never blocks.
+
+        :rtype: CompressedGraph[T]
+        """
+        return self._snapshot
+
+    @contextmanager
+    def batch(self) -> Iterator[AdjacencyList[T]]:
+        """
+         Gives the writer exclusive access to the private graph and publishes
+         the changes on exit, also when the batch raised, so the snapshot
+         always matches the graph.
+
+        :rtype: Iterator[AdjacencyList[T]]
+        """
+        with self._write_lock:
+            try:
+                yield self._graph
+            finally:
+                if self._graph.version != self.version:
+                    self._snapshot = self._graph.freeze()
+                    self.version = self._graph.version
+
+    def append_node(self, node: T):
+        with self.batch() as graph:
+            graph.append_node(node)
+
+    def add_edge(self, source: T, destination: T, weight: int = 0):
+        with self.batch() as graph:
+            graph.add_edge(source, destination, weight)
+
+    def add_edges(self, edges: Iterable[Tuple[T, T, int]]) -> int:
+        with self.batch() as graph:
+            return graph.add_edges(edges)
+
+    def shortest_path(self, source: T, target: T) -> Tuple[float, List[T]]:
+        """
+         shortest_path() on the current snapshot.
+
+        :rtype: Tuple[float, List[T]]
+        """
+        return shortest_path(self._snapshot, source, target)
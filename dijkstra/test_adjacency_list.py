@@ -0,0 +1,41 @@
+import unittest
+
+from adjacency_list import AdjacencyList
+from cache import ShortestPathCache
+import utils
+
+
+class AddEdgesVersionTest(unittest.TestCase):
+    def test_partial_batch_moves_the_version(self):
+        graph = AdjacencyList([0, 1, 2])
+        cache = ShortestPathCache(graph)
+        self.assertEqual(cache.distance(0, 2), float('inf'))
+
+        version = graph.version
+        with self.assertRaises(utils.AdjacencyError):
+            graph.add_edges([(0, 2, 1), (None, 1, 1)])
+        self.assertTrue(graph.has_edge(0, 2))
+        self.assertNotEqual(graph.version, version)
+        self.assertEqual(cache.distance(0, 2), 1)
+
+    def test_failing_listener_moves_the_version(self):
+        graph = AdjacencyList([0, 1])
+
+        def listener(event, source, destination, weight):
+            raise RuntimeError('listener failed')
+
+        graph.add_listener(listener)
+        version = graph.version
+        with self.assertRaises(RuntimeError):
+            graph.add_edges([(0, 1, 1)])
+        self.assertNotEqual(graph.version, version)
+
+    def test_empty_batch_keeps_the_version(self):
+        graph = AdjacencyList([0, 1])
+        version = graph.version
+        self.assertEqual(graph.add_edges([]), 0)
+        self.assertEqual(graph.version, version)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from adjacency_list import AdjacencyList
+from async_search import dijkstra_async
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class OffloadTest(unittest.TestCase):
+    def run_search(self, offload_above: int) -> int:
+        # 2 vertices, 3 parallel edges: the threshold must count edges
+        graph = AdjacencyList([0, 1])
+        graph.add_edges([(0, 1, 3), (0, 1, 2), (1, 0, 1)])
+        with RecordingExecutor() as executor:
+            result = asyncio.run(dijkstra_async(graph, 0, offload_above=offload_above, executor=executor))
+        self.assertEqual(result.distances, {0: 0, 1: 2})
+        return executor.submitted
+
+    def test_offload_above_counts_edges(self):
+        self.assertEqual(self.run_search(3), 1)
+        self.assertEqual(self.run_search(4), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from adjacency_list import AdjacencyList
+from cache import ShortestPathCache
+from dynamic import ShortestPathTree
+import utils
+
+
+class NegativeWeightTest(unittest.TestCase):
+    def setUp(self):
+        self.graph = AdjacencyList([0, 1, 2])
+        self.graph.add_edge(0, 1, 4)
+        self.tree = ShortestPathTree(self.graph, 0)
+        # registered after the tree, must still see every change
+        self.graph.enable_reverse_index()
+
+    def test_later_listeners_see_a_negative_edge(self):
+        self.graph.add_edge(1, 2, -1)
+        self.assertTrue(self.graph.has_edge(1, 2))
+        self.assertEqual(self.graph.in_degree(2), 1)
+        self.assertTrue(self.tree.stale)
+
+    def test_queries_raise_until_the_negative_edge_is_gone(self):
+        self.graph.add_edge(1, 2, -1)
+        with self.assertRaises(utils.AdjacencyError):
+            self.tree.distance(2)
+        self.graph.remove_edge(1, 2)
+        self.assertEqual(self.tree.distance(2), float('inf'))
+        self.assertEqual(self.tree.distance(1), 4)
+        self.assertFalse(self.tree.stale)
+
+    def test_add_edges_with_a_negative_edge_moves_the_version(self):
+        cache = ShortestPathCache(self.graph)
+        self.assertEqual(cache.distance(0, 2), float('inf'))
+        self.graph.add_edges([(0, 2, 1), (2, 1, -5)])
+        self.assertEqual(self.graph.in_degree(1), 2)
+        self.assertEqual(cache.distance(0, 2), 1)
+        self.assertTrue(self.tree.stale)
+
+    def test_decreased_weight_is_repaired_incrementally(self):
+        self.graph.add_edge(0, 2, 9)
+        self.graph.add_edge(1, 2, 1)
+        self.assertEqual(self.tree.distance(2), 5)
+        self.graph.update_weight(0, 2, 2)
+        self.assertEqual(self.tree.path(2), [0, 2])
+        self.assertEqual(self.tree.rebuilds, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import pickle
+import unittest
+
+from adjacency_list import AdjacencyList
+from dijkstra import dijkstra
+import instrumentation
+import utils
+
+
+class PickleTest(unittest.TestCase):
+    def make_graph(self, checked: bool) -> AdjacencyList:
+        graph = AdjacencyList(['a', 'b'], checked=checked)
+        graph.add_edge('a', 'b', 2)
+        instrumentation.instrument(graph)
+        return graph
+
+    def test_round_trip_keeps_the_mode_and_drops_the_counters(self):
+        for checked in (True, False):
+            loaded = pickle.loads(pickle.dumps(self.make_graph(checked)))
+            self.assertFalse(instrumentation.is_instrumented(loaded))
+            self.assertEqual(utils.is_checked(loaded), checked)
+            self.assertFalse(hasattr(loaded, '_metrics'))
+            self.assertEqual(dijkstra(loaded, 'a')[0], {'a': 0, 'b': 2})
+
+
+class DispatchTest(unittest.TestCase):
+    def test_searches_are_recorded_in_both_modes(self):
+        graph = AdjacencyList(['a', 'b'])
+        graph.add_edge('a', 'b', 2)
+        metrics = instrumentation.instrument(graph)
+        dijkstra(graph, 'a')
+        utils.set_checked(graph, False)
+        dijkstra(graph, 'a')
+        self.assertEqual(metrics.snapshot()['AdjacencyList']['dijkstra']['calls'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
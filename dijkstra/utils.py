@@ -1,13 +1,26 @@
 from typing import Any
+from functools import wraps
+import os
+import sys
+
+# modules shared by linked_lists and dijkstra live in the repository root,
+# appended last so that this package's own modules keep precedence
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from modes import set_checked_mode, unchecked, set_checked, is_checked
 
 class AdjacencyError(Exception):
     def __init__(self, err_message: str):
         super().__init__(f'Adjacency list raised an exception: {err_message}')
 
 def require_non_null(function: Any):
+    @wraps(function)
     def wrapper(*args, **kwargs):
         for arg in args:
             if arg is None:
                 raise AdjacencyError(f'Argument cannot be null.')
         return function(*args, **kwargs)
-    return wrapper
\ No newline at end of file
+    wrapper.__validator__ = True
+    return wrapper
@@ -1,4 +1,5 @@
-from typing import TypeAlias, List, Tuple
+from typing import TypeAlias, List, Tuple, Iterable, Iterator, Any
+from collections.abc import Set
 from abc import ABC, abstractmethod
 
 Label: TypeAlias = str
@@ -17,7 +18,7 @@ class AbstractGraph(ABC):
         pass
 
     @abstractmethod
-    def has_edge(self, label: Label) -> bool:
+    def has_edge(self, src: Label, dst: Label) -> bool:
         pass
 
     @abstractmethod
@@ -30,4 +31,65 @@ class AbstractGraph(ABC):
 
     @abstractmethod
     def edge_list(self) -> List[Tuple[Label,Label]]:
-        pass
\ No newline at end of file
+        pass
+
+    def neighbors(self, label: Label) -> Iterable[Label]:
+        """
+        Successors of a vertex for read-only use, a lazy view where the
+        backend has one. Defaults to edges().
+        """
+        return self.edges(label)
+
+    def vertices(self) -> Iterable[Label]:
+        """
+        Vertices for read-only use, a lazy view where the backend has one.
+        Defaults to vertex_list().
+        """
+        return self.vertex_list()
+
+    def iter_edges(self) -> Iterator[Tuple[Label, Label]]:
+        """
+        Yields every (src, dst) edge without building the edge list.
+        """
+        for src in self.vertices():
+            for dst in self.neighbors(src):
+                yield src, dst
+
+    def edge_count(self) -> int:
+        return sum(len(self.neighbors(src)) for src in self.vertices())
+
+    def edge_view(self) -> 'EdgeView':
+        """
+        Lazy set of (src, dst) edges, see EdgeView.
+        """
+        return EdgeView(self)
+
+class EdgeView(Set):
+    """
+    Read-only set view of the edges of a graph. Iteration, len and
+    membership read the graph directly, nothing is copied, and the view
+    follows later changes of the graph. Set operators build plain sets.
+    """
+
+    __slots__ = ('_graph',)
+
+    def __init__(self, graph: AbstractGraph):
+        self._graph = graph
+
+    def __iter__(self) -> Iterator[Tuple[Label, Label]]:
+        return self._graph.iter_edges()
+
+    def __len__(self) -> int:
+        return self._graph.edge_count()
+
+    def __contains__(self, edge: Any) -> bool:
+        if not isinstance(edge, tuple) or len(edge) != 2:
+            return False
+        return self._graph.has_edge(*edge)
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[Tuple[Label, Label]]) -> set:
+        return set(iterable)
+
+    def __repr__(self):
+        return f'EdgeView({len(self)} edges)'
@@ -0,0 +1,117 @@
+from typing import TypeAlias, Dict, List, Tuple, Optional, Iterable
+from itertools import compress
+from Abstract import AbstractGraph
+import DataUtils
+
+Label: TypeAlias = str
+
+class AdjGraph(AbstractGraph):
+    """
+    Adjacency matrix backend for dense graphs. Labels are interned to ints
+    in insertion order and row i is a bytearray bitset whose bit j marks
+    the edge i -> j. has_edge and add_edge touch a single byte, a row costs
+    n bits instead of a dict entry per edge, and whole rows are read as one
+    int for bitwise work.
+    """
+
+    def __init__(self, checked: Optional[bool] = None):
+        # checked=False binds the methods without the DataUtils validators
+        DataUtils.set_checked(self, checked)
+        self.index: Dict[Label, int] = {}
+        self.labels: List[Label] = []
+        self.rows: List[bytearray] = []
+        # bytes per row, grown by doubling so adding vertices stays amortized O(n)
+        self._row_bytes = 8
+
+    @DataUtils.requires_not_null
+    def has_vertex(self, label: Label) -> bool:
+        return label in self.index
+
+    @DataUtils.requires_not_null
+    def add_vertex(self, vertex: Label):
+        if vertex in self.index:
+            print(f'Given vertex {vertex} already exists.')
+            return
+
+        if len(self.labels) == self._row_bytes * 8:
+            padding = bytes(self._row_bytes)
+            for row in self.rows:
+                row.extend(padding)
+            self._row_bytes *= 2
+
+        self.index[vertex] = len(self.labels)
+        self.labels.append(vertex)
+        self.rows.append(bytearray(self._row_bytes))
+
+    def edge_list(self) -> List[Tuple[Label, Label]]:
+        labels = self.labels
+        return [(src, dst) for src, row in zip(labels, self.rows) for dst in compress(labels, _flags(row))]
+
+    def vertex_list(self) -> List[Label]:
+        return list(self.labels)
+
+    @DataUtils.requires_not_null
+    def edges(self, label: Label) -> List[Label]:
+        src = self.index.get(label)
+        if src is None:
+            return []
+        return list(compress(self.labels, _flags(self.rows[src])))
+
+    def has_edge(self, src: Label, dst: Label) -> bool:
+        src_id, dst_id = self.index.get(src), self.index.get(dst)
+        if src_id is None or dst_id is None:
+            return False
+        return self.rows[src_id][dst_id >> 3] >> (dst_id & 7) & 1 == 1
+
+    @DataUtils.requires_not_null
+    def add_edge(self, src: Label, dst: Label):
+        row, dst_id = self.rows[self._vertex_id(src)], self._vertex_id(dst)
+
+        position, bit = dst_id >> 3, 1 << (dst_id & 7)
+        if row[position] & bit:
+            return False
+        row[position] |= bit
+        return True
+
+    @DataUtils.requires_not_null
+    def remove_edge(self, src: Label, dst: Label):
+        row, dst_id = self.rows[self._vertex_id(src)], self._vertex_id(dst)
+
+        position, bit = dst_id >> 3, 1 << (dst_id & 7)
+        if not row[position] & bit:
+            return False
+        row[position] ^= bit
+        return True
+
+    def successor_ids(self, vertex_id: int) -> Iterable[int]:
+        # integer view used by Traversal: ids of the successors of a vertex id
+        return compress(range(len(self.labels)), _flags(self.rows[vertex_id]))
+
+    def edge_count(self) -> int:
+        return sum(int.from_bytes(row, 'little').bit_count() for row in self.rows)
+
+    def degree(self, label: Label) -> int:
+        return int.from_bytes(self.rows[self._vertex_id(label)], 'little').bit_count()
+
+    def common_neighbors(self, first: Label, second: Label) -> List[Label]:
+        # one AND over the two rows instead of a set intersection
+        shared = int.from_bytes(self.rows[self._vertex_id(first)], 'little') & \
+            int.from_bytes(self.rows[self._vertex_id(second)], 'little')
+        return list(compress(self.labels, _flags(shared.to_bytes(self._row_bytes, 'little'))))
+
+    def print(self):
+        for label in self.labels:
+            print(f"{label}: {self.edges(label)}")
+
+    def _vertex_id(self, label: Label) -> int:
+        vertex_id = self.index.get(label)
+        if vertex_id is None:
+            raise DataUtils.LinkedListException(f'Vertex {label} does not exist.')
+        return vertex_id
+
+# maps the '0'/'1' digits of bin() to 0/1 bytes
+_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+
+def _flags(row: bytes) -> bytes:
+    # one 0/1 byte per vertex, lowest id first, ready for itertools.compress
+    return bin(int.from_bytes(row, 'little'))[:1:-1].encode().translate(_DIGITS)
@@ -0,0 +1,208 @@
+"""
+Cooperative versions of the Traversal functions for asyncio code.
+
+bfs_async and dfs_async give the event loop a turn every yield_every
+vertices, return the vertices visited so far once the timeout passes and
+stop when the awaiting task is cancelled. The whole graph algorithms
+cannot stop halfway and run on the loop for small graphs or in an
+executor thread from offload_above edges on, raising TimeoutError past
+the timeout. Only offloaded runs time out, graphs under offload_above
+edges always run to the end. Graphs must not change while a traversal runs.
+"""
+from typing import Any, AsyncIterator, Callable, Iterator, List, NamedTuple, Optional
+from concurrent.futures import Executor
+import asyncio
+import threading
+
+from Abstract import AbstractGraph, Label
+import DataUtils
+import Traversal
+
+# vertices between two turns of the event loop
+YIELD_EVERY = 1024
+
+
+class TraversalResult(NamedTuple):
+    """
+    Vertices in visiting order. complete is False when the timeout ended
+    the traversal first.
+    """
+    vertices: List[Label]
+    complete: bool
+
+
+def _offload(graph: AbstractGraph, offload_above: Optional[int]) -> bool:
+    return offload_above is not None and graph.edge_count() >= offload_above
+
+
+def _check_yield_every(yield_every: int):
+    # the loop only gets a turn when the countdown from yield_every hits 0
+    if yield_every <= 0:
+        raise DataUtils.LinkedListException(f'yield_every must be positive, got {yield_every}')
+
+
+async def _collect(vertices: Iterator[Label], yield_every: int, timeout: Optional[float],
+                   offload: bool, executor: Optional[Executor]) -> TraversalResult:
+    """
+    Drains a traversal generator on the loop or in executor, stopping at
+    the timeout.
+    """
+
+    _check_yield_every(yield_every)
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    visited: List[Label] = []
+
+    if not offload:
+        budget = yield_every
+        for vertex in vertices:
+            visited.append(vertex)
+            budget -= 1
+            if not budget:
+                budget = yield_every
+                if deadline is not None and loop.time() >= deadline:
+                    return TraversalResult(visited, False)
+                await asyncio.sleep(0)
+        return TraversalResult(visited, True)
+
+    stop = threading.Event()
+
+    def run() -> bool:
+        for index, vertex in enumerate(vertices, 1):
+            visited.append(vertex)
+            if not index % yield_every and (stop.is_set() or (deadline is not None and loop.time() >= deadline)):
+                return False
+        return True
+
+    try:
+        complete = await loop.run_in_executor(executor, run)
+    except asyncio.CancelledError:
+        # the thread cannot be interrupted, it stops at its next check
+        stop.set()
+        raise
+    return TraversalResult(visited, complete)
+
+
+async def bfs_async(graph: AbstractGraph, start: Label, yield_every: int = YIELD_EVERY,
+                    timeout: Optional[float] = None, offload_above: Optional[int] = None,
+                    executor: Optional[Executor] = None) -> TraversalResult:
+    """
+    Traversal.bfs that cooperates with the event loop.
+
+    :param graph: Graph to traverse.
+    :type graph: AbstractGraph
+    :param start: First vertex.
+    :type start: Label
+    :param yield_every: Vertices between two turns of the loop.
+    :type yield_every: int
+    :param timeout: Seconds after which the vertices visited so far are returned.
+    :type timeout: Optional[float]
+    :param offload_above: Edge count from which the traversal runs in
+        executor, the same measure as the dijkstra async searches.
+    :type offload_above: Optional[int]
+    :param executor: Executor for offloaded runs, the loop default when None.
+    :type executor: Optional[Executor]
+    :rtype: TraversalResult
+    """
+
+    return await _collect(Traversal.bfs(graph, start), yield_every, timeout,
+                          _offload(graph, offload_above), executor)
+
+
+async def dfs_async(graph: AbstractGraph, start: Label, yield_every: int = YIELD_EVERY,
+                    timeout: Optional[float] = None, offload_above: Optional[int] = None,
+                    executor: Optional[Executor] = None) -> TraversalResult:
+    """
+    Traversal.dfs that cooperates with the event loop, see bfs_async.
+
+    :rtype: TraversalResult
+    """
+
+    return await _collect(Traversal.dfs(graph, start), yield_every, timeout,
+                          _offload(graph, offload_above), executor)
+
+
+async def traverse_async(graph: AbstractGraph, start: Label, depth_first: bool = False,
+                         yield_every: int = YIELD_EVERY) -> AsyncIterator[Label]:
+    """
+    Streams a traversal as an async generator, giving the loop a turn
+    every yield_every vertices. The consumer decides when to stop.
+
+    :param graph: Graph to traverse.
+    :type graph: AbstractGraph
+    :param start: First vertex.
+    :type start: Label
+    :param depth_first: dfs order instead of bfs.
+    :type depth_first: bool
+    :param yield_every: Vertices between two turns of the loop.
+    :type yield_every: int
+    :rtype: AsyncIterator[Label]
+    :raises LinkedListException: If yield_every is not positive.
+    """
+
+    _check_yield_every(yield_every)
+    budget = yield_every
+    for vertex in (Traversal.dfs if depth_first else Traversal.bfs)(graph, start):
+        yield vertex
+        budget -= 1
+        if not budget:
+            budget = yield_every
+            await asyncio.sleep(0)
+
+
+async def _whole_graph(function: Callable[[AbstractGraph], Any], graph: AbstractGraph,
+                       timeout: Optional[float], offload_above: Optional[int],
+                       executor: Optional[Executor]) -> Any:
+    # only the executor thread can be abandoned, a run on the loop is not
+    # bounded by timeout
+    if timeout is not None and offload_above is None:
+        raise DataUtils.LinkedListException('timeout needs offload_above, runs on the loop cannot time out')
+    if not _offload(graph, offload_above):
+        return function(graph)
+
+    loop = asyncio.get_running_loop()
+    # on timeout or cancellation the thread finishes its run in the background
+    return await asyncio.wait_for(loop.run_in_executor(executor, function, graph), timeout)
+
+
+async def topological_sort_async(graph: AbstractGraph, timeout: Optional[float] = None,
+                                 offload_above: Optional[int] = 0,
+                                 executor: Optional[Executor] = None) -> List[Label]:
+    """
+    Traversal.topological_sort, offloaded from offload_above edges on.
+
+    :rtype: List[Label]
+    :raises TimeoutError: If the offloaded run takes longer than timeout.
+    :raises LinkedListException: If timeout is given with offload_above None.
+    """
+
+    return await _whole_graph(Traversal.topological_sort, graph, timeout, offload_above, executor)
+
+
+async def strongly_connected_components_async(graph: AbstractGraph, timeout: Optional[float] = None,
+                                              offload_above: Optional[int] = 0,
+                                              executor: Optional[Executor] = None) -> List[List[Label]]:
+    """
+    Traversal.strongly_connected_components, offloaded from offload_above
+    edges on.
+
+    :rtype: List[List[Label]]
+    :raises TimeoutError: If the offloaded run takes longer than timeout.
+    :raises LinkedListException: If timeout is given with offload_above None.
+    """
+
+    return await _whole_graph(Traversal.strongly_connected_components, graph, timeout, offload_above, executor)
+
+
+async def connected_components_async(graph: AbstractGraph, timeout: Optional[float] = None,
+                                     offload_above: Optional[int] = 0,
+                                     executor: Optional[Executor] = None) -> List[List[Label]]:
+    """
+    Traversal.connected_components, offloaded from offload_above edges on.
+
+    :rtype: List[List[Label]]
+    :raises TimeoutError: If the offloaded run takes longer than timeout.
+    :raises LinkedListException: If timeout is given with offload_above None.
+    """
+
+    return await _whole_graph(Traversal.connected_components, graph, timeout, offload_above, executor)
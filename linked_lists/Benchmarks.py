@@ -0,0 +1,341 @@
+"""
+Benchmarks for the linked list and graph structures.
+
+Usage: python Benchmarks.py [name ...]
+"""
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+from collections import deque
+from contextlib import nullcontext
+from random import Random
+import sys
+import threading
+import time
+import tracemalloc
+
+from SingleLinkedList import SingleLinkedList
+from DoublyLinkedList import DoublyLinkedList
+from LinkedGraph import LinkedGraph, GraphStorage
+from AdjGraph import AdjGraph
+from NodePool import NodePool
+from Concurrent import SynchronizedGraph
+import Instrumentation
+
+T = TypeVar('T')
+
+
+class _DictLinkedListNode(Generic[T]):
+    # node layout before __slots__, kept for comparison
+    def __init__(self, item_data: T):
+        self.item: T = item_data
+        self.nextNode: Optional['_DictLinkedListNode[T]'] = None
+
+
+class _DictListNode(Generic[T]):
+    def __init__(self, item_content: Any):
+        self.nextLink = None
+        self.prevLink = None
+        self._item_content = item_content
+
+
+class _DictGraphNode(object):
+    def __init__(self, label: str):
+        self.label = label
+        self.edges = {}
+
+
+def _traced_bytes(factory: Callable[[Any], Any], count: int) -> int:
+    """
+    Returns the bytes allocated by creating count objects, not counting the
+    list holding them.
+    """
+
+    tracemalloc.start()
+    objects = [factory(None) for _ in range(count)]
+    allocated = tracemalloc.get_traced_memory()[0] - sys.getsizeof(objects)
+    tracemalloc.stop()
+
+    del objects
+    return allocated
+
+
+def memory_report(count: int = 100_000):
+    """
+    Compares per-node memory of the old __dict__ node layout with the
+    slotted node classes.
+    """
+
+    pairs = [
+        ('SingleLinkedList.LinkedListNode', _DictLinkedListNode, SingleLinkedList.LinkedListNode),
+        ('DoublyLinkedList.ListNode', _DictListNode, DoublyLinkedList.ListNode),
+        ('LinkedGraph.GraphNode', _DictGraphNode, LinkedGraph.GraphNode),
+    ]
+
+    print(f'{"node":<34} {"dict B/node":>12} {"slots B/node":>13} {"saved":>7}')
+
+    for name, before_type, after_type in pairs:
+        before = _traced_bytes(before_type, count) / count
+        after = _traced_bytes(after_type, count) / count
+        print(f'{name:<34} {before:>12.1f} {after:>13.1f} {1 - after / before:>7.0%}')
+
+
+def bench_pool(cycles: int = 200, batch: int = 5_000):
+    """
+    Times push/pop churn on a SingleLinkedList with and without a node pool.
+    """
+
+    for label, pool in (('no pool', None), ('pool', NodePool(batch))):
+        linked_list = SingleLinkedList(pool=pool)
+
+        start = time.perf_counter()
+        for _ in range(cycles):
+            for i in range(batch):
+                linked_list.push_back(i)
+            for _ in range(batch):
+                linked_list.pop_at(0)
+        elapsed = time.perf_counter() - start
+
+        print(f'{label:<8} {elapsed:.3f} s for {cycles * batch} push/pop pairs')
+
+
+def _timed(function: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def bench_deque(count: int = 50_000, lookups: int = 500):
+    """
+    Compares DoublyLinkedList with collections.deque and list on end
+    operations and on indexed access near the middle.
+    """
+
+    def queue_cycle(push: Callable[[int], None], pop: Callable[[], Any]):
+        for i in range(count):
+            push(i)
+        for _ in range(count):
+            pop()
+
+    def middle_reads(container: Any):
+        middle = len(container) // 2
+        for i in range(lookups):
+            container[middle - i % 100]
+
+    def rotations(rotate: Callable[[int], None]):
+        for i in range(lookups):
+            rotate(i % 7 - 3)
+
+    linked, queue, array = DoublyLinkedList(), deque(), []
+    rows = [
+        ('push_back + pop_front',
+         lambda: queue_cycle(linked.push_back, linked.pop_front),
+         lambda: queue_cycle(queue.append, queue.popleft),
+         lambda: queue_cycle(array.append, lambda: array.pop(0))),
+        ('push_front + pop_back',
+         lambda: queue_cycle(linked.push_front, linked.pop_back),
+         lambda: queue_cycle(queue.appendleft, queue.pop),
+         lambda: queue_cycle(lambda item: array.insert(0, item), array.pop)),
+    ]
+
+    print(f'{"operation":<24} {"linked":>9} {"deque":>9} {"list":>9}')
+    for name, *functions in rows:
+        linked_s, deque_s, list_s = (_timed(function) for function in functions)
+        print(f'{name:<24} {linked_s:>9.3f} {deque_s:>9.3f} {list_s:>9.3f}')
+
+    for i in range(count):
+        linked.push_back(i)
+        queue.append(i)
+        array.append(i)
+
+    linked_s, deque_s, list_s = (_timed(lambda c=c: middle_reads(c)) for c in (linked, queue, array))
+    print(f'{"middle index reads":<24} {linked_s:>9.3f} {deque_s:>9.3f} {list_s:>9.3f}')
+
+    linked_s = _timed(lambda: rotations(linked.rotate))
+    deque_s = _timed(lambda: rotations(queue.rotate))
+    print(f'{"rotate(-3..3)":<24} {linked_s:>9.3f} {deque_s:>9.3f} {"-":>9}')
+
+
+def bench_validation(calls: int = 500_000):
+    """
+    Measures the per-call cost of the DataUtils validators by running the
+    same operations in checked and in fast mode.
+    """
+
+    def workloads(checked: bool) -> Dict[str, Callable[[], None]]:
+        linked_list = SingleLinkedList(checked=checked)
+        linked_list.push_back(0)
+        graph = LinkedGraph(checked=checked)
+        graph.add_vertex('A')
+
+        def push_back():
+            push = linked_list.push_back
+            for i in range(calls):
+                push(i)
+
+        def getitem():
+            for _ in range(calls):
+                linked_list[0]
+
+        def has_vertex():
+            has = graph.has_vertex
+            for _ in range(calls):
+                has('A')
+
+        return {'push_back': push_back, '__getitem__': getitem, 'has_vertex': has_vertex}
+
+    checked_runs, fast_runs = workloads(True), workloads(False)
+
+    print(f'{"operation":<12} {"checked ns":>11} {"fast ns":>9} {"saved":>7}')
+    for name in checked_runs:
+        checked_ns = _timed(checked_runs[name]) / calls * 1e9
+        fast_ns = _timed(fast_runs[name]) / calls * 1e9
+        print(f'{name:<12} {checked_ns:>11.1f} {fast_ns:>9.1f} {1 - fast_ns / checked_ns:>7.0%}')
+
+
+def bench_graphs(vertices: int = 1_000, density: float = 0.3, probes: int = 200_000):
+    """
+    Runs the same dense graph workload against LinkedGraph with node and
+    compact storage and against AdjGraph:
+    building, has_edge probes, listing every vertex's edges, edge_list, and
+    the memory held by the built graph.
+    """
+
+    random = Random(0)
+    labels = [f'v{i}' for i in range(vertices)]
+    pairs = [(src, dst) for src in labels for dst in labels if random.random() < density]
+    queries = [(random.choice(labels), random.choice(labels)) for _ in range(probes)]
+
+    def workload(factory: Callable[[], Any]) -> Dict[str, float]:
+        graph = factory()
+        results: Dict[str, float] = {}
+
+        def build():
+            for label in labels:
+                graph.add_vertex(label)
+            add_edge = graph.add_edge
+            for src, dst in pairs:
+                add_edge(src, dst)
+
+        def has_edge():
+            has = graph.has_edge
+            for src, dst in queries:
+                has(src, dst)
+
+        def scan():
+            for label in labels:
+                graph.edges(label)
+
+        tracemalloc.start()
+        results['build s'] = _timed(build)
+        results['memory MB'] = tracemalloc.get_traced_memory()[0] / 1e6
+        tracemalloc.stop()
+
+        results['has_edge s'] = _timed(has_edge)
+        results['edges s'] = _timed(scan)
+        results['edge_list s'] = _timed(graph.edge_list)
+        return results
+
+    linked = workload(lambda: LinkedGraph(checked=False))
+    compact = workload(lambda: GraphStorage.create('compact', checked=False))
+    adjacency = workload(lambda: AdjGraph(checked=False))
+
+    print(f'{vertices} vertices, {len(pairs)} edges, {probes} probes')
+    print(f'{"measure":<12} {"linked":>9} {"compact":>9} {"bitset":>9}')
+    for name in linked:
+        print(f'{name:<12} {linked[name]:>9.3f} {compact[name]:>9.3f} {adjacency[name]:>9.3f}')
+
+
+def bench_concurrency(threads: int = 4, operations: int = 50_000, vertices: int = 1_000):
+    """
+    Multithreaded stress test of a LinkedGraph under mixed read/write
+    ratios. Every thread runs operations steps, an add_edge with the write
+    ratio as probability and a has_edge or neighbors query otherwise.
+    SynchronizedGraph is compared with the same graph behind one global
+    lock held for every step.
+    """
+
+    def run(graph: Any, write_ratio: float, lock: Any) -> float:
+        def worker(seed: int):
+            random = Random(seed)
+            for _ in range(operations):
+                src, dst = random.randrange(vertices), random.randrange(vertices)
+                roll = random.random()
+                with lock:
+                    if roll < write_ratio:
+                        graph.add_edge(src, dst)
+                    elif roll < (1 + write_ratio) / 2:
+                        graph.has_edge(src, dst)
+                    else:
+                        list(graph.neighbors(src))
+
+        workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+        elapsed = _timed(lambda: ([thread.start() for thread in workers], [thread.join() for thread in workers]))
+        return threads * operations / elapsed
+
+    def new_graph() -> LinkedGraph:
+        graph = LinkedGraph(checked=False)
+        for label in range(vertices):
+            graph.add_vertex(label)
+        return graph
+
+    print(f'{threads} threads x {operations} operations, {vertices} vertices')
+    print(f'{"write ratio":>11} {"global lock ops/s":>18} {"rw lock ops/s":>14}')
+    for write_ratio in (0.0, 0.01, 0.1, 0.5):
+        locked = run(new_graph(), write_ratio, threading.Lock())
+        shared = run(SynchronizedGraph(new_graph()), write_ratio, nullcontext())
+        print(f'{write_ratio:>11.2f} {locked:>18.0f} {shared:>14.0f}')
+
+
+def bench_instrumentation(calls: int = 200_000):
+    """
+    Measures the per-call cost of the Instrumentation counters. Plain
+    instances run the unmodified class, the column only shows the noise.
+    """
+
+    def workloads(instrumented: bool) -> Dict[str, Callable[[], None]]:
+        linked_list = SingleLinkedList(checked=False)
+        graph = LinkedGraph(checked=False)
+        graph.add_vertex('A')
+        if instrumented:
+            Instrumentation.instrument(linked_list)
+            Instrumentation.instrument(graph)
+
+        def push_back():
+            push = linked_list.push_back
+            for i in range(calls):
+                push(i)
+
+        def getitem():
+            for i in range(calls):
+                linked_list[i]
+
+        def has_edge():
+            has = graph.has_edge
+            for _ in range(calls):
+                has('A', 'A')
+
+        return {'push_back': push_back, '__getitem__': getitem, 'has_edge': has_edge}
+
+    plain_runs, counted_runs = workloads(False), workloads(True)
+
+    print(f'{"operation":<12} {"plain ns":>9} {"counted ns":>11}')
+    for name in plain_runs:
+        plain_ns = _timed(plain_runs[name]) / calls * 1e9
+        counted_ns = _timed(counted_runs[name]) / calls * 1e9
+        print(f'{name:<12} {plain_ns:>9.1f} {counted_ns:>11.1f}')
+
+
+BENCHMARKS: Dict[str, Callable[[], None]] = {
+    'memory': memory_report,
+    'pool': bench_pool,
+    'deque': bench_deque,
+    'validation': bench_validation,
+    'graphs': bench_graphs,
+    'concurrency': bench_concurrency,
+    'instrumentation': bench_instrumentation,
+}
+
+
+if __name__ == '__main__':
+    for name in sys.argv[1:] or BENCHMARKS:
+        print(f'== {name}')
+        BENCHMARKS[name]()
@@ -0,0 +1,129 @@
+from typing import Any, TypeAlias, Dict, List, Tuple, Optional, Iterator, KeysView
+from array import array
+from bisect import bisect_left
+from collections.abc import Set
+from LinkedGraph import GraphStorage
+import DataUtils
+
+Label: TypeAlias = str
+
+class CompactGraph(GraphStorage):
+    """
+    Storage engine of GraphStorage.create(storage='compact'). Labels are interned
+    to dense ints once and the out-edges of a vertex are one sorted
+    array('I') of destination ids, 4 bytes per edge instead of a dict entry
+    and a node reference. has_edge is a binary search, add_edge a search
+    and a memmove. edges() lists destinations in id (insertion of the
+    vertex) order rather than in edge insertion order.
+    """
+
+    def __init__(self, checked: Optional[bool] = None, reverse_index: bool = False):
+        # checked=False binds the methods without the DataUtils validators
+        DataUtils.set_checked(self, checked)
+        self.index: Dict[Label, int] = {}
+        self.labels: List[Label] = []
+        self.rows: List[array] = []
+        super().__init__(reverse_index)
+
+    @DataUtils.requires_not_null
+    def has_vertex(self, label: Label) -> bool:
+        return label in self.index
+
+    @DataUtils.requires_not_null
+    def add_vertex(self, vertex: Label):
+        if vertex in self.index:
+            print(f'Given vertex {vertex} already exists.')
+            return
+
+        self.index[vertex] = len(self.labels)
+        self.labels.append(vertex)
+        self.rows.append(array('I'))
+
+    def iter_edges(self) -> Iterator[Tuple[Label, Label]]:
+        labels = self.labels
+        for src_label, row in zip(labels, self.rows):
+            for dst_id in row:
+                yield src_label, labels[dst_id]
+
+    def vertex_list(self) -> List[Label]:
+        return list(self.labels)
+
+    def vertices(self) -> KeysView[Label]:
+        return self.index.keys()
+
+    def neighbors(self, label: Label) -> 'CompactGraph.NeighborView':
+        vertex_id = self.index.get(label)
+        return self.NeighborView(self, self.rows[vertex_id] if vertex_id is not None else array('I'))
+
+    def has_edge(self, src: Label, dst: Label) -> bool:
+        src_id, dst_id = self.index.get(src), self.index.get(dst)
+        if src_id is None or dst_id is None:
+            return False
+        row = self.rows[src_id]
+        position = bisect_left(row, dst_id)
+        return position < len(row) and row[position] == dst_id
+
+    @DataUtils.requires_not_null
+    def add_edge(self, src: Label, dst: Label):
+        row, dst_id = self.rows[self._vertex_id(src)], self._vertex_id(dst)
+
+        # edges added in id order, the common bulk load case, just append
+        if not row or row[-1] < dst_id:
+            row.append(dst_id)
+        else:
+            position = bisect_left(row, dst_id)
+            if position < len(row) and row[position] == dst_id:
+                return False
+            row.insert(position, dst_id)
+
+        self._edge_count += 1
+        if self._reverse is not None:
+            self._reverse.setdefault(dst, {})[src] = None
+        return True
+
+    def successor_ids(self, vertex_id: int) -> array:
+        # integer view used by Traversal, the row itself without a copy
+        return self.rows[vertex_id]
+
+    def print(self):
+        for label in self.labels:
+            print(f"{label}: {self.edges(label)}")
+
+    def _vertex_id(self, label: Label) -> int:
+        vertex_id = self.index.get(label)
+        if vertex_id is None:
+            raise DataUtils.LinkedListException(f'Vertex {label} does not exist.')
+        return vertex_id
+
+    class NeighborView(Set):
+        """
+        Live read-only set view of the successors of one vertex, mapping the
+        ids of its row back to labels on the fly.
+        """
+
+        __slots__ = ('_graph', '_row')
+
+        def __init__(self, graph: 'CompactGraph', row: array):
+            self._graph = graph
+            self._row = row
+
+        def __iter__(self) -> Iterator[Label]:
+            labels = self._graph.labels
+            return (labels[dst_id] for dst_id in self._row)
+
+        def __len__(self) -> int:
+            return len(self._row)
+
+        def __contains__(self, label: Any) -> bool:
+            dst_id = self._graph.index.get(label)
+            if dst_id is None:
+                return False
+            position = bisect_left(self._row, dst_id)
+            return position < len(self._row) and self._row[position] == dst_id
+
+        @classmethod
+        def _from_iterable(cls, iterable: Any) -> set:
+            return set(iterable)
+
+        def __repr__(self):
+            return f'NeighborView({list(self)})'
@@ -0,0 +1,236 @@
+"""
+Thread safe access to the graphs and linked lists.
+
+RWLock lets any number of readers in at once and writers one at a time.
+SynchronizedGraph puts one in front of an AbstractGraph and Synchronized
+does the same for any other structure, e.g. a SingleLinkedList. Lazy views
+are live and cannot be guarded once handed out, so the wrappers return
+copies of them.
+"""
+from typing import Any, Callable, Collection, Iterator, List, Tuple
+from contextlib import contextmanager
+from functools import wraps
+import threading
+
+from Abstract import AbstractGraph, Label
+
+
+class _Guard(object):
+    # reusable context manager, far cheaper per use than @contextmanager
+    __slots__ = ('_acquire', '_release')
+
+    def __init__(self, acquire: Callable[[], None], release: Callable[[], None]):
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self):
+        self._acquire()
+
+    def __exit__(self, *exc_info) -> bool:
+        self._release()
+        return False
+
+
+class RWLock(object):
+    """
+    Readers-writer lock. Readers share the lock, a writer holds it alone.
+    Waiting writers block new readers, so a steady stream of queries
+    cannot starve a writer. The lock is not reentrant: taking it again in
+    the same thread deadlocks once a writer is waiting.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writing = False
+        self._waiting_writers = 0
+        self._read_guard = _Guard(self.acquire_read, self.release_read)
+        self._write_guard = _Guard(self.acquire_write, self.release_write)
+
+    def acquire_read(self):
+        with self._condition:
+            while self._writing or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writing or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writing = True
+
+    def release_write(self):
+        with self._condition:
+            self._writing = False
+            self._condition.notify_all()
+
+    def read(self) -> _Guard:
+        # with lock.read(): shared section
+        return self._read_guard
+
+    def write(self) -> _Guard:
+        # with lock.write(): exclusive section
+        return self._write_guard
+
+
+class SynchronizedGraph(AbstractGraph):
+    """
+    AbstractGraph guarded by an RWLock. Queries run concurrently, add_vertex
+    and add_edge wait for the readers to leave. Use batch() to apply many
+    changes under one write lock and read() to run several queries, e.g. a
+    traversal, against one consistent state.
+
+    Attributes:
+        graph (AbstractGraph): The wrapped graph, only safe to touch inside
+            read() or batch().
+        lock (RWLock): The lock guarding it.
+    """
+
+    def __init__(self, graph: AbstractGraph):
+        self.graph = graph
+        self.lock = RWLock()
+
+    @contextmanager
+    def read(self) -> Iterator[AbstractGraph]:
+        with self.lock.read():
+            yield self.graph
+
+    @contextmanager
+    def batch(self) -> Iterator[AbstractGraph]:
+        with self.lock.write():
+            yield self.graph
+
+    def has_vertex(self, label: Label) -> bool:
+        with self.lock.read():
+            return self.graph.has_vertex(label)
+
+    def add_vertex(self, label: Label):
+        with self.lock.write():
+            return self.graph.add_vertex(label)
+
+    def add_edge(self, src: Label, dst: Label):
+        with self.lock.write():
+            return self.graph.add_edge(src, dst)
+
+    def has_edge(self, src: Label, dst: Label) -> bool:
+        with self.lock.read():
+            return self.graph.has_edge(src, dst)
+
+    def edges(self, label: Label) -> List[Label]:
+        with self.lock.read():
+            return self.graph.edges(label)
+
+    def neighbors(self, label: Label) -> List[Label]:
+        # a copy, a live view could change under the caller
+        with self.lock.read():
+            return list(self.graph.neighbors(label))
+
+    def vertex_list(self) -> List[Label]:
+        with self.lock.read():
+            return self.graph.vertex_list()
+
+    def vertices(self) -> List[Label]:
+        return self.vertex_list()
+
+    def edge_list(self) -> List[Tuple[Label, Label]]:
+        with self.lock.read():
+            return self.graph.edge_list()
+
+    def iter_edges(self) -> Iterator[Tuple[Label, Label]]:
+        # iterates a copy taken under the lock, not the live graph
+        return iter(self.edge_list())
+
+    def edge_count(self) -> int:
+        with self.lock.read():
+            return self.graph.edge_count()
+
+
+class Synchronized(object):
+    """
+    Proxy guarding any structure with an RWLock. Methods named in reads,
+    dunders included, run under the read lock and every other method under
+    the write lock, so an unlisted method is always safe, just not
+    concurrent. A method that updates a cache, like the finger of
+    SingleLinkedList.__getitem__, is not a read. Iteration walks a copy.
+
+    Attributes:
+        target (Any): The wrapped structure.
+        lock (RWLock): The lock guarding it.
+    """
+
+    def __init__(self, target: Any, reads: Collection[str] = ()):
+        """
+        Wraps a structure.
+
+        :param target: Structure to guard.
+        :type target: Any
+        :param reads: Names of the methods that do not modify it.
+        :type reads: Collection[str]
+        """
+
+        self.target = target
+        self.lock = RWLock()
+        self._reads = frozenset(reads)
+
+    def _guard(self, name: str) -> Callable[[], Any]:
+        return self.lock.read if name in self._reads else self.lock.write
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.target, name)
+        if not callable(attribute):
+            return attribute
+
+        guard = self._guard(name)
+
+        @wraps(attribute)
+        def guarded(*args, **kwargs) -> Any:
+            with guard():
+                return attribute(*args, **kwargs)
+        return guarded
+
+    def __len__(self) -> int:
+        with self._guard('__len__')():
+            return len(self.target)
+
+    def __contains__(self, item: Any) -> bool:
+        with self._guard('__contains__')():
+            return item in self.target
+
+    def __getitem__(self, index: Any) -> Any:
+        with self._guard('__getitem__')():
+            return self.target[index]
+
+    def __setitem__(self, index: Any, value: Any):
+        with self.lock.write():
+            self.target[index] = value
+
+    def __delitem__(self, index: Any):
+        with self.lock.write():
+            del self.target[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._guard('__iter__')():
+            return iter(list(self.target))
+
+    @contextmanager
+    def read(self) -> Iterator[Any]:
+        with self.lock.read():
+            yield self.target
+
+    @contextmanager
+    def batch(self) -> Iterator[Any]:
+        with self.lock.write():
+            yield self.target
+
+
+# methods of the linked lists that change neither the list nor its caches
+SINGLE_LIST_READS = frozenset({'__len__', '__iter__', '__contains__', 'is_empty', 'to_list', 'find_by_value'})
+DOUBLY_LIST_READS = frozenset({'__len__', '__iter__', '__contains__', '__getitem__', 'is_empty', 'to_list'})
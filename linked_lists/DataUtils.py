@@ -1,5 +1,15 @@
 from typing import Callable, Any
 from functools import wraps
+import os
+import sys
+
+# modules shared by linked_lists and dijkstra live in the repository root,
+# appended last so that this package's own modules keep precedence
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from modes import set_checked_mode, unchecked, set_checked, is_checked, base_class
 
 class LinkedListException(Exception):
     def __init__(self, error_message: str):
@@ -12,6 +22,7 @@ def requires_non_empty(function: Callable[[Any], None]):
         if self.is_empty():
             raise LinkedListException('Given operation requires size at least greater than 0.')
         return function(*args, **kwargs)
+    wrapper.__validator__ = True
     return wrapper
 
 def requires_not_null(function: Callable[[Any], None]):
@@ -19,6 +30,7 @@ def requires_not_null(function: Callable[[Any], None]):
     def wrapper(*args, **kwargs) -> Any:
         for x in args:
             if x is None:
-                raise LinkedListException('Argument {x} cannot be null.')
+                raise LinkedListException(f'Argument {x} cannot be null.')
         return function(*args, **kwargs)
-    return wrapper
\ No newline at end of file
+    wrapper.__validator__ = True
+    return wrapper
@@ -1,47 +1,122 @@
-from typing import Optional, TypeVar, Any, Generic, Iterator, Union
+from typing import Optional, TypeVar, Any, Generic, Iterator, Union, List
 import DataUtils
+from NodePool import NodePool
 
 T = TypeVar('T')
 
 class DoublyLinkedList(Generic[T]):
+    """
+    Doubly linked list usable as a deque: O(1) pushes and pops on both ends,
+    indexed access walks from whichever end is closer.
+
+    Inserts return the created ListNode. The node stays valid as a handle
+    until it is removed, and remove_node/move_to_front/move_to_back work on
+    it in O(1).
+
+    Attributes:
+        head (Optional[ListNode]): first node of the list.
+        tail (Optional[ListNode]): last node of the list.
+        _size int: Number of elements in the list.
+        _pool (Optional[NodePool]): freelist removed nodes are recycled through.
+    """
+
     # container
-    class ListNode(Generic[T]):
+    class ListNode:
+        __slots__ = ('nextLink', 'prevLink', '_item_content')
+
         def __init__(self, item_content: Any):
             self.nextLink: Optional['ListNode[T]'] = None
             self.prevLink: Optional['ListNode[T]'] = None
             self._item_content = item_content # "Ahoj Iga"
 
-    def __init__(self):
+        @property
+        def item(self) -> Any:
+            return self._item_content
+
+    def __init__(self, pool: Optional[NodePool] = None, checked: Optional[bool] = None):
+        """
+        Initializes empty DoublyLinkedList.
+
+        :param pool: Freelist to recycle removed nodes through.
+        :type pool: Optional[NodePool]
+        :param checked: Validate arguments (checked mode) or bind the undecorated
+            methods (fast mode), modes.checked_mode when None.
+        :type checked: Optional[bool]
+        """
+
+        DataUtils.set_checked(self, checked)
+
         self.head: Optional[ListNode[T]] = None
         self.tail: Optional[ListNode[T]] = None
 
         self._size = 0
+        self._pool: Optional[NodePool] = pool
+
+    def __repr__(self) -> str:
+        return ' <-> '.join(str(x) for x in self)
 
     def __iter__(self) -> Iterator:
         current = self.head
-        
+
         while current:
             yield current._item_content
             current = current.nextLink
 
     @DataUtils.requires_not_null
     def __getitem__(self, data: Union[int, slice, None]) -> T:
+        """
+        Returns the item at an index, or a list of items for a slice.
+        Negative indexes count from the end.
+
+        :param data: Index or slice.
+        :type data: Union[int, slice]
+        :rtype: T
+        :raises LinkedListException: If the index is out of range.
+        """
+
         # get either index or a range (slice)
         if isinstance(data, int):
-            current = self.head
-            for _ in range(len(data)):
-                current = current.nextLink
-            return current._item_content
+            return self._node_at(data)._item_content
 
         elif isinstance(data, slice):
-            data = []
-            pass
+            start, stop, step = data.indices(self._size)
+            indexes = range(start, stop, step)
+            if not indexes:
+                return []
 
+            current = self._node_at(indexes[0])
+            result = [current._item_content]
+            forward = step > 0
+
+            for _ in range(len(indexes) - 1):
+                for _ in range(abs(step)):
+                    current = current.nextLink if forward else current.prevLink
+                result.append(current._item_content)
+            return result
+
+        raise DataUtils.LinkedListException('Expected int or slice.')
+
+    @DataUtils.requires_not_null
     def __setitem__(self, index: int, item: T):
-        new_node = self.ListNode(item)
+        """
+        Replaces the item at an index.
 
-        for _ in range(index):
-            pass
+        :param index: Index of the node, negative counts from the end.
+        :type index: int
+        :param item: New value.
+        :type item: T
+        :raises LinkedListException: If the index is out of range.
+        """
+        self._node_at(index)._item_content = item
+
+    def __delitem__(self, index: int):
+        """
+        Removes the item at an index.
+
+        :param index: Index of the node, negative counts from the end.
+        :type index: int
+        """
+        self._unlink(self._node_at(index))
 
     def __reversed__(self) -> Iterator:
         current = self.tail
@@ -51,36 +126,320 @@ class DoublyLinkedList(Generic[T]):
             current = current.prevLink
 
     @DataUtils.requires_not_null
-    def push_back(self, item: T):
-        new_node = self.ListNode(item)
+    def push_back(self, item: T) -> 'ListNode[T]':
+        """
+        Appends an item after the tail in O(1).
 
-        current = self.head
+        :param item: Value to append.
+        :type item: T
+        :return: Handle of the new node.
+        :rtype: ListNode[T]
+        """
 
-        if self.is_empty(self):
-            current = new_node
-            return
+        new_node = self._new_node(item)
 
-        while current.nextLink:
-            current = current.nextLink
-        current.nextLink = new_node
+        if self.tail is None:
+            self.head = new_node
+        else:
+            new_node.prevLink = self.tail
+            self.tail.nextLink = new_node
+        self.tail = new_node
 
         self._size += 1
+        return new_node
 
-    @DataUtils.requires_non_empty
-    def pop_back(self):
+    @DataUtils.requires_not_null
+    def push_front(self, item: T) -> 'ListNode[T]':
+        """
+        Prepends an item before the head in O(1).
+
+        :param item: Value to prepend.
+        :type item: T
+        :return: Handle of the new node.
+        :rtype: ListNode[T]
+        """
+
+        new_node = self._new_node(item)
 
-        # erase everything
-        if self.tail is self.head:
-            self.head = self.tail = None
+        if self.head is None:
+            self.tail = new_node
         else:
-        # tail of the list is set to 
-            self.tail = self.tail.prevLink
-            self.tail.nextLink = None
+            new_node.nextLink = self.head
+            self.head.prevLink = new_node
+        self.head = new_node
 
-        self._size -= 1
+        self._size += 1
+        return new_node
+
+    @DataUtils.requires_not_null
+    def insert_after(self, node: 'ListNode[T]', item: T) -> 'ListNode[T]':
+        """
+        Inserts an item right after a node of this list in O(1).
+
+        :param node: Handle of the node to insert after.
+        :type node: ListNode[T]
+        :param item: Value to insert.
+        :type item: T
+        :return: Handle of the new node.
+        :rtype: ListNode[T]
+        """
+
+        self._check_handle(node)
+
+        if node is self.tail:
+            return self.push_back(item)
+
+        new_node = self._new_node(item)
+        self._link_before(node.nextLink, new_node)
+        return new_node
+
+    @DataUtils.requires_not_null
+    def insert_before(self, node: 'ListNode[T]', item: T) -> 'ListNode[T]':
+        """
+        Inserts an item right before a node of this list in O(1).
+
+        :param node: Handle of the node to insert before.
+        :type node: ListNode[T]
+        :param item: Value to insert.
+        :type item: T
+        :return: Handle of the new node.
+        :rtype: ListNode[T]
+        """
+
+        self._check_handle(node)
+
+        if node is self.head:
+            return self.push_front(item)
+
+        new_node = self._new_node(item)
+        self._link_before(node, new_node)
+        return new_node
+
+    @DataUtils.requires_not_null
+    def remove_node(self, node: 'ListNode[T]') -> T:
+        """
+        Removes a node of this list in O(1). The handle is invalid afterwards.
+
+        :param node: Handle of the node to remove.
+        :type node: ListNode[T]
+        :return: Value of the removed node.
+        :rtype: T
+        """
+
+        self._check_handle(node)
+        return self._unlink(node)
+
+    @DataUtils.requires_not_null
+    def move_to_front(self, node: 'ListNode[T]'):
+        """
+        Moves a node of this list to the head in O(1), keeping the handle valid.
+
+        :param node: Handle of the node to move.
+        :type node: ListNode[T]
+        """
+
+        self._check_handle(node)
+
+        if node is self.head:
+            return
+
+        self._detach(node)
+        node.nextLink = self.head
+        self.head.prevLink = node
+        self.head = node
+
+    @DataUtils.requires_not_null
+    def move_to_back(self, node: 'ListNode[T]'):
+        """
+        Moves a node of this list to the tail in O(1), keeping the handle valid.
+
+        :param node: Handle of the node to move.
+        :type node: ListNode[T]
+        """
+
+        self._check_handle(node)
+
+        if node is self.tail:
+            return
+
+        self._detach(node)
+        node.prevLink = self.tail
+        self.tail.nextLink = node
+        self.tail = node
+
+    @DataUtils.requires_non_empty
+    def pop_back(self) -> T:
+        """
+        Removes the tail in O(1).
+
+        :return: Value of the removed node.
+        :rtype: T
+        :raises LinkedListException: If the list is empty.
+        """
+        return self._unlink(self.tail)
+
+    @DataUtils.requires_non_empty
+    def pop_front(self) -> T:
+        """
+        Removes the head in O(1).
+
+        :return: Value of the removed node.
+        :rtype: T
+        :raises LinkedListException: If the list is empty.
+        """
+        return self._unlink(self.head)
+
+    def rotate(self, steps: int = 1):
+        """
+        Rotates the list steps to the right, negative steps rotate left,
+        same as collections.deque.rotate. Only the end links are rewired.
+
+        :param steps: Number of positions to rotate.
+        :type steps: int
+        """
+
+        if self._size < 2:
+            return
+
+        steps %= self._size
+        if steps == 0:
+            return
+
+        new_head = self._node_at(self._size - steps)
+        new_tail = new_head.prevLink
+
+        # close the ring, then cut it in front of the new head
+        self.tail.nextLink = self.head
+        self.head.prevLink = self.tail
+
+        new_tail.nextLink = None
+        new_head.prevLink = None
+        self.head = new_head
+        self.tail = new_tail
+
+    def clear(self):
+        """
+        Removes all elements from the list.
+        """
+
+        if self._pool is not None:
+            current = self.head
+            while current and len(self._pool) < self._pool.capacity:
+                next_node = current.nextLink
+                self._release_node(current)
+                current = next_node
+
+        self.head = self.tail = None
+        self._size = 0
+
+    def to_list(self) -> List[T]:
+        return list(self)
 
     def __len__(self) -> int:
         return self._size
 
     def is_empty(self) -> bool:
-        return self._size == 0
\ No newline at end of file
+        return self._size == 0
+
+    def _node_at(self, index: int) -> 'ListNode[T]':
+        """
+        Returns the node at index, walking from the closer end.
+
+        :param index: Index of the node, negative counts from the end.
+        :type index: int
+        :rtype: ListNode[T]
+        :raises LinkedListException: If the index is out of range.
+        """
+
+        if index < 0:
+            index += self._size
+
+        if index >= self._size or index < 0:
+            raise DataUtils.LinkedListException(f'Invalid index, expected 0-{self._size}, got {index}')
+
+        if index <= self._size // 2:
+            current = self.head
+            for _ in range(index):
+                current = current.nextLink
+        else:
+            current = self.tail
+            for _ in range(self._size - 1 - index):
+                current = current.prevLink
+        return current
+
+    def _check_handle(self, node: 'ListNode[T]'):
+        """
+        Rejects nodes that are detached. Only the cheap O(1) checks are done,
+        a node of another list is not detected.
+
+        :raises LinkedListException: If the node is not linked into a list.
+        """
+
+        if not isinstance(node, self.ListNode) or (
+                node.prevLink is None and node is not self.head) or (
+                node.nextLink is None and node is not self.tail):
+            raise DataUtils.LinkedListException('Given node is not part of this list.')
+
+    def _link_before(self, next_node: 'ListNode[T]', new_node: 'ListNode[T]'):
+        """
+        Links a detached node in front of a node that is not the head.
+        """
+
+        prev_node = next_node.prevLink
+        new_node.prevLink = prev_node
+        new_node.nextLink = next_node
+        prev_node.nextLink = new_node
+        next_node.prevLink = new_node
+
+        self._size += 1
+
+    def _detach(self, node: 'ListNode[T]'):
+        """
+        Unhooks a node from its neighbours and the ends, leaving _size as is.
+        """
+
+        prev_node, next_node = node.prevLink, node.nextLink
+
+        if prev_node is None:
+            self.head = next_node
+        else:
+            prev_node.nextLink = next_node
+
+        if next_node is None:
+            self.tail = prev_node
+        else:
+            next_node.prevLink = prev_node
+
+        node.prevLink = node.nextLink = None
+
+    def _unlink(self, node: 'ListNode[T]') -> T:
+        """
+        Removes a node of this list in O(1).
+
+        :param node: Node to remove.
+        :type node: ListNode[T]
+        :return: Value of the removed node.
+        :rtype: T
+        """
+
+        self._detach(node)
+        self._size -= 1
+
+        item = node._item_content
+        if self._pool is not None:
+            self._release_node(node)
+        return item
+
+    def _new_node(self, item: T) -> 'ListNode[T]':
+        node = self._pool.acquire() if self._pool is not None else None
+
+        if node is None:
+            return self.ListNode(item)
+
+        node._item_content = item
+        return node
+
+    def _release_node(self, node: 'ListNode[T]'):
+        node._item_content = None
+        node.prevLink = node.nextLink = None
+        self._pool.release(node)
@@ -0,0 +1,163 @@
+"""
+Opt-in operation counters for the linked lists and graphs.
+
+instrument() switches an instance to a subclass whose public methods
+count their calls, nodes visited and wall time, the same way
+DataUtils.set_checked switches to the unchecked methods. The switching
+and the Metrics live in the shared counters module, this module keeps
+the profiles of the linked_lists classes. Instances that are not
+instrumented run the plain methods and pay nothing. Instances sharing
+one Metrics add up per structure name.
+
+    metrics = Instrumentation.instrument(linked_list)
+    ...
+    print(metrics.prometheus())
+
+visited counts the nodes stepped over by index walks and value scans and
+the edges scanned by graph queries without a reverse index. A method
+called by another instrumented method is counted on its own and inside
+its caller. set_checked keeps an instance instrumented. Not thread
+safe: updates of a shared Metrics from several threads may be lost.
+"""
+from typing import Any, Callable, Dict, Optional
+
+import DataUtils
+from SingleLinkedList import SingleLinkedList
+from DoublyLinkedList import DoublyLinkedList
+from LinkedGraph import GraphStorage
+import counters
+from counters import OperationStats, Profile, uninstrument, is_instrumented, metrics_of
+
+
+class Metrics(counters.Metrics):
+    """
+    counters.Metrics exported under the linked_lists prefix.
+    """
+
+    prefix = 'linked_lists'
+    visited_series = ('nodes_visited_total', 'Nodes or edges walked per structure and operation.')
+
+
+def _single_list_walks(base: type) -> Dict[str, Callable[..., Any]]:
+    # the walks of SingleLinkedList, counted into _visited
+    node_at, find_by_value = base._node_at, base.find_by_value
+
+    def counted_node_at(self, index: int):
+        finger_index = self._finger_index
+        if index == self._size - 1:
+            steps = 0
+        elif 0 <= finger_index <= index:
+            steps = index - finger_index
+        else:
+            steps = index
+        self._visited += steps
+        return node_at(self, index)
+
+    def counted_find_by_value(self, value: Any) -> Optional[int]:
+        index = find_by_value(self, value)
+        if index is not None:
+            self._visited += index + 1
+        elif self._counts is None or value in self._counts:
+            self._visited += self._size
+        return index
+
+    return {'_node_at': counted_node_at, 'find_by_value': counted_find_by_value}
+
+
+def _doubly_list_walks(base: type) -> Dict[str, Callable[..., Any]]:
+    # the walks of DoublyLinkedList, counted into _visited
+    node_at = base._node_at
+
+    def counted_node_at(self, index: int):
+        position = index + self._size if index < 0 else index
+        if 0 <= position < self._size:
+            self._visited += position if position <= self._size // 2 else self._size - 1 - position
+        return node_at(self, index)
+
+    return {'_node_at': counted_node_at}
+
+
+def _list_size(instance: Any, *args) -> int:
+    return instance._size
+
+
+def _slice_size(instance: Any, data: Any = None, *args) -> int:
+    # a slice walks from the head up to its stop, an index is left to _node_at
+    return data.indices(instance._size)[1] if isinstance(data, slice) else 0
+
+
+def _edge_scan(instance: Any, *args) -> int:
+    # without the reverse index predecessors and in_degree scan every edge
+    return instance._edge_count if instance._reverse is None else 0
+
+
+def _all_edges(instance: Any, *args) -> int:
+    return instance._edge_count
+
+
+def _all_vertices(instance: Any, *args) -> int:
+    return len(instance.vertices())
+
+
+PROFILES: Dict[type, Profile] = {
+    SingleLinkedList: Profile(
+        ('__getitem__', '__setitem__', '__delitem__', '__contains__', '__eq__', 'at', 'cursor',
+         'find_by_value', 'push_back', 'insert_at', 'pop_back', 'pop_at', 'extend',
+         'extend_from_iterable', 'insert_many', 'splice', 'sort', 'merge_sorted', 'copy',
+         'reverse', 'clear', 'to_list'),
+        {'__getitem__': _slice_size, '__eq__': _list_size, 'sort': _list_size, 'copy': _list_size,
+         'reverse': _list_size, 'to_list': _list_size},
+        _single_list_walks),
+    DoublyLinkedList: Profile(
+        ('__getitem__', '__setitem__', '__delitem__', 'push_back', 'push_front', 'insert_after',
+         'insert_before', 'remove_node', 'move_to_front', 'move_to_back', 'pop_back', 'pop_front',
+         'rotate', 'clear', 'to_list'),
+        {'to_list': _list_size},
+        _doubly_list_walks),
+    GraphStorage: Profile(
+        ('has_vertex', 'add_vertex', 'has_edge', 'add_edge', 'neighbors', 'edges', 'vertex_list',
+         'edge_list', 'predecessors', 'in_degree', 'out_degree'),
+        {'predecessors': _edge_scan, 'in_degree': _edge_scan, 'edge_list': _all_edges,
+         'vertex_list': _all_vertices}),
+}
+
+
+def _profile(cls: type) -> Profile:
+    profile = next((PROFILES[klass] for klass in cls.__mro__ if klass in PROFILES), None)
+    if profile is None:
+        raise DataUtils.LinkedListException(f'{cls.__name__} has no instrumentation profile.')
+    return profile
+
+
+def instrumented(cls: type) -> type:
+    """
+    Returns a subclass of cls counting the operations of its profile,
+    created once per class. Works for the checked and the unchecked
+    variant of a class alike.
+
+    :param cls: One of the PROFILES classes or a subclass of one.
+    :type cls: type
+    :rtype: type
+    :raises LinkedListException: If no profile covers cls.
+    """
+
+    return counters.instrumented(cls, _profile(cls))
+
+
+def instrument(instance: Any, metrics: Optional[Metrics] = None, name: Optional[str] = None) -> Metrics:
+    """
+    Starts counting the operations of an instance.
+
+    :param instance: SingleLinkedList, DoublyLinkedList, LinkedGraph or CompactGraph.
+    :type instance: Any
+    :param metrics: Counters to add to, a new Metrics when None and the
+        instance is not instrumented yet.
+    :type metrics: Optional[Metrics]
+    :param name: Structure name in the counters, the class name when None.
+    :type name: Optional[str]
+    :return: The counters of the instance.
+    :rtype: Metrics
+    :raises LinkedListException: If the class cannot be instrumented.
+    """
+
+    return counters.instrument(instance, _profile(type(instance)), metrics, name, Metrics)
@@ -0,0 +1,239 @@
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
+from functools import wraps
+import sys
+
+from DoublyLinkedList import DoublyLinkedList
+import DataUtils
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+_MISSING = object()
+
+# separates positional from keyword arguments in memoize keys, so f(1, a=1)
+# and f((1,), (('a', 1),)) cannot share an entry
+_KWARGS_MARK = object()
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Least recently used cache built from a dict of node handles and a
+    DoublyLinkedList kept in recency order, most recent at the head.
+    Lookups, inserts and evictions are O(1).
+
+    Attributes:
+        capacity (Optional[int]): Maximum number of entries, None for no limit.
+        max_bytes (Optional[int]): Maximum total entry size, None for no limit.
+        hits int: Number of lookups that found their key.
+        misses int: Number of lookups that did not.
+        evictions int: Number of entries dropped to respect the limits.
+    """
+
+    def __init__(self, capacity: Optional[int] = 128, max_bytes: Optional[int] = None,
+                 sizeof: Callable[[Any], int] = sys.getsizeof,
+                 on_evict: Optional[Callable[[K, V], None]] = None):
+        """
+        Initializes an empty cache.
+
+        :param capacity: Maximum number of entries, None for no limit.
+        :type capacity: Optional[int]
+        :param max_bytes: Maximum sum of entry sizes, None for no limit.
+        :type max_bytes: Optional[int]
+        :param sizeof: Returns the size of a value, used with max_bytes.
+        :type sizeof: Callable[[Any], int]
+        :param on_evict: Called with key and value of every evicted entry.
+        :type on_evict: Optional[Callable[[K, V], None]]
+        """
+
+        if capacity is not None and capacity <= 0:
+            raise DataUtils.LinkedListException(f'Capacity must be positive, got {capacity}')
+
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._sizeof = sizeof
+        self._on_evict = on_evict
+        self._bytes = 0
+        # node items are (key, value, size) tuples
+        self._entries: Dict[K, DoublyLinkedList.ListNode] = {}
+        # keys and handles come from this class only, so no validation is needed
+        self._order: DoublyLinkedList = DoublyLinkedList(checked=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        """
+        Checks for a key without touching its recency or the counters.
+
+        :rtype: bool
+        """
+        return key in self._entries
+
+    def __getitem__(self, key: K) -> V:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: K, value: V):
+        self.put(key, value)
+
+    def __delitem__(self, key: K):
+        if self.pop(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """
+        Returns the value of a key and marks it as most recently used.
+
+        :param key: Key to look up.
+        :type key: K
+        :param default: Returned when the key is not cached.
+        :type default: Any
+        :rtype: Any
+        """
+
+        node = self._entries.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._order.move_to_front(node)
+        return node.item[1]
+
+    def put(self, key: K, value: V):
+        """
+        Stores a value as most recently used and evicts the least recently
+        used entries until the limits hold again. A value that alone exceeds
+        max_bytes is not stored.
+
+        :param key: Key to store under.
+        :type key: K
+        :param value: Value to store.
+        :type value: V
+        """
+
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= self._order.remove_node(old)[2]
+
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        self._entries[key] = self._order.push_front((key, value, size))
+        self._bytes += size
+
+        while (self.capacity is not None and len(self._entries) > self.capacity) or (
+                self.max_bytes is not None and self._bytes > self.max_bytes):
+            self._evict()
+
+    def pop(self, key: K, default: Any = None) -> Any:
+        """
+        Removes a key without calling on_evict.
+
+        :param key: Key to remove.
+        :type key: K
+        :param default: Returned when the key is not cached.
+        :type default: Any
+        :return: The removed value, or default.
+        :rtype: Any
+        """
+
+        node = self._entries.pop(key, None)
+        if node is None:
+            return default
+
+        _, value, size = self._order.remove_node(node)
+        self._bytes -= size
+        return value
+
+    def clear(self):
+        """
+        Drops all entries without calling on_evict. Counters are kept.
+        """
+
+        self._entries.clear()
+        self._order.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the counters and current usage.
+
+        :rtype: Dict[str, Any]
+        """
+
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+        }
+
+    def memoize(self, function: Callable[..., V]) -> Callable[..., V]:
+        """
+        Decorates a function so its results are cached here, keyed by the
+        call arguments, which must be hashable.
+
+        :param function: Function to cache.
+        :type function: Callable[..., V]
+        :rtype: Callable[..., V]
+        """
+
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> V:
+            key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+            result = self.get(key, _MISSING)
+            if result is _MISSING:
+                result = function(*args, **kwargs)
+                self.put(key, result)
+            return result
+
+        wrapper.cache = self
+        return wrapper
+
+    def _evict(self):
+        """
+        Drops the least recently used entry.
+        """
+
+        key, value, size = self._order.pop_back()
+        del self._entries[key]
+        self._bytes -= size
+        self.evictions += 1
+
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+
+def memoize(capacity: Optional[int] = 128, max_bytes: Optional[int] = None,
+            sizeof: Callable[[Any], int] = sys.getsizeof,
+            on_evict: Optional[Callable[[Any, Any], None]] = None) -> Callable[[Callable[..., V]], Callable[..., V]]:
+    """
+    Decorator factory caching a function in its own LRUCache, reachable as
+    the cache attribute of the decorated function.
+
+    :param capacity: Maximum number of cached results.
+    :type capacity: Optional[int]
+    :param max_bytes: Maximum sum of result sizes.
+    :type max_bytes: Optional[int]
+    :param sizeof: Returns the size of a result.
+    :type sizeof: Callable[[Any], int]
+    :param on_evict: Called with key and result of every evicted entry.
+    :type on_evict: Optional[Callable[[Any, Any], None]]
+    """
+
+    def decorator(function: Callable[..., V]) -> Callable[..., V]:
+        return LRUCache(capacity, max_bytes, sizeof, on_evict).memoize(function)
+    return decorator
+
@@ -1,18 +1,108 @@
-from typing import Any, TypeAlias, Dict, List, Tuple
+from typing import Any, TypeAlias, Dict, List, Tuple, Optional, Iterable, Iterator, KeysView
 from Abstract import AbstractGraph
 import DataUtils
 
 Label: TypeAlias = str
 NodeDict: TypeAlias = Dict[Label, 'LinkedGraph.GraphNode']
 
-class LinkedGraph(AbstractGraph):
+# storage engines selectable through GraphStorage.create(storage=...)
+STORAGES = ('nodes', 'compact')
+
+# neighbors() of an unknown vertex
+_NO_EDGES: KeysView[Label] = {}.keys()
+
+class GraphStorage(AbstractGraph):
+    """
+    State and queries shared by the storage engines of LinkedGraph: the
+    edge count and the optional reverse index, both kept up to date by the
+    add_edge of each engine, and everything answered from iter_edges and
+    neighbors(). create() picks an engine by name.
+    """
+
+    def __init__(self, reverse_index: bool = False):
+        self._edge_count = 0
+        self._reverse: Optional[Dict[Label, Dict[Label, None]]] = None
+        if reverse_index:
+            self.enable_reverse_index()
+
+    @staticmethod
+    def create(storage: str = 'nodes', checked: Optional[bool] = None,
+               reverse_index: bool = False) -> 'GraphStorage':
+        """
+        Creates an empty graph with the given storage engine: 'nodes' for
+        LinkedGraph, 'compact' for the int-indexed CompactGraph.
+
+        :param storage: One of STORAGES.
+        :type storage: str
+        :param checked: Mode of the graph, modes.checked_mode when None.
+        :type checked: Optional[bool]
+        :param reverse_index: Maintain the reverse index from the start.
+        :type reverse_index: bool
+        :rtype: GraphStorage
+        :raises LinkedListException: If storage is unknown.
+        """
+
+        if storage not in STORAGES:
+            raise DataUtils.LinkedListException(f'Unknown storage {storage}, expected one of {STORAGES}.')
+        if storage == 'compact':
+            from CompactGraph import CompactGraph
+            return CompactGraph(checked, reverse_index)
+        return LinkedGraph(checked, reverse_index)
+
+    def edge_list(self) -> List[Tuple[Label, Label]]:
+        # compatibility wrapper, iter_edges() or edge_view() avoid the copy
+        return list(self.iter_edges())
+
+    def edge_count(self) -> int:
+        return self._edge_count
+
+    @DataUtils.requires_not_null
+    def edges(self, label: Label) -> List[Label]:
+        # compatibility wrapper, neighbors() avoids the copy
+        return list(self.neighbors(label))
+
+    def enable_reverse_index(self):
+        # dst -> {src: None} kept up to date by add_edge, built once here
+        # from the current edges; dict keys keep the edge insertion order
+        if self._reverse is not None:
+            return
+        self._reverse = {}
+        for src, dst in self.iter_edges():
+            self._reverse.setdefault(dst, {})[src] = None
+
+    def has_reverse_index(self) -> bool:
+        return self._reverse is not None
+
+    def predecessors(self, label: Label) -> Iterable[Label]:
+        # live keys view with the reverse index, otherwise a scan of all edges;
+        # a vertex added after the call is not followed by the view
+        if self._reverse is not None:
+            if label not in self.vertices():
+                return _NO_EDGES
+            return self._reverse.setdefault(label, {}).keys()
+        return [src for src, dst in self.iter_edges() if dst == label]
+
+    def in_degree(self, label: Label) -> int:
+        if self._reverse is not None:
+            return len(self._reverse.get(label, ()))
+        return sum(1 for _, dst in self.iter_edges() if dst == label)
+
+    def out_degree(self, label: Label) -> int:
+        return len(self.neighbors(label))
+
+class LinkedGraph(GraphStorage):
     class GraphNode(object):
+        __slots__ = ('label', 'edges')
+
         def __init__(self, label: Label):
             self.label = label
             self.edges = {}
 
-    def __init__(self):
+    def __init__(self, checked: Optional[bool] = None, reverse_index: bool = False):
+        # checked=False binds the methods without the DataUtils validators
+        DataUtils.set_checked(self, checked)
         self.node_dict: NodeDict = {}
+        super().__init__(reverse_index)
 
     @DataUtils.requires_not_null
     def has_vertex(self, label: Label) -> bool:
@@ -20,29 +110,29 @@ class LinkedGraph(AbstractGraph):
 
     @DataUtils.requires_not_null
     def add_vertex(self, vertex: Label):
-        if self.has_vertex(vertex):
+        if vertex in self.node_dict:
             print(f'Given vertex {vertex} already exists.')
             return
 
         new_node = self.GraphNode(vertex)
         self.node_dict[vertex] = new_node
 
-    def edge_list(self) -> List[Tuple[Label, Label]]:
-        edges = []
+    def iter_edges(self) -> Iterator[Tuple[Label, Label]]:
         for src_label, node in self.node_dict.items():
             for dst_label in node.edges:
-                edges.append((src_label, dst_label))
-        return edges
+                yield src_label, dst_label
 
     def vertex_list(self) -> List[Label]:
+        # compatibility wrapper, vertices() avoids the copy
         return list(self.node_dict.keys())
 
-    @DataUtils.requires_not_null
-    def edges(self, label: Label) -> List[Label]:
+    def vertices(self) -> KeysView[Label]:
+        return self.node_dict.keys()
+
+    def neighbors(self, label: Label) -> KeysView[Label]:
+        # live read-only keys view: iteration, len, in and set operators
         node = self.node_dict.get(label)
-        if not node:
-            return []
-        return list(node.edges.keys())
+        return node.edges.keys() if node else _NO_EDGES
 
     def has_edge(self, src: Label, dst: Label) -> bool:
         src_node = self.node_dict.get(src)
@@ -55,6 +145,9 @@ class LinkedGraph(AbstractGraph):
 
         if not dst in src_node.edges:
             src_node.edges[dst] = dst_node
+            self._edge_count += 1
+            if self._reverse is not None:
+                self._reverse.setdefault(dst, {})[src] = None
             return True
         return False
 
@@ -63,36 +156,39 @@ class LinkedGraph(AbstractGraph):
             edges = [label for label in node.edges]
             print(f"{label}: {edges}")
 
-# jeden z grafů
-g = LinkedGraph()
-# g = AdjGraph()
-
-print(g.has_vertex('A'))
-print(g.add_vertex('A'))
-print(g.has_vertex('A'))
-print(g.add_vertex('A'))
-print(g.has_vertex('A'))
-print(g.add_vertex('B'))
-print()
-
-print(g.has_edge('A','B'))
-print(g.add_edge('A','B'))
-print(g.has_edge('A','B'))
-print(g.add_edge('A','B'))
-print(g.has_edge('A','B'))
-print()
-print(g.add_edge('B','A'))
-print(g.add_edge('B','A'))
-
-g.add_vertex('C')
-g.add_edge('C', 'B')
-g.add_edge('C', 'A')
-
-g.print()
-
-print(g.vertex_list())
-print(g.edge_list())
-print(g.edges('A'))
-print(g.edges('B'))
-print(g.edges('C'))
-print(g.edges('D'))
\ No newline at end of file
+if __name__ == '__main__':
+    from AdjGraph import AdjGraph
+
+    # jeden z grafů
+    g = LinkedGraph()
+    # g = AdjGraph()
+
+    print(g.has_vertex('A'))
+    print(g.add_vertex('A'))
+    print(g.has_vertex('A'))
+    print(g.add_vertex('A'))
+    print(g.has_vertex('A'))
+    print(g.add_vertex('B'))
+    print()
+
+    print(g.has_edge('A','B'))
+    print(g.add_edge('A','B'))
+    print(g.has_edge('A','B'))
+    print(g.add_edge('A','B'))
+    print(g.has_edge('A','B'))
+    print()
+    print(g.add_edge('B','A'))
+    print(g.add_edge('B','A'))
+
+    g.add_vertex('C')
+    g.add_edge('C', 'B')
+    g.add_edge('C', 'A')
+
+    g.print()
+
+    print(g.vertex_list())
+    print(g.edge_list())
+    print(g.edges('A'))
+    print(g.edges('B'))
+    print(g.edges('C'))
+    print(g.edges('D'))
\ No newline at end of file
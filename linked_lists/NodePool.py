@@ -0,0 +1,61 @@
+from typing import Any, List, Optional
+
+
+class NodePool(object):
+    """
+    Freelist of detached linked list nodes.
+
+    Lists created with a pool hand removed nodes back to it and take nodes
+    from it before allocating new ones, so push/pop churn reuses the same
+    node objects. A pool can be shared by several lists of the same type.
+
+    Attributes:
+        capacity int: Maximum number of nodes kept for reuse.
+        _free (List[Any]): Detached nodes ready for reuse.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initializes an empty pool.
+
+        :param capacity: Maximum number of nodes kept for reuse.
+        :type capacity: int
+        """
+
+        self.capacity: int = capacity
+        self._free: List[Any] = []
+
+    def __len__(self) -> int:
+        """
+        Returns the number of nodes ready for reuse.
+
+        :rtype: int
+        """
+        return len(self._free)
+
+    def acquire(self) -> Optional[Any]:
+        """
+        Takes a node out of the pool.
+
+        :return: A detached node, or None if the pool is empty.
+        :rtype: Optional[Any]
+        """
+        return self._free.pop() if self._free else None
+
+    def release(self, node: Any):
+        """
+        Gives a detached node back to the pool. The caller must have cleared
+        its links and value so the pool does not keep them alive.
+
+        :param node: Node that is no longer part of any list.
+        :type node: Any
+        """
+
+        if len(self._free) < self.capacity:
+            self._free.append(node)
+
+    def clear(self):
+        """
+        Drops all pooled nodes.
+        """
+        self._free.clear()
@@ -1,5 +1,6 @@
-from typing import Optional, TypeVar, Generic, Iterator, Union
+from typing import Optional, TypeVar, Generic, Iterator, Iterable, Union, Dict, Tuple, Callable, Any
 import DataUtils
+from NodePool import NodePool
 
 T = TypeVar('T')
 
@@ -10,9 +11,14 @@ class SingleLinkedList(Generic[T]):
     Attributes:
         _size int: Number of elements in the linked list.
         _head (Optional[LinkedListNode[T]]): refers to the first node of the list.
+        _tail (Optional[LinkedListNode[T]]): refers to the last node of the list.
+        _counts (Optional[Dict[T, int]]): value -> number of nodes holding it, None unless indexed.
+        _pool (Optional[NodePool]): freelist removed nodes are recycled through.
+        _finger_index int: index of the last accessed node, -1 when not cached.
+        _finger_node (Optional[LinkedListNode[T]]): the last accessed node.
     """
 
-    class LinkedListNode(Generic[T]):
+    class LinkedListNode:
         """
         Represents single node in a linked list datastructure.
 
@@ -21,6 +27,8 @@ class SingleLinkedList(Generic[T]):
             nextNode (Optional[LinkedListNode[T]]): Reference to the next node in the list.
         """
 
+        __slots__ = ('item', 'nextNode')
+
         def __init__(self, item_data: T):
             """
             Initializes LinkedListNode in the linked list.
@@ -32,13 +40,159 @@ class SingleLinkedList(Generic[T]):
             self.item: T = item_data
             self.nextNode: Optional['LinkedListNode[T]'] = None
 
-    def __init__(self):
+    class Cursor:
+        """
+        Position inside a linked list that can walk forward and edit around
+        itself in O(1). A cursor must not be used after the list was changed
+        by anything other than the cursor itself.
+
+        Attributes:
+            _list (SingleLinkedList[T]): The list the cursor walks.
+            _node (Optional[LinkedListNode[T]]): Current node, None past the end.
+            _index int: Index of the current node.
+        """
+
+        __slots__ = ('_list', '_node', '_index')
+
+        def __init__(self, linked_list: 'SingleLinkedList[T]',
+                     node: Optional['SingleLinkedList.LinkedListNode'], index: int):
+            """
+            Initializes a cursor on the given node.
+
+            :param linked_list: The list the cursor walks.
+            :type linked_list: SingleLinkedList[T]
+            :param node: Current node, None past the end.
+            :type node: Optional[LinkedListNode[T]]
+            :param index: Index of the current node.
+            :type index: int
+            """
+
+            self._list = linked_list
+            self._node = node
+            self._index = index
+
+        def __bool__(self) -> bool:
+            """
+            Checks if the cursor stands on a node.
+
+            :rtype: bool
+            """
+            return self._node is not None
+
+        @property
+        def index(self) -> int:
+            """
+            Index of the current node.
+
+            :rtype: int
+            """
+            return self._index
+
+        @property
+        def item(self) -> T:
+            """
+            Value of the current node.
+
+            :rtype: T
+            :raises LinkedListException: If the cursor is past the end.
+            """
+            return self._current().item
+
+        @item.setter
+        def item(self, item: T):
+            self._list._replace_item(self._current(), item)
+
+        def next(self) -> bool:
+            """
+            Moves to the next node.
+
+            :return: True if the cursor stands on a node afterwards, otherwise False.
+            :rtype: bool
+            :raises LinkedListException: If the cursor is already past the end.
+            """
+
+            self._node = self._current().nextNode
+            self._index += 1
+            return self._node is not None
+
+        def insert_after(self, item: T):
+            """
+            Inserts a new element right after the current node.
+
+            :param item: Value to be inserted.
+            :type item: T
+            :raises LinkedListException: If the cursor is past the end or item is null.
+            """
+
+            if item is None:
+                raise DataUtils.LinkedListException('Argument None cannot be null.')
+            self._list._insert_after_node(self._current(), self._index, item)
+
+        def remove_next(self) -> T:
+            """
+            Removes the node right after the current one.
+
+            :return: Value of the removed node.
+            :rtype: T
+            :raises LinkedListException: If there is no next node.
+            """
+
+            if self._current().nextNode is None:
+                raise DataUtils.LinkedListException('Cursor has no next node to remove.')
+            return self._list._remove_after_node(self._node, self._index)
+
+        def _current(self) -> 'SingleLinkedList.LinkedListNode':
+            if self._node is None:
+                raise DataUtils.LinkedListException('Cursor is past the end of the list.')
+            return self._node
+
+    def __init__(self, indexed: bool = False, pool: Optional[NodePool] = None,
+                 checked: Optional[bool] = None):
         """
         Initializes empty SingleLinkedList.
+
+        :param indexed: Keep a value -> count index so membership checks are O(1).
+            Stored values must be hashable.
+        :type indexed: bool
+        :param pool: Freelist to recycle removed nodes through.
+        :type pool: Optional[NodePool]
+        :param checked: Validate arguments (checked mode) or bind the undecorated
+            methods (fast mode), modes.checked_mode when None.
+        :type checked: Optional[bool]
         """
 
+        DataUtils.set_checked(self, checked)
+
         self._size: int = 0
         self._head: Optional[LinkedListNode[T]] = None
+        self._tail: Optional[LinkedListNode[T]] = None
+        self._counts: Optional[Dict[T, int]] = {} if indexed else None
+        self._pool: Optional[NodePool] = pool
+        self._finger_index: int = -1
+        self._finger_node: Optional[LinkedListNode[T]] = None
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T], indexed: bool = False,
+                      pool: Optional[NodePool] = None, checked: Optional[bool] = None) -> 'SingleLinkedList[T]':
+        """
+        Builds a linked list from any iterable in a single pass.
+
+        :param iterable: Values to store, in order.
+        :type iterable: Iterable[T]
+        :param indexed: Keep a value -> count index, see __init__.
+        :type indexed: bool
+        :param pool: Freelist to recycle removed nodes through.
+        :type pool: Optional[NodePool]
+        :param checked: Checked or fast mode, see __init__.
+        :type checked: Optional[bool]
+        :return: A new linked list holding the values.
+        :rtype: SingleLinkedList[T]
+        :raises LinkedListException: If any value is null.
+        """
+
+        new_list = cls(indexed=indexed, pool=pool, checked=checked)
+        new_list.extend_from_iterable(iterable)
+        return new_list
 
     def __repr__(self) -> str:
         """
@@ -74,10 +228,13 @@ class SingleLinkedList(Generic[T]):
     def __contains__(self, item: T) -> bool:
         """
         Checks if the given item exists inside of the existing node.
+        Uses the value index when the list is indexed.
 
         :return: True if the item inside of the node exists, otherwise False
         :rtype: bool
         """
+        if self._counts is not None:
+            return item in self._counts
         return self.find_by_value(item) is not None
 
     def __eq__(self, next_linked_list: object) -> bool:
@@ -124,13 +281,7 @@ class SingleLinkedList(Generic[T]):
             return result
         elif isinstance(data, int):
             self._validate_index(data)
- 
-            current = self._head
-
-            for _ in range(data):
-                current = current.nextNode
-
-            return current.item
+            return self._node_at(data).item
         else:
             raise DataUtils.LinkedListException('Expected int or slice.')
 
@@ -147,12 +298,7 @@ class SingleLinkedList(Generic[T]):
         """
 
         self._validate_index(index)
-
-        current = self._head
-
-        for _ in range(index):
-            current = current.nextNode
-        current.item = item
+        self._replace_item(self._node_at(index), item)
 
     def __delitem__(self, index: int):
         """
@@ -185,12 +331,24 @@ class SingleLinkedList(Generic[T]):
         """
 
         self._validate_index(index)
+        return self._node_at(index)
 
-        current = self._head
+    def cursor(self, index: int = 0) -> 'SingleLinkedList.Cursor':
+        """
+        Returns a cursor standing on the node at index.
 
-        for _ in range(index):
-            current = current.nextNode
-        return current
+        :param index: Index of the starting node, 0-len(self), len(self) is past the end.
+        :type index: int
+        :return: Cursor for sequential walking and editing.
+        :rtype: SingleLinkedList.Cursor
+        :raises LinkedListException: If the index is invalid.
+        """
+
+        if index == self._size:
+            return self.Cursor(self, None, index)
+
+        self._validate_index(index)
+        return self.Cursor(self, self._node_at(index), index)
 
     @DataUtils.requires_not_null
     def find_by_value(self, value: T) -> Optional[int]:
@@ -203,6 +361,9 @@ class SingleLinkedList(Generic[T]):
         :rtype: Optional[int]
         """
 
+        if self._counts is not None and value not in self._counts:
+            return None
+
         index = 0
         current = self._head
 
@@ -222,16 +383,16 @@ class SingleLinkedList(Generic[T]):
         :type element: T
         """
 
-        new_node = self.LinkedListNode(element)
+        new_node = self._new_node(element)
 
         if self.is_empty():
             self._head = new_node
         else:
-            current = self._head
-            while current.nextNode:
-                current = current.nextNode
-            current.nextNode = new_node
+            self._tail.nextNode = new_node
+        self._tail = new_node
 
+        if self._counts is not None:
+            self._index_add(element)
         self._size += 1
 
     def insert_at(self, element: T, index: int):
@@ -251,18 +412,17 @@ class SingleLinkedList(Generic[T]):
             self.push_back(element)
             return
 
-        new_node = self.LinkedListNode(element)
-
-        if self.is_empty():
-            self._head = new_node
-        else:
-            current = self._head
+        if index > 0:
+            self._insert_after_node(self._node_at(index - 1), index - 1, element)
+            return
 
-            for _ in range(index - 1):
-                current = current.nextNode
-            new_node.nextNode = current.nextNode
-            current.nextNode = new_node
+        new_node = self._new_node(element)
+        new_node.nextNode = self._head
+        self._head = new_node
+        self._finger_index = -1
 
+        if self._counts is not None:
+            self._index_add(element)
         self._size += 1
 
     @DataUtils.requires_non_empty
@@ -273,18 +433,24 @@ class SingleLinkedList(Generic[T]):
         :raises LinkedListException: If the list is empty.
         """
 
-        pre_node = self._head
+        target = self._tail
+
+        if self._counts is not None:
+            self._index_remove(target.item)
 
         # get index at pre - last index & cut the last node
         if self._size == 1:
-            self._head = None
+            self._head = self._tail = None
+            self._finger_index = -1
         else:
-            pre_node = self._head
-            for _ in range(self._size - 2):
-                pre_node = pre_node.nextNode
+            pre_node = self._node_at(self._size - 2)
             pre_node.nextNode = None
+            self._tail = pre_node
         self._size -= 1
 
+        if self._pool is not None:
+            self._release_node(target)
+
     @DataUtils.requires_non_empty
     def pop_at(self, index: int):
         """
@@ -297,16 +463,23 @@ class SingleLinkedList(Generic[T]):
 
         self._validate_index(index)
 
-        if index == 0:
-            self._head = self._head.nextNode
-        else:
-            prev = self._head
-            for _ in range(index - 1):
-                prev = prev.nextNode
-            target = prev.nextNode
-            prev.nextNode = target.nextNode
+        if index > 0:
+            self._remove_after_node(self._node_at(index - 1), index - 1)
+            return
+
+        target = self._head
+        self._head = target.nextNode
+        if self._head is None:
+            self._tail = None
+        self._finger_index = -1
+
+        if self._counts is not None:
+            self._index_remove(target.item)
         self._size -= 1
 
+        if self._pool is not None:
+            self._release_node(target)
+
     def extend(self, next_linked_list: 'SingleLinkedList[T]'):
         """
         Pushes all elements from another linked list to the end of the current list.
@@ -315,8 +488,202 @@ class SingleLinkedList(Generic[T]):
         :type next_linked_list: SingleLinkedList[T]
         """
 
-        for item in next_linked_list:
-            self.push_back(item)
+        self.extend_from_iterable(next_linked_list)
+
+    def extend_from_iterable(self, iterable: Iterable[T]):
+        """
+        Appends all values of an iterable, linking them in as one chain.
+        The list is left unchanged if a null value is met.
+
+        :param iterable: Values to append, in order.
+        :type iterable: Iterable[T]
+        :raises LinkedListException: If any value is null.
+        """
+
+        head, tail, count = self._build_chain(iterable)
+
+        if head is None:
+            return
+
+        if self._tail is None:
+            self._head = head
+        else:
+            self._tail.nextNode = head
+        self._tail = tail
+        self._size += count
+
+    def insert_many(self, index: int, iterable: Iterable[T]):
+        """
+        Inserts all values of an iterable so that the first one ends up at index.
+
+        :param index: Position of the first inserted value, 0-len(self).
+        :type index: int
+        :param iterable: Values to insert, in order.
+        :type iterable: Iterable[T]
+        :raises LinkedListException: If index is out of range or any value is null.
+        """
+
+        if index == self._size:
+            self.extend_from_iterable(iterable)
+            return
+
+        self._validate_index(index)
+        head, tail, count = self._build_chain(iterable)
+
+        if head is None:
+            return
+
+        self._link_chain(index, head, tail)
+        self._size += count
+
+    def splice(self, index: int, other: 'SingleLinkedList[T]'):
+        """
+        Moves all nodes of another linked list into this one at index.
+        Nodes are relinked, not copied, and the other list is left empty.
+
+        :param index: Position of the first moved value, 0-len(self).
+        :type index: int
+        :param other: Linked list to take the nodes from.
+        :type other: SingleLinkedList[T]
+        :raises LinkedListException: If index is out of range or other is not a distinct linked list.
+        """
+
+        if not isinstance(other, SingleLinkedList) or other is self:
+            raise DataUtils.LinkedListException('Expected another SingleLinkedList to splice.')
+
+        if index != self._size:
+            self._validate_index(index)
+
+        if other.is_empty():
+            return
+
+        head, tail, count = self._take_nodes(other)
+
+        if index == self._size:
+            if self._tail is None:
+                self._head = head
+            else:
+                self._tail.nextNode = head
+            self._tail = tail
+        else:
+            self._link_chain(index, head, tail)
+        self._size += count
+
+    def sort(self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False):
+        """
+        Sorts the list in place with a stable bottom-up merge sort.
+        Nodes are relinked, no node or temporary list is allocated. With a
+        key every item is paired with its key once for the duration of the
+        sort, so key runs once per value like in sorted(). If key or a
+        comparison raises, the list keeps all of its values, partly sorted.
+
+        :param key: Function computing the comparison key of a value.
+        :type key: Optional[Callable[[T], Any]]
+        :param reverse: Sort in descending order, equal values keep their order.
+        :type reverse: bool
+        """
+
+        if self._size < 2:
+            return
+
+        # every key is computed once up front, not on every comparison
+        keyed = key is not None
+        if keyed:
+            self._decorate(self._head, key)
+
+        head = self._head
+        tail = None
+        width = 1
+        failure = None
+
+        while width < self._size and failure is None:
+            current = head
+            head = tail = None
+
+            while current:
+                left = current
+                right = self._split_run(left, width)
+                current = self._split_run(right, width)
+
+                run_head, run_tail, failure = self._merge_runs(left, right, keyed, reverse)
+                if tail is None:
+                    head = run_head
+                else:
+                    tail.nextNode = run_head
+                tail = run_tail
+
+                if failure is not None:
+                    # a comparison failed, the runs not merged yet follow unsorted
+                    tail.nextNode = current
+                    while tail.nextNode:
+                        tail = tail.nextNode
+                    break
+
+            width *= 2
+
+        if keyed:
+            self._undecorate(head)
+        self._head, self._tail = head, tail
+        self._finger_index = -1
+        if failure is not None:
+            raise failure
+
+    def merge_sorted(self, other: 'SingleLinkedList[T]', key: Optional[Callable[[T], Any]] = None,
+                     reverse: bool = False):
+        """
+        Merges another list sorted the same way as this one in linear time.
+        Its nodes are relinked into this list and it is left empty. Equal
+        values of this list stay in front of those of the other. If key or a
+        comparison raises, both lists are left as they were.
+
+        :param other: Sorted linked list to take the nodes from.
+        :type other: SingleLinkedList[T]
+        :param key: Function computing the comparison key both lists are sorted by.
+        :type key: Optional[Callable[[T], Any]]
+        :param reverse: Both lists are sorted in descending order.
+        :type reverse: bool
+        :raises LinkedListException: If other is not a distinct linked list.
+        """
+
+        if not isinstance(other, SingleLinkedList) or other is self:
+            raise DataUtils.LinkedListException('Expected another SingleLinkedList to merge.')
+
+        if other.is_empty():
+            return
+
+        right, right_tail, count = self._take_nodes(other)
+
+        # keys are computed once per value; if key or a comparison fails the
+        # taken nodes are given back to other and both lists stay as they were
+        keyed = key is not None
+        if keyed:
+            self._decorate(self._head, key)
+            try:
+                self._decorate(right, key)
+            except Exception:
+                self._undecorate(self._head)
+                self._give_back(other, right, right_tail, count)
+                raise
+
+        # the nodes of other, to tell them apart again if a comparison fails
+        theirs = set()
+        node = right
+        while node:
+            theirs.add(id(node))
+            node = node.nextNode
+
+        head, tail, failure = self._merge_runs(self._head, right, keyed, reverse)
+        if keyed:
+            self._undecorate(head)
+
+        if failure is not None:
+            self._head, self._tail, right, right_tail = self._unmerge(head, theirs)
+            self._give_back(other, right, right_tail, count)
+            raise failure
+
+        self._head, self._tail = head, tail
+        self._size += count
+        self._finger_index = -1
 
     def copy(self) -> 'SingleLinkedList[T]':
         """
@@ -326,12 +693,9 @@ class SingleLinkedList(Generic[T]):
         :rtype: SingleLinkedList[T]
         """
 
-        new_list = SingleLinkedList[T]()
-
-        for item in self:
-            new_list.push_back(item)
-
-        return new_list
+        # from the plain class, the copy is neither instrumented nor unchecked by inheritance
+        return DataUtils.base_class(self).from_iterable(self, indexed=self._counts is not None, pool=self._pool,
+                                                        checked=DataUtils.is_checked(self))
 
     def reverse(self):
         """
@@ -340,6 +704,8 @@ class SingleLinkedList(Generic[T]):
 
         prev = None
         current = self._head
+        self._tail = current
+        self._finger_index = -1
 
         while current:
             next_node = current.nextNode
@@ -362,8 +728,19 @@ class SingleLinkedList(Generic[T]):
         """
         Removes all elements from the linked list.
         """
-        self._head = None
+        if self._pool is not None:
+            current = self._head
+            while current and len(self._pool) < self._pool.capacity:
+                next_node = current.nextNode
+                self._release_node(current)
+                current = next_node
+
+        self._head = self._tail = None
         self._size = 0
+        self._finger_index = -1
+
+        if self._counts is not None:
+            self._counts.clear()
 
     def to_list(self) -> list[T]:
         """
@@ -385,3 +762,386 @@ class SingleLinkedList(Generic[T]):
 
         if (index >= self._size or index < 0):
             raise DataUtils.LinkedListException(f'Invalid index, expected 0-{self._size}, got {index}')
+
+    def _build_chain(self, iterable: Iterable[T]) -> Tuple[Optional['LinkedListNode[T]'], Optional['LinkedListNode[T]'], int]:
+        """
+        Creates detached nodes for all values and links them to each other.
+        The value index is only updated once the whole chain was built.
+
+        :param iterable: Values for the chain.
+        :type iterable: Iterable[T]
+        :return: First node, last node and number of nodes of the chain.
+        :rtype: Tuple[Optional[LinkedListNode[T]], Optional[LinkedListNode[T]], int]
+        :raises LinkedListException: If any value is null.
+        """
+
+        node_type = self.LinkedListNode if self._pool is None else self._new_node
+        head = tail = None
+        count = 0
+
+        for item in iterable:
+            if item is None:
+                raise DataUtils.LinkedListException('Argument None cannot be null.')
+
+            node = node_type(item)
+            if tail is None:
+                head = node
+            else:
+                tail.nextNode = node
+            tail = node
+            count += 1
+
+        if self._counts is not None:
+            current = head
+            while current:
+                self._index_add(current.item)
+                current = current.nextNode
+
+        return head, tail, count
+
+    def _link_chain(self, index: int, head: 'LinkedListNode[T]', tail: 'LinkedListNode[T]'):
+        """
+        Links a detached chain in front of the node at a valid index.
+
+        :param index: Position the chain head takes, 0-len(self) - 1.
+        :type index: int
+        :param head: First node of the chain.
+        :type head: LinkedListNode[T]
+        :param tail: Last node of the chain.
+        :type tail: LinkedListNode[T]
+        """
+
+        if index == 0:
+            tail.nextNode = self._head
+            self._head = head
+            self._finger_index = -1
+        else:
+            prev = self._node_at(index - 1)
+            tail.nextNode = prev.nextNode
+            prev.nextNode = head
+
+    def _take_nodes(self, other: 'SingleLinkedList[T]') -> Tuple['LinkedListNode[T]', 'LinkedListNode[T]', int]:
+        """
+        Empties a non-empty list and returns its chain, counting its values
+        into this list's index.
+
+        :param other: List to take the nodes from.
+        :type other: SingleLinkedList[T]
+        :return: First node, last node and number of nodes of the chain.
+        :rtype: Tuple[LinkedListNode[T], LinkedListNode[T], int]
+        """
+
+        head, tail, count = other._head, other._tail, other._size
+
+        if self._counts is not None:
+            if other._counts is not None:
+                for item, item_count in other._counts.items():
+                    self._counts[item] = self._counts.get(item, 0) + item_count
+            else:
+                for item in other:
+                    self._index_add(item)
+
+        other._head = other._tail = None
+        other._size = 0
+        other._finger_index = -1
+        if other._counts is not None:
+            other._counts.clear()
+
+        return head, tail, count
+
+    @staticmethod
+    def _split_run(node: Optional['LinkedListNode[T]'], width: int) -> Optional['LinkedListNode[T]']:
+        """
+        Cuts the chain after at most width nodes starting at node.
+
+        :return: Head of the remaining chain.
+        :rtype: Optional[LinkedListNode[T]]
+        """
+
+        for _ in range(width - 1):
+            if node is None:
+                return None
+            node = node.nextNode
+
+        if node is None:
+            return None
+
+        rest = node.nextNode
+        node.nextNode = None
+        return rest
+
+    @staticmethod
+    def _decorate(node: Optional['LinkedListNode[T]'], key: Callable[[T], Any]):
+        """
+        Replaces the item of every node of a chain with a (key, item) pair.
+        If key fails the nodes done so far are restored.
+
+        :param node: Head of the chain.
+        :type node: Optional[LinkedListNode[T]]
+        :param key: Function computing the comparison key of a value.
+        :type key: Callable[[T], Any]
+        """
+
+        head = node
+        try:
+            while node:
+                node.item = (key(node.item), node.item)
+                node = node.nextNode
+        except Exception:
+            SingleLinkedList._undecorate(head, node)
+            raise
+
+    @staticmethod
+    def _undecorate(node: Optional['LinkedListNode[T]'], stop: Optional['LinkedListNode[T]'] = None):
+        """
+        Puts the items of a chain decorated by _decorate back, up to stop.
+        """
+
+        while node is not stop:
+            node.item = node.item[1]
+            node = node.nextNode
+
+    @staticmethod
+    def _merge_runs(left: Optional['LinkedListNode[T]'], right: Optional['LinkedListNode[T]'], keyed: bool,
+                    reverse: bool) -> Tuple['LinkedListNode[T]', 'LinkedListNode[T]', Optional[Exception]]:
+        """
+        Merges two sorted chains, at least one of them non-empty. A right node
+        is only taken when it strictly precedes the left one, which keeps the
+        merge stable. If a comparison raises, the nodes merged so far are
+        followed by the rest of left and then the rest of right, so the
+        caller always gets back one chain holding every node.
+
+        :param keyed: Items are (key, item) pairs from _decorate, compare the keys only.
+        :type keyed: bool
+        :return: First and last node of the merged chain and the exception
+            a comparison raised, None when the merge completed.
+        :rtype: Tuple[LinkedListNode[T], LinkedListNode[T], Optional[Exception]]
+        """
+
+        head = tail = None
+        failure = None
+
+        try:
+            while left and right:
+                if not keyed:
+                    take_right = left.item < right.item if reverse else right.item < left.item
+                elif reverse:
+                    take_right = left.item[0] < right.item[0]
+                else:
+                    take_right = right.item[0] < left.item[0]
+
+                if take_right:
+                    node, right = right, right.nextNode
+                else:
+                    node, left = left, left.nextNode
+
+                if tail is None:
+                    head = node
+                else:
+                    tail.nextNode = node
+                tail = node
+        except Exception as error:
+            failure = error
+
+        for rest in (left, right):
+            if rest is None:
+                continue
+            if tail is None:
+                head = rest
+            else:
+                tail.nextNode = rest
+            tail = rest
+            while tail.nextNode:
+                tail = tail.nextNode
+
+        return head, tail, failure
+
+    @staticmethod
+    def _unmerge(node: 'LinkedListNode[T]', theirs: set) -> Tuple[Optional['LinkedListNode[T]'], ...]:
+        """
+        Splits a chain back into the nodes whose id is in theirs and the
+        others, both in their order in the chain.
+
+        :return: Head and tail of the other nodes, then head and tail of theirs.
+        :rtype: Tuple[Optional[LinkedListNode[T]], ...]
+        """
+
+        ends = [None, None, None, None]
+        while node:
+            next_node = node.nextNode
+            node.nextNode = None
+            side = 2 if id(node) in theirs else 0
+            if ends[side] is None:
+                ends[side] = node
+            else:
+                ends[side + 1].nextNode = node
+            ends[side + 1] = node
+            node = next_node
+        return tuple(ends)
+
+    def _give_back(self, other: 'SingleLinkedList[T]', head: 'LinkedListNode[T]',
+                   tail: 'LinkedListNode[T]', count: int):
+        """
+        Undoes _take_nodes: the chain becomes the content of other again
+        and its values leave this list's index.
+        """
+
+        other._head, other._tail, other._size = head, tail, count
+        node = head
+        while node:
+            if self._counts is not None:
+                self._index_remove(node.item)
+            if other._counts is not None:
+                other._index_add(node.item)
+            node = node.nextNode
+
+    def _node_at(self, index: int) -> 'LinkedListNode[T]':
+        """
+        Returns the node at a valid index and caches it as the finger.
+        The walk starts at the finger when it lies at or before index,
+        otherwise at the head, so forward sequential access is O(1).
+
+        :param index: Valid index of the node.
+        :type index: int
+        :rtype: LinkedListNode[T]
+        """
+
+        if index == self._size - 1:
+            current = self._tail
+        else:
+            finger_index = self._finger_index
+            if 0 <= finger_index <= index:
+                current = self._finger_node
+                steps = index - finger_index
+            else:
+                current = self._head
+                steps = index
+
+            for _ in range(steps):
+                current = current.nextNode
+
+        self._finger_index = index
+        self._finger_node = current
+        return current
+
+    def _insert_after_node(self, prev: 'LinkedListNode[T]', prev_index: int, element: T):
+        """
+        Links a new node for element right after prev.
+
+        :param prev: Node the new one follows.
+        :type prev: LinkedListNode[T]
+        :param prev_index: Index of prev.
+        :type prev_index: int
+        :param element: Value to be inserted.
+        :type element: T
+        """
+
+        new_node = self._new_node(element)
+        new_node.nextNode = prev.nextNode
+        prev.nextNode = new_node
+
+        if prev is self._tail:
+            self._tail = new_node
+        if self._finger_index > prev_index:
+            self._finger_index = -1
+
+        if self._counts is not None:
+            self._index_add(element)
+        self._size += 1
+
+    def _remove_after_node(self, prev: 'LinkedListNode[T]', prev_index: int) -> T:
+        """
+        Unlinks the node right after prev.
+
+        :param prev: Node in front of the removed one.
+        :type prev: LinkedListNode[T]
+        :param prev_index: Index of prev.
+        :type prev_index: int
+        :return: Value of the removed node.
+        :rtype: T
+        """
+
+        target = prev.nextNode
+        prev.nextNode = target.nextNode
+
+        if target is self._tail:
+            self._tail = prev
+        if self._finger_index > prev_index:
+            self._finger_index = -1
+
+        item = target.item
+        if self._counts is not None:
+            self._index_remove(item)
+        self._size -= 1
+
+        if self._pool is not None:
+            self._release_node(target)
+        return item
+
+    def _replace_item(self, node: 'LinkedListNode[T]', item: T):
+        """
+        Stores a new value in a node, keeping the value index in sync.
+
+        :param node: Node of this list.
+        :type node: LinkedListNode[T]
+        :param item: New value.
+        :type item: T
+        """
+
+        if self._counts is not None:
+            self._index_remove(node.item)
+            self._index_add(item)
+        node.item = item
+
+    def _new_node(self, item: T) -> 'LinkedListNode[T]':
+        """
+        Creates a detached node, reusing a pooled one when available.
+
+        :param item: Value of the node.
+        :type item: T
+        :rtype: LinkedListNode[T]
+        """
+
+        node = self._pool.acquire() if self._pool is not None else None
+
+        if node is None:
+            return self.LinkedListNode(item)
+
+        node.item = item
+        return node
+
+    def _release_node(self, node: 'LinkedListNode[T]'):
+        """
+        Clears a removed node and hands it to the pool.
+
+        :param node: Node that was unlinked from the list.
+        :type node: LinkedListNode[T]
+        """
+
+        node.item = None
+        node.nextNode = None
+        self._pool.release(node)
+
+    def _index_add(self, item: T):
+        """
+        Counts one more node holding item in the value index.
+
+        :param item: Value that was stored.
+        :type item: T
+        """
+
+        self._counts[item] = self._counts.get(item, 0) + 1
+
+    def _index_remove(self, item: T):
+        """
+        Counts one node less holding item, dropping values that reach zero.
+
+        :param item: Value that was removed.
+        :type item: T
+        """
+
+        remaining = self._counts[item] - 1
+        if remaining:
+            self._counts[item] = remaining
+        else:
+            del self._counts[item]
@@ -0,0 +1,261 @@
+"""
+Traversals over any AbstractGraph, all iterative so deep graphs never hit
+the recursion limit.
+
+Backends that intern their labels can expose an integer view: a labels
+list, an index dict and successor_ids(vertex_id) returning the ids of the
+successors. Traversals then run on int frontiers with bytearray visited
+flags. Other graphs are read through neighbors(); the whole graph algorithms
+build the int view once per call.
+"""
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+from collections import deque
+
+from Abstract import AbstractGraph, Label
+import DataUtils
+
+IndexedView = Tuple[List[Label], Dict[Label, int], Callable[[int], Iterable[int]]]
+
+
+def _has_ids(graph: AbstractGraph) -> bool:
+    return hasattr(graph, 'successor_ids')
+
+
+def _indexed(graph: AbstractGraph) -> IndexedView:
+    """
+    Returns the labels, label -> id index and successor function of the
+    integer view, built from neighbors() when the backend has none.
+    """
+
+    if _has_ids(graph):
+        return graph.labels, graph.index, graph.successor_ids
+
+    labels = graph.vertex_list()
+    index = {label: vertex_id for vertex_id, label in enumerate(labels)}
+    successors = [[index[dst] for dst in graph.neighbors(label)] for label in labels]
+    return labels, index, successors.__getitem__
+
+
+def _start_id(graph: AbstractGraph, start: Label) -> int:
+    vertex_id = graph.index.get(start)
+    if vertex_id is None:
+        raise DataUtils.LinkedListException(f'Vertex {start} does not exist.')
+    return vertex_id
+
+
+def bfs(graph: AbstractGraph, start: Label) -> Iterator[Label]:
+    """
+    Yields the vertices reachable from start in breadth first order.
+
+    :param graph: Graph to traverse.
+    :type graph: AbstractGraph
+    :param start: First vertex.
+    :type start: Label
+    :rtype: Iterator[Label]
+    """
+
+    if _has_ids(graph):
+        labels, successor_ids = graph.labels, graph.successor_ids
+        start_id = _start_id(graph, start)
+
+        seen = bytearray(len(labels))
+        seen[start_id] = 1
+        frontier = deque([start_id])
+        while frontier:
+            node = frontier.popleft()
+            yield labels[node]
+            for successor in successor_ids(node):
+                if not seen[successor]:
+                    seen[successor] = 1
+                    frontier.append(successor)
+        return
+
+    if not graph.has_vertex(start):
+        raise DataUtils.LinkedListException(f'Vertex {start} does not exist.')
+
+    visited = {start}
+    queue = deque([start])
+    while queue:
+        label = queue.popleft()
+        yield label
+        for successor in graph.neighbors(label):
+            if successor not in visited:
+                visited.add(successor)
+                queue.append(successor)
+
+
+def dfs(graph: AbstractGraph, start: Label) -> Iterator[Label]:
+    """
+    Yields the vertices reachable from start in depth first preorder, the
+    same order a recursive walk over the successors would produce.
+
+    :param graph: Graph to traverse.
+    :type graph: AbstractGraph
+    :param start: First vertex.
+    :type start: Label
+    :rtype: Iterator[Label]
+    """
+
+    if _has_ids(graph):
+        labels, successor_ids = graph.labels, graph.successor_ids
+        start_id = _start_id(graph, start)
+
+        seen = bytearray(len(labels))
+        seen[start_id] = 1
+        yield labels[start_id]
+        # one successor iterator per open vertex replaces the call stack
+        stack = [iter(successor_ids(start_id))]
+        while stack:
+            for successor in stack[-1]:
+                if not seen[successor]:
+                    seen[successor] = 1
+                    yield labels[successor]
+                    stack.append(iter(successor_ids(successor)))
+                    break
+            else:
+                stack.pop()
+        return
+
+    if not graph.has_vertex(start):
+        raise DataUtils.LinkedListException(f'Vertex {start} does not exist.')
+
+    visited = {start}
+    yield start
+    pending = [iter(graph.neighbors(start))]
+    while pending:
+        for successor in pending[-1]:
+            if successor not in visited:
+                visited.add(successor)
+                yield successor
+                pending.append(iter(graph.neighbors(successor)))
+                break
+        else:
+            pending.pop()
+
+
+def topological_sort(graph: AbstractGraph) -> List[Label]:
+    """
+    Orders the vertices so that every edge points forward (Kahn's
+    algorithm). Vertices without incoming edges are taken in vertex order.
+
+    :param graph: Directed acyclic graph.
+    :type graph: AbstractGraph
+    :rtype: List[Label]
+    :raises LinkedListException: If the graph has a cycle.
+    """
+
+    labels, _, successor_ids = _indexed(graph)
+
+    in_degree = [0] * len(labels)
+    for node in range(len(labels)):
+        for successor in successor_ids(node):
+            in_degree[successor] += 1
+
+    ready = deque(node for node, degree in enumerate(in_degree) if degree == 0)
+    order: List[int] = []
+    while ready:
+        node = ready.popleft()
+        order.append(node)
+        for successor in successor_ids(node):
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                ready.append(successor)
+
+    if len(order) < len(labels):
+        raise DataUtils.LinkedListException('Graph has a cycle, it has no topological order.')
+    return [labels[node] for node in order]
+
+
+def strongly_connected_components(graph: AbstractGraph) -> List[List[Label]]:
+    """
+    Finds the strongly connected components with Tarjan's algorithm, run
+    on an explicit stack. Components come out in reverse topological order
+    of the condensed graph.
+
+    :param graph: Directed graph.
+    :type graph: AbstractGraph
+    :rtype: List[List[Label]]
+    """
+
+    labels, _, successor_ids = _indexed(graph)
+    size = len(labels)
+
+    order = [-1] * size
+    low = [0] * size
+    on_stack = bytearray(size)
+    stack: List[int] = []
+    components: List[List[Label]] = []
+    counter = 0
+
+    for root in range(size):
+        if order[root] != -1:
+            continue
+
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(successor_ids(root)))]
+
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if order[successor] == -1:
+                    order[successor] = low[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    on_stack[successor] = 1
+                    work.append((successor, iter(successor_ids(successor))))
+                    break
+                if on_stack[successor] and order[successor] < low[node]:
+                    low[node] = order[successor]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+
+                if low[node] == order[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(labels[member])
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def connected_components(graph: AbstractGraph) -> List[List[Label]]:
+    """
+    Finds the weakly connected components, edge direction ignored, with a
+    union-find over the edges. Components and their members are listed in
+    vertex order.
+
+    :param graph: Graph to split.
+    :type graph: AbstractGraph
+    :rtype: List[List[Label]]
+    """
+
+    labels, _, successor_ids = _indexed(graph)
+    parent = list(range(len(labels)))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for node in range(len(labels)):
+        for successor in successor_ids(node):
+            first, second = find(node), find(successor)
+            if first != second:
+                parent[max(first, second)] = min(first, second)
+
+    groups: Dict[int, List[Label]] = {}
+    for node, label in enumerate(labels):
+        groups.setdefault(find(node), []).append(label)
+    return list(groups.values())
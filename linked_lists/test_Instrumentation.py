@@ -0,0 +1,67 @@
+import pickle
+import unittest
+
+from SingleLinkedList import SingleLinkedList
+from LinkedGraph import LinkedGraph
+import DataUtils
+import Instrumentation
+
+
+class PickleTest(unittest.TestCase):
+    def round_trip(self, instance):
+        Instrumentation.instrument(instance)
+        loaded = pickle.loads(pickle.dumps(instance))
+        self.assertFalse(Instrumentation.is_instrumented(loaded))
+        self.assertIs(type(loaded), DataUtils.base_class(instance) if DataUtils.is_checked(instance)
+                      else DataUtils.unchecked(DataUtils.base_class(instance)))
+        for name in ('_metrics', '_metrics_name', '_visited'):
+            self.assertFalse(hasattr(loaded, name))
+        return loaded
+
+    def test_checked_list(self):
+        loaded = self.round_trip(SingleLinkedList.from_iterable([3, 1, 2]))
+        self.assertTrue(DataUtils.is_checked(loaded))
+        self.assertEqual(loaded.to_list(), [3, 1, 2])
+
+    def test_unchecked_list(self):
+        loaded = self.round_trip(SingleLinkedList.from_iterable([3, 1, 2], checked=False))
+        self.assertFalse(DataUtils.is_checked(loaded))
+        loaded.push_back(4)
+        self.assertEqual(loaded.to_list(), [3, 1, 2, 4])
+
+    def test_graph(self):
+        graph = LinkedGraph()
+        graph.add_vertex('a')
+        graph.add_vertex('b')
+        graph.add_edge('a', 'b')
+        loaded = self.round_trip(graph)
+        self.assertEqual(loaded.edge_list(), [('a', 'b')])
+
+    def test_instance_keeps_counting_after_pickling(self):
+        linked_list = SingleLinkedList.from_iterable([1, 2])
+        metrics = Instrumentation.instrument(linked_list)
+        pickle.dumps(linked_list)
+        linked_list.push_back(3)
+        self.assertEqual(metrics.snapshot()['SingleLinkedList']['push_back']['calls'], 1)
+
+
+class CheckedModeTest(unittest.TestCase):
+    def test_set_checked_keeps_counting(self):
+        graph = LinkedGraph()
+        metrics = Instrumentation.instrument(graph)
+        DataUtils.set_checked(graph, False)
+        graph.add_vertex('a')
+        self.assertIs(Instrumentation.metrics_of(graph), metrics)
+        self.assertFalse(DataUtils.is_checked(graph))
+        self.assertEqual(metrics.snapshot()['LinkedGraph']['add_vertex']['calls'], 1)
+
+    def test_copy_of_instrumented_list_is_plain(self):
+        linked_list = SingleLinkedList.from_iterable([2, 1])
+        Instrumentation.instrument(linked_list)
+        copied = linked_list.copy()
+        self.assertIs(type(copied), SingleLinkedList)
+        self.assertEqual(copied.to_list(), [2, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
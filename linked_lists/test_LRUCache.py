@@ -0,0 +1,71 @@
+import unittest
+
+from LRUCache import LRUCache, memoize
+import DataUtils
+
+
+class LRUCacheTest(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        evicted = []
+        cache = LRUCache(capacity=2, on_evict=lambda key, value: evicted.append(key))
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache['a'], 1)
+        cache['c'] = 3
+        self.assertEqual(evicted, ['b'])
+        self.assertNotIn('b', cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_max_bytes(self):
+        cache = LRUCache(capacity=None, max_bytes=10, sizeof=lambda value: value)
+        cache.put('a', 4)
+        cache.put('b', 4)
+        cache.put('c', 4)
+        self.assertEqual(list(key for key in 'abc' if key in cache), ['b', 'c'])
+        cache.put('d', 11)
+        self.assertNotIn('d', cache)
+        self.assertEqual(cache.stats()['bytes'], 8)
+
+    def test_pop_and_clear_keep_counters(self):
+        cache = LRUCache()
+        cache['a'] = 1
+        cache.get('missing')
+        self.assertEqual(cache.pop('a'), 1)
+        with self.assertRaises(KeyError):
+            del cache['a']
+        cache['b'] = 2
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_capacity_must_be_positive(self):
+        with self.assertRaises(DataUtils.LinkedListException):
+            LRUCache(capacity=0)
+
+
+class MemoizeTest(unittest.TestCase):
+    def test_keyword_and_positional_keys_differ(self):
+        @memoize()
+        def arguments(*args, **kwargs):
+            return args, kwargs
+
+        # keyword call first, then positional arguments that look like its key
+        self.assertEqual(arguments(1, a=1), ((1,), {'a': 1}))
+        self.assertEqual(arguments((1,), (('a', 1),)), (((1,), (('a', 1),)), {}))
+        self.assertEqual(arguments.cache.stats()['misses'], 2)
+
+    def test_hits(self):
+        calls = []
+
+        @memoize(capacity=1)
+        def square(value):
+            calls.append(value)
+            return value * value
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(calls, [3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from LinkedGraph import GraphStorage, LinkedGraph
+from CompactGraph import CompactGraph
+import DataUtils
+
+
+class CreateTest(unittest.TestCase):
+    def test_engines(self):
+        self.assertIs(type(GraphStorage.create()), LinkedGraph)
+        self.assertIs(type(GraphStorage.create('compact')), CompactGraph)
+        self.assertIsInstance(LinkedGraph(), LinkedGraph)
+
+    def test_options_reach_the_engine(self):
+        for storage in ('nodes', 'compact'):
+            graph = GraphStorage.create(storage, checked=False, reverse_index=True)
+            self.assertFalse(DataUtils.is_checked(graph))
+            self.assertTrue(graph.has_reverse_index())
+
+    def test_unknown_storage(self):
+        with self.assertRaises(DataUtils.LinkedListException):
+            GraphStorage.create('matrix')
+
+
+class PredecessorsTest(unittest.TestCase):
+    def test_view_follows_the_first_in_edge(self):
+        for storage in ('nodes', 'compact'):
+            graph = GraphStorage.create(storage, reverse_index=True)
+            graph.add_vertex(1)
+            graph.add_vertex(2)
+            predecessors = graph.predecessors(1)
+            graph.add_edge(2, 1)
+            self.assertEqual(list(predecessors), [2])
+            self.assertEqual(graph.in_degree(1), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+from SingleLinkedList import SingleLinkedList
+
+
+class SortRollbackTest(unittest.TestCase):
+    def assertIntact(self, linked_list: SingleLinkedList, values: list):
+        self.assertEqual(len(linked_list), len(values))
+        self.assertCountEqual(list(linked_list), values)
+        if values:
+            self.assertEqual(linked_list[len(values) - 1], linked_list.to_list()[-1])
+
+    def test_sort_keeps_every_node_when_a_comparison_fails(self):
+        values = [3, 'a', 1, 2, 5, 'b']
+        linked_list = SingleLinkedList.from_iterable(values)
+        with self.assertRaises(TypeError):
+            linked_list.sort()
+        self.assertIntact(linked_list, values)
+
+        linked_list.push_back(7)
+        self.assertEqual(linked_list.to_list()[-1], 7)
+
+    def test_keyed_sort_undecorates_when_a_comparison_fails(self):
+        values = [3, 'a', 1, 2, 5, 'b']
+        linked_list = SingleLinkedList.from_iterable(values)
+        with self.assertRaises(TypeError):
+            linked_list.sort(key=lambda value: value)
+        self.assertIntact(linked_list, values)
+
+    def test_sort_still_sorts(self):
+        linked_list = SingleLinkedList.from_iterable([5, 1, 4, 2, 3])
+        linked_list.sort(key=lambda value: -value)
+        self.assertEqual(linked_list.to_list(), [5, 4, 3, 2, 1])
+
+    def test_merge_sorted_gives_nodes_back_when_a_comparison_fails(self):
+        linked_list = SingleLinkedList.from_iterable([1, 3, 5], indexed=True)
+        other = SingleLinkedList.from_iterable([2, 'x', 6], indexed=True)
+        with self.assertRaises(TypeError):
+            linked_list.merge_sorted(other)
+        self.assertEqual(linked_list.to_list(), [1, 3, 5])
+        self.assertEqual(other.to_list(), [2, 'x', 6])
+        self.assertNotIn('x', linked_list)
+        self.assertIn('x', other)
+        self.assertEqual(len(other), 3)
+
+    def test_keyed_merge_sorted_gives_nodes_back_when_key_fails(self):
+        linked_list = SingleLinkedList.from_iterable([1, 3])
+        other = SingleLinkedList.from_iterable([2, 'x'])
+        with self.assertRaises(TypeError):
+            linked_list.merge_sorted(other, key=lambda value: value + 0)
+        self.assertEqual(linked_list.to_list(), [1, 3])
+        self.assertEqual(other.to_list(), [2, 'x'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Checked and fast mode, shared by the linked_lists and dijkstra packages.
+
+A class takes part by marking the wrappers of its argument validators
+with __validator__ = True and calling set_checked in __init__. Fast mode
+switches an instance to a subclass, built once per class, that binds the
+undecorated methods. The subclass has no importable name, so its
+instances pickle as the checked class and switch back to fast mode when
+loaded. Variants layered on top of a mode, like the counters, keep the
+class they wrap as _plain_class and rebuild themselves over the other
+mode through _wrap_class.
+"""
+from typing import Any, Dict, Optional
+
+# mode of instances created without an explicit checked argument, in both packages
+checked_mode: bool = True
+
+
+def set_checked_mode(enabled: bool):
+    """
+    Sets the mode of instances created from now on without an explicit
+    checked argument.
+
+    :param enabled: True for checked mode, False for fast mode.
+    :type enabled: bool
+    """
+    global checked_mode
+    checked_mode = enabled
+
+
+def unchecked(cls: type) -> type:
+    """
+    Returns a subclass of cls whose methods are the undecorated originals of
+    every validator. The subclass is created once per class. Invalid
+    arguments are not reported in that mode but fail wherever the method
+    body happens to break.
+
+    :param cls: Class with validated methods.
+    :type cls: type
+    :rtype: type
+    """
+
+    variant = cls.__dict__.get('_unchecked_class')
+    if variant is not None:
+        return variant
+
+    namespace: Dict[str, Any] = {
+        '_checked_class': cls, '__module__': cls.__module__, '__reduce_ex__': _reduce_unchecked
+    }
+    for klass in cls.__mro__:
+        for name, attribute in vars(klass).items():
+            if name in namespace or getattr(cls, name, None) is not attribute:
+                continue
+
+            stripped = attribute
+            while getattr(stripped, '__validator__', False):
+                stripped = stripped.__wrapped__
+            if stripped is not attribute:
+                namespace[name] = stripped
+
+    variant = type(cls.__name__, (cls,), namespace)
+    variant.__qualname__ = f'{cls.__qualname__}[unchecked]'
+    variant._unchecked_class = variant
+    cls._unchecked_class = variant
+    return variant
+
+
+def _reduce_unchecked(instance: Any, protocol: int) -> tuple:
+    # pickled by reference to the checked class, load_unchecked restores the mode
+    return load_unchecked, (type(instance)._checked_class,), instance.__getstate__()
+
+
+def load_unchecked(cls: type) -> Any:
+    """
+    Creates an empty fast mode instance of cls for pickle to fill in.
+
+    :param cls: Checked class.
+    :type cls: type
+    :rtype: Any
+    """
+    instance = cls.__new__(cls)
+    instance.__class__ = unchecked(cls)
+    return instance
+
+
+def set_checked(instance: Any, checked: Optional[bool] = None):
+    """
+    Switches an instance between checked mode, keeping the validators, and
+    fast mode, binding the undecorated methods.
+
+    :param instance: Instance of a class using the validators.
+    :type instance: Any
+    :param checked: Requested mode, the global checked_mode when None.
+    :type checked: Optional[bool]
+    """
+
+    if checked is None:
+        checked = checked_mode
+
+    base = base_class(instance)
+    target = base if checked else unchecked(base)
+    wrap = type(instance).__dict__.get('_wrap_class')
+    instance.__class__ = target if wrap is None else wrap(target)
+
+
+def base_class(instance: Any) -> type:
+    """
+    Returns the checked class of an instance without any of the variants
+    it may run as, the class to create new instances from.
+
+    :param instance: Instance of a class using the validators.
+    :type instance: Any
+    :rtype: type
+    """
+
+    cls = type(instance)
+    plain = cls.__dict__.get('_plain_class', cls)
+    return plain.__dict__.get('_checked_class', plain)
+
+
+def is_checked(instance: Any) -> bool:
+    """
+    Checks if an instance runs in checked mode.
+
+    :rtype: bool
+    """
+    return '_checked_class' not in type(instance).__dict__
+
@@ -0,0 +1,63 @@
+import pickle
+import unittest
+from functools import wraps
+from typing import Any, Optional
+
+import modes
+
+
+def validated(function):
+    @wraps(function)
+    def wrapper(*args):
+        if None in args:
+            raise ValueError('null argument')
+        return function(*args)
+    wrapper.__validator__ = True
+    return wrapper
+
+
+class Sample(object):
+    def __init__(self, checked: Optional[bool] = None):
+        modes.set_checked(self, checked)
+        self.items = []
+
+    @validated
+    def add(self, item: Any):
+        self.items.append(item)
+
+
+class ModesTest(unittest.TestCase):
+    def test_fast_mode_skips_validators(self):
+        sample = Sample(checked=False)
+        sample.add(None)
+        self.assertEqual(sample.items, [None])
+        with self.assertRaises(ValueError):
+            Sample().add(None)
+
+    def test_fast_mode_pickles(self):
+        fast = Sample(checked=False)
+        fast.add(1)
+        loaded = pickle.loads(pickle.dumps(fast))
+        self.assertFalse(modes.is_checked(loaded))
+        self.assertEqual(loaded.items, [1])
+        loaded.add(None)
+
+    def test_checked_mode_pickles(self):
+        self.assertTrue(modes.is_checked(pickle.loads(pickle.dumps(Sample()))))
+
+    def test_switching_back_and_base_class(self):
+        sample = Sample(checked=False)
+        self.assertIs(modes.base_class(sample), Sample)
+        modes.set_checked(sample, True)
+        self.assertIs(type(sample), Sample)
+
+    def test_global_mode(self):
+        modes.set_checked_mode(False)
+        try:
+            self.assertFalse(modes.is_checked(Sample()))
+        finally:
+            modes.set_checked_mode(True)
+
+
+if __name__ == '__main__':
+    unittest.main()